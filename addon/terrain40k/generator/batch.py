@@ -0,0 +1,138 @@
+"""
+Batch wall generation in background Blender processes.
+
+Walls share no data, but bpy is single-threaded, so a terrain set of N
+segments is built one CSG chain after another.  generate_walls_batch()
+deals the walls round-robin to one `blender --background` worker per CPU;
+each worker starts once, builds its whole share (reusing the session-wide
+templates and result cache between walls) and exports the parts as STL.
+The calling session imports each share's STLs as soon as its worker
+exits, so the objects look like a normal generate.
+
+Worker protocol:
+    stdin   JSON list of params dicts (same keys as generate_wall_segment)
+    argv    -- <output directory>
+    output  <k>/<part name>.stl per returned object of the k-th params
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bpy
+
+# Directory holding the addon package, and the package's import name
+_ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ADDON_PKG = os.path.basename(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_WORKER_EXPR = (
+    "import sys; sys.path.insert(0, {root!r}); "
+    "from {pkg}.generator.batch import worker_main; worker_main()"
+)
+
+
+def generate_walls_batch(params_list, workers=None):
+    """
+    Generate one wall segment per params dict in parallel worker processes.
+    Returns a list of object lists, in the same order as params_list.
+    Raises RuntimeError if a worker fails.
+    """
+    if not params_list:
+        return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(params_list)))
+
+    # Round-robin keeps neighbouring (similar-cost) walls on different workers
+    shares = [list(range(k, len(params_list), workers)) for k in range(workers)]
+
+    with tempfile.TemporaryDirectory(prefix="terrain40k_") as tmp:
+        results = [None] * len(params_list)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Threads only wait on subprocesses — bpy is never touched there
+            futures = {
+                pool.submit(
+                    _run_worker, [params_list[i] for i in share], os.path.join(tmp, f"w{k:02d}")
+                ): share
+                for k, share in enumerate(shares)
+            }
+            # Import on the main thread as each share lands, while the
+            # slower workers are still building
+            for fut in as_completed(futures):
+                share_dir = fut.result()
+                for k, i in enumerate(futures[fut]):
+                    results[i] = _import_parts(os.path.join(share_dir, f"{k:03d}"))
+        return results
+
+
+def _run_worker(params_share, out_dir):
+    os.makedirs(out_dir)
+    cmd = [
+        bpy.app.binary_path,
+        "--background",
+        "--factory-startup",
+        "--python-exit-code",
+        "1",
+        "--python-expr",
+        _WORKER_EXPR.format(root=_ADDON_ROOT, pkg=_ADDON_PKG),
+        "--",
+        out_dir,
+    ]
+    proc = subprocess.run(cmd, input=json.dumps(params_share), text=True, capture_output=True)
+    if proc.returncode != 0:
+        seeds = [p.get("seed") for p in params_share]
+        raise RuntimeError(
+            f"Wall worker failed (seeds {seeds}):\n{proc.stderr.strip() or proc.stdout.strip()}"
+        )
+    return out_dir
+
+
+def _import_parts(out_dir):
+    # Deselect only what is selected (no select_all operator walking the
+    # scene); afterwards only the last import is selected
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+    parts = []
+    for fname in sorted(os.listdir(out_dir)):
+        if not fname.endswith(".stl"):
+            continue
+        path = os.path.join(out_dir, fname)
+        if hasattr(bpy.ops.wm, "stl_import"):  # Blender 4.1+
+            bpy.ops.wm.stl_import(filepath=path)
+        else:
+            bpy.ops.import_mesh.stl(filepath=path)
+        obj = bpy.context.selected_objects[0]
+        obj.name = os.path.splitext(fname)[0]
+        # Same tag as the Generate operator, so auto_clear removes it too
+        obj["terrain40k"] = True
+        obj.select_set(False)
+        parts.append(obj)
+    return parts
+
+
+def worker_main():
+    """Entry point inside a background worker — see module docstring."""
+    from .wall_segment import generate_wall_segment
+
+    out_dir = sys.argv[sys.argv.index("--") + 1]
+    share = json.loads(sys.stdin.read())
+
+    # Deselect once; each part is then selected only for its own export
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+    for k, params in enumerate(share):
+        wall_dir = os.path.join(out_dir, f"{k:03d}")
+        os.makedirs(wall_dir)
+        parts = generate_wall_segment(params)
+        for obj in parts:
+            obj.select_set(True)
+            path = os.path.join(wall_dir, obj.name + ".stl")
+            if hasattr(bpy.ops.wm, "stl_export"):  # Blender 4.1+
+                bpy.ops.wm.stl_export(filepath=path, export_selected_objects=True)
+            else:
+                bpy.ops.export_mesh.stl(filepath=path, use_selection=True)
+            obj.select_set(False)
+        # The next wall reuses these part names — free them first
+        for obj in parts:
+            bpy.data.objects.remove(obj, do_unlink=True)
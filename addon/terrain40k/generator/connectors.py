@@ -4,14 +4,14 @@ Supports pins, magnet seats, or both.
 All dimensions in mm.
 """
 
-import bpy
 import math
 from mathutils import Vector
 from ..utils.mesh import (
     create_cylinder_object,
     create_box_object,
-    boolean_union,
-    boolean_difference,
+    boolean_chain,
+    boolean_union_many,
+    boolean_difference_many,
 )
 
 
@@ -22,6 +22,7 @@ DEFAULT_PIN_TOLERANCE = 0.25  # per side for female
 DEFAULT_MAGNET_DIAMETER = 5.0
 DEFAULT_MAGNET_HEIGHT = 2.0
 DEFAULT_MAGNET_TOLERANCE = 0.15
+QUARTER_TURN = math.radians(90)     # side holes: Z cylinder turned into X
 
 
 def _get_edge_positions(obj, edge='BOTTOM', count=2, inset=8.0):
@@ -56,27 +57,14 @@ def _get_edge_positions(obj, edge='BOTTOM', count=2, inset=8.0):
 def add_pin_male(target_obj, positions, pin_radius=DEFAULT_PIN_RADIUS,
                  pin_height=DEFAULT_PIN_HEIGHT):
     """Add protruding pin connectors (male) at specified positions."""
-    for pos in positions:
-        pin = create_cylinder_object(
-            pin_radius, pin_height, segments=12,
-            location=(pos.x, pos.y, pos.z),
-            name="_pin_male"
-        )
-        boolean_union(target_obj, pin, remove_other=True)
+    boolean_union_many(target_obj, _male_pins(positions, pin_radius, pin_height))
 
 
 def add_pin_female(target_obj, positions, pin_radius=DEFAULT_PIN_RADIUS,
                    pin_height=DEFAULT_PIN_HEIGHT, tolerance=DEFAULT_PIN_TOLERANCE):
     """Cut pin holes (female) at specified positions."""
-    hole_radius = pin_radius + tolerance
-    hole_depth = pin_height + 0.5  # slightly deeper for easy insertion
-    for pos in positions:
-        hole = create_cylinder_object(
-            hole_radius, hole_depth, segments=12,
-            location=(pos.x, pos.y, pos.z - 0.3),
-            name="_pin_hole"
-        )
-        boolean_difference(target_obj, hole, remove_cutter=True)
+    boolean_difference_many(target_obj,
+                            _pin_holes(positions, pin_radius, pin_height, tolerance))
 
 
 def add_magnet_seats(target_obj, positions,
@@ -87,15 +75,40 @@ def add_magnet_seats(target_obj, positions,
     Cut cylindrical pockets for magnets at specified positions.
     Pocket is cut into the surface (boolean difference).
     """
+    boolean_difference_many(target_obj,
+                            _magnet_pockets(positions, magnet_diameter,
+                                            magnet_height, tolerance))
+
+
+# Operand builders — the add_* functions above and add_connectors batch
+# their output into one boolean instead of one per connector.
+
+def _male_pins(positions, pin_radius, pin_height):
+    return [create_cylinder_object(
+                pin_radius, pin_height, segments=12,
+                location=(pos.x, pos.y, pos.z),
+                name="_pin_male")
+            for pos in positions]
+
+
+def _pin_holes(positions, pin_radius, pin_height, tolerance):
+    hole_radius = pin_radius + tolerance
+    hole_depth = pin_height + 0.5  # slightly deeper for easy insertion
+    return [create_cylinder_object(
+                hole_radius, hole_depth, segments=12,
+                location=(pos.x, pos.y, pos.z - 0.3),
+                name="_pin_hole")
+            for pos in positions]
+
+
+def _magnet_pockets(positions, magnet_diameter, magnet_height, tolerance):
     pocket_radius = (magnet_diameter / 2.0) + tolerance
     pocket_depth = magnet_height + 0.3  # slight extra depth
-    for pos in positions:
-        pocket = create_cylinder_object(
-            pocket_radius, pocket_depth, segments=16,
-            location=(pos.x, pos.y, pos.z - 0.1),
-            name="_magnet_pocket"
-        )
-        boolean_difference(target_obj, pocket, remove_cutter=True)
+    return [create_cylinder_object(
+                pocket_radius, pocket_depth, segments=16,
+                location=(pos.x, pos.y, pos.z - 0.1),
+                name="_magnet_pocket")
+            for pos in positions]
 
 
 def add_connectors(target_obj, connector_type, positions=None,
@@ -113,21 +126,28 @@ def add_connectors(target_obj, connector_type, positions=None,
     if positions is None:
         count = 2
         positions = _get_edge_positions(target_obj, edge='BOTTOM', count=count)
+    # Every pin and pocket goes into one modifier stack: a union step for
+    # male pins, then a single difference for all holes and pockets.
+    pins, cuts = [], []
     if connector_type in ('PINS', 'BOTH'):
         if is_male_side:
-            add_pin_male(target_obj, positions, pin_radius, pin_height)
+            pins = _male_pins(positions, pin_radius, pin_height)
         else:
-            add_pin_female(target_obj, positions, pin_radius, pin_height,
-                           pin_tolerance)
+            cuts += _pin_holes(positions, pin_radius, pin_height, pin_tolerance)
     if connector_type in ('MAGNETS', 'BOTH'):
         # Magnet seats are always female (recessed pockets)
         mag_positions = positions
         if connector_type == 'BOTH':
-            # Offset magnet positions slightly from pin positions
-            mag_positions = [p + Vector((0, 0, -pin_height - 2)) for p in positions]
+            # Separate inset so magnets don't collide with the pins
             mag_positions = _get_edge_positions(target_obj, edge='BOTTOM', count=2,
                                                 inset=15.0)
-        add_magnet_seats(target_obj, mag_positions, magnet_diameter, magnet_height)
+        cuts += _magnet_pockets(mag_positions, magnet_diameter, magnet_height,
+                                DEFAULT_MAGNET_TOLERANCE)
+    # Pins and pockets may share positions, so the cut can self-intersect
+    boolean_chain(target_obj, [
+        ('UNION',      pins, 'EXACT', False),
+        ('DIFFERENCE', cuts, 'EXACT', True),
+    ])
 
 
 # ── Ground Floor Wall connectors ─────────────────────────────────────────────
@@ -176,9 +196,15 @@ def add_ground_wall_connectors(obj, w, h, t,
     # Reason: cornice cross-section (t + p_pillar + p_rear ≈ 6.3 mm) is too shallow
     # for a Ø4.85 mm pin with ≥ 1 mm wall on all sides (needs ≥ 6.85 mm).
     # Three magnets keep the top connection simple and within wall-thickness rules.
-    _cut_top_hole(obj, min_co.x + butt_w / 2,     cy_top, top_z, mag_r, mag_d, "_top_mag_l")
-    _cut_top_hole(obj, (min_co.x + max_co.x) / 2, cy_top, top_z, mag_r, mag_d, "_top_mag_c")
-    _cut_top_hole(obj, max_co.x - butt_w / 2,     cy_top, top_z, mag_r, mag_d, "_top_mag_r")
+    # Bosses and holes are only collected here and applied as one modifier
+    # stack at the end: bosses union first, then every hole and panel
+    # recess in one difference (the top holes stay clear of the bosses).
+    bosses = []
+    cuts   = [
+        _top_hole(min_co.x + butt_w / 2,     cy_top, top_z, mag_r, mag_d, "_top_mag_l"),
+        _top_hole((min_co.x + max_co.x) / 2, cy_top, top_z, mag_r, mag_d, "_top_mag_c"),
+        _top_hole(max_co.x - butt_w / 2,     cy_top, top_z, mag_r, mag_d, "_top_mag_r"),
+    ]
 
     # ── LEFT / RIGHT EDGES ────────────────────────────────────────────────
     # Reinforcement boss: extends the buttress delta_y mm further in –Y so
@@ -210,7 +236,7 @@ def add_ground_wall_connectors(obj, w, h, t,
             location=(boss_cx, cy_side, boss_z0),
             name=f"_side_boss_{sfx}",
         )
-        boolean_union(obj, boss)
+        bosses.append(boss)
 
         # Gothic pilaster styling — matches internal pilasters in wall_segment.py
         # Base and cap protrude extra_y mm beyond the boss front face.
@@ -226,7 +252,7 @@ def add_ground_wall_connectors(obj, w, h, t,
             location=(boss_cx, cy_side - extra_y / 2, boss_z0),
             name=f"_boss_base_{sfx}",
         )
-        boolean_union(obj, base_b)
+        bosses.append(base_b)
 
         cap_b = create_box_object(
             butt_w, cap_h_b, boss_d + extra_y,
@@ -234,7 +260,7 @@ def add_ground_wall_connectors(obj, w, h, t,
                       boss_z0 + boss_zh - cap_h_b),
             name=f"_boss_cap_{sfx}",
         )
-        boolean_union(obj, cap_b)
+        bosses.append(cap_b)
 
         # Recessed panel on shaft face (1 mm groove into front_y surface)
         shaft_h_b = boss_zh - base_h_b - cap_h_b
@@ -250,28 +276,35 @@ def add_ground_wall_connectors(obj, w, h, t,
                           boss_z0 + base_h_b + pan_m),
                 name=f"_boss_panel_{sfx}",
             )
-            boolean_difference(obj, cutter)
+            cuts.append(cutter)
 
         # Three horizontal holes drilled from the end face
-        _cut_side_hole(obj, face_x, cy_side, hz_bot, mag_r,  mag_d,  side, "_side_mag_bot")
-        _cut_side_hole(obj, face_x, cy_side, hz_mid, lego_r, lego_d, side, "_side_lego")
-        _cut_side_hole(obj, face_x, cy_side, hz_top, mag_r,  mag_d,  side, "_side_mag_top")
-
-
-def _cut_top_hole(obj, cx, cy, top_z, radius, depth, name):
-    """Drill a downward cylindrical hole (–Z) from the top face."""
-    cyl = create_cylinder_object(
+        cuts += [
+            _side_hole(face_x, cy_side, hz_bot, mag_r,  mag_d,  side, "_side_mag_bot"),
+            _side_hole(face_x, cy_side, hz_mid, lego_r, lego_d, side, "_side_lego"),
+            _side_hole(face_x, cy_side, hz_top, mag_r,  mag_d,  side, "_side_mag_top"),
+        ]
+
+    # Base and cap sit inside their boss, so the union self-intersects
+    boolean_chain(obj, [
+        ('UNION',      bosses, 'EXACT', True),
+        ('DIFFERENCE', cuts,   'EXACT', False),
+    ])
+
+
+def _top_hole(cx, cy, top_z, radius, depth, name):
+    """Cutter for a downward cylindrical hole (–Z) from the top face."""
+    return create_cylinder_object(
         radius, depth + 0.5,
         segments=16,
         location=(cx, cy, top_z - depth),
         name=name,
     )
-    boolean_difference(obj, cyl, remove_cutter=True)
 
 
-def _cut_side_hole(obj, face_x, cy, cz, radius, depth, side, name):
+def _side_hole(face_x, cy, cz, radius, depth, side, name):
     """
-    Drill a horizontal cylindrical hole from a wall end face (X direction).
+    Cutter for a horizontal cylindrical hole from a wall end face (X direction).
     side: –1 = left face (drill in +X), +1 = right face (drill in –X).
 
     Cylinder is created along Z then rotated 90° around Y.
@@ -286,8 +319,5 @@ def _cut_side_hole(obj, face_x, cy, cz, radius, depth, side, name):
         location=(-cz, cy, oz),
         name=name,
     )
-    cyl.rotation_euler.y = math.radians(90)
-    bpy.context.view_layer.objects.active = cyl
-    cyl.select_set(True)
-    bpy.ops.object.transform_apply(rotation=True)
-    boolean_difference(obj, cyl, remove_cutter=True)
+    cyl.rotation_euler.y = QUARTER_TURN       # the boolean reads the transform
+    return cyl
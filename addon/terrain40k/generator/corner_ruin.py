@@ -4,15 +4,19 @@ Two wall segments meeting at 90 degrees, forming an L-shaped ruin.
 Full Sector Imperialis details: stone blocks, pilasters, skulls, arch frames.
 """
 
-import bpy
+import bmesh
 import math
-import random
+import numpy as np
 from mathutils import Vector
 from ..utils.mesh import (
+    create_box_bmesh,
     create_box_object,
-    boolean_union,
-    boolean_difference,
+    boolean_chain,
     cleanup_mesh,
+    csg_engine,
+    delete_object,
+    link_instance,
+    world_bounds,
 )
 from .gothic_details import (
     create_gothic_arch_cutter,
@@ -21,18 +25,35 @@ from .gothic_details import (
     create_pilaster,
     create_skull_relief,
     add_stone_block_lines,
-    add_panel_lines,
+    arch_segment_count,
+    panel_line_cutter,
 )
 from .connectors import add_connectors
 from .damage import apply_damage
 from .splitter import should_split, split_for_print
+from .result_cache import cached_parts, dict_key, quantize_params
+
+# Wing B runs along +Y: its parts are wing A parts turned a quarter about Z
+QUARTER_TURN = math.radians(90)
 
 
 def generate_corner_ruin(params):
     """
     Generate an L-shaped corner ruin with full Imperial Gothic details.
     Details visible from gothic_style/detail_level 1 upward.
+    Repeat calls with the same params are served from the result cache.
     """
+    params = quantize_params(params)
+
+    def build():
+        with csg_engine(params.get('csg_engine')):
+            return _build_corner_ruin(params)
+
+    return cached_parts(dict_key('CORNER', params), build)
+
+
+def _build_corner_ruin(params):
+    """Uncached body of generate_corner_ruin."""
     w = params.get('width', 80.0)
     h = params.get('height', 70.0)
     d = params.get('depth', None) or w
@@ -45,8 +66,6 @@ def generate_corner_ruin(params):
     connector = params.get('connector_type', 'NONE')
     split_mode = params.get('split_mode', 'AUTO')
 
-    rng = random.Random(seed)
-
     # --- Wing A: along +X axis ---
     wing_a = create_box_object(
         d, h, t,
@@ -68,12 +87,18 @@ def generate_corner_ruin(params):
         name="_corner_fill"
     )
 
-    # Union all parts
-    boolean_union(wing_a, corner_block)
-    boolean_union(wing_a, wing_b)
     corner = wing_a
     corner.name = "Corner_Ruin"
 
+    # ── CSG batches ──────────────────────────────────────────────────────────
+    # Parts are only collected here and applied below as one modifier stack:
+    #   base_parts — wing B, corner fill, plinths (the shell windows cut into)
+    #   openings   — window cutters
+    #   ornaments  — frames, sills, pilasters, buttresses, skulls
+    base_parts = [corner_block, wing_b]
+    openings   = []
+    ornaments  = []
+
     # --- Base plinth (foundation strip) ---
     plinth_h = max(h * 0.05, 2.5)
     # Plinth along wing A
@@ -82,49 +107,67 @@ def generate_corner_ruin(params):
         location=(d / 2, 0, plinth_h / 2),
         name="_plinth_a"
     )
-    boolean_union(corner, plinth_a)
     # Plinth along wing B
     plinth_b = create_box_object(
         t + 3.0, plinth_h, d + 3.0,
         location=(0, d / 2, plinth_h / 2),
         name="_plinth_b"
     )
-    boolean_union(corner, plinth_b)
+    base_parts += [plinth_a, plinth_b]
 
     # --- Windows in both wings ---
     win_positions_a = []
     win_positions_b = []
     if win_count > 0 and d > 30:
         win_positions_a = _add_wing_windows(
-            corner, d, h, t, win_count, gothic, detail, 'X', rng
+            openings, ornaments, d, h, t, win_count, gothic, detail, 'X'
         )
         win_positions_b = _add_wing_windows(
-            corner, d, h, t, win_count, gothic, detail, 'Y', rng
+            openings, ornaments, d, h, t, win_count, gothic, detail, 'Y'
         )
 
     # --- Pilasters between windows on wing A ---
     if gothic >= 1 and len(win_positions_a) >= 2:
-        _add_wing_pilasters(corner, win_positions_a, h, t, 'X')
+        _add_wing_pilasters(ornaments, win_positions_a, h, t, 'X')
     # --- Pilasters between windows on wing B ---
     if gothic >= 1 and len(win_positions_b) >= 2:
-        _add_wing_pilasters(corner, win_positions_b, h, t, 'Y')
+        _add_wing_pilasters(ornaments, win_positions_b, h, t, 'Y')
 
     # --- Buttresses at wing ends and corner ---
-    _add_corner_buttresses(corner, d, h, t, gothic, rng)
+    _add_corner_buttresses(ornaments, d, h, t, gothic)
 
     # --- Skulls above windows ---
     if gothic >= 2:
-        _add_wing_skulls(corner, win_positions_a, h, t, 'X')
-        _add_wing_skulls(corner, win_positions_b, h, t, 'Y')
+        _add_wing_skulls(ornaments, win_positions_a, h, t, 'X')
+        _add_wing_skulls(ornaments, win_positions_b, h, t, 'Y')
 
     # --- Stone block / panel lines ---
-    if detail >= 2:
-        # Stone blocks are hard on L-shape, use panel lines instead
-        _add_wall_panel_lines(corner, d, h, t, detail)
-    elif detail >= 1:
-        add_panel_lines(corner, direction='HORIZONTAL',
-                        count=max(2, int(h / 20)),
-                        line_width=0.7, line_depth=0.4)
+    # Stone blocks are hard on L-shape, use panel lines instead.  They are
+    # laid out on the bounds of the finished union — the union of every
+    # shell / ornament operand's bounds — and cut in the same stack.
+    panel_lines = []
+    if detail >= 1:
+        count  = max(3, int(h / 12)) if detail >= 2 else max(2, int(h / 20))
+        bounds = [b for b in map(world_bounds, [corner] + base_parts + ornaments)
+                  if b is not None]
+        lines  = panel_line_cutter(
+            Vector(np.min([lo for lo, _ in bounds], axis=0).tolist()),
+            Vector(np.max([hi for _, hi in bounds], axis=0).tolist()),
+            'HORIZONTAL', count, line_width=0.7, line_depth=0.4,
+        )
+        if lines is not None:
+            panel_lines.append(lines)
+
+    # ── Apply the batches ────────────────────────────────────────────────────
+    # Same order as part-by-part: shell → openings → ornament → panel lines.
+    # Base parts and ornaments overlap each other, so those unions
+    # self-intersect.
+    boolean_chain(corner, [
+        ('UNION',      base_parts,  'EXACT', True),
+        ('DIFFERENCE', openings,    'EXACT', False),
+        ('UNION',      ornaments,   'EXACT', True),
+        ('DIFFERENCE', panel_lines, 'EXACT', False),
+    ])
 
     # --- Damage ---
     apply_damage(corner, damage_val, seed)
@@ -137,22 +180,23 @@ def generate_corner_ruin(params):
         magnet_height=params.get('magnet_height', 2.0),
     )
 
-    # --- Cleanup ---
-    cleanup_mesh(corner)
-
-    # --- Split ---
+    # --- Split / cleanup (split_for_print cleans every part it returns) ---
     if split_mode == 'AUTO' and should_split(corner):
         parts = split_for_print(corner)
         for i, p in enumerate(parts):
             p.name = f"Corner_Ruin_{i:02d}"
-            cleanup_mesh(p)
         return parts
 
+    cleanup_mesh(corner)
     return [corner]
 
 
-def _add_wing_windows(corner, wing_len, h, t, count, gothic, detail, axis, rng):
-    """Cut gothic windows into a wing, with frames and sills. Returns positions."""
+def _add_wing_windows(openings, ornaments, wing_len, h, t, count, gothic, detail,
+                      axis):
+    """
+    Collect a wing's gothic window cutters (into openings) and their frames
+    and sills (into ornaments — all sills as one BMesh). Returns positions.
+    """
     # Tall narrow lancet proportions
     win_w = min(wing_len / (count + 1) * 0.4, 18.0)
     win_h = min(h * 0.6, 48.0)
@@ -161,154 +205,142 @@ def _add_wing_windows(corner, wing_len, h, t, count, gothic, detail, axis, rng):
 
     spacing = wing_len / (count + 1)
     positions = []
+    turn = QUARTER_TURN if axis == 'Y' else 0.0
 
-    for i in range(count):
-        pos_along = spacing * (i + 1)
-        cz = h * 0.46
-
-        # Create cutter
-        if gothic > 0:
-            cutter = create_gothic_arch_cutter(
-                win_w, win_h, t + 2.0,
-                segments=max(8, gothic * 4),
-                name=f"_cwin_{axis}_{i}"
-            )
-        else:
-            cutter = create_box_object(
-                win_w, win_h, t + 2.0,
-                location=(0, 0, win_h / 2),
-                name=f"_cwin_{axis}_{i}"
-            )
-
-        if axis == 'X':
-            cutter.location = Vector((pos_along, 0, cz))
-            positions.append((pos_along, cz))
-        else:
-            cutter.location = Vector((0, pos_along, cz))
-            positions.append((pos_along, cz))
-
-        bpy.context.view_layer.objects.active = cutter
-        cutter.select_set(True)
-        bpy.ops.object.transform_apply(location=True)
-
-        if axis == 'Y':
-            cutter.rotation_euler.z = math.radians(90)
-            bpy.ops.object.transform_apply(rotation=True)
-
-        boolean_difference(corner, cutter)
+    # Every window of the wing has the same size: build the cutter and frame
+    # once and place linked duplicates (the booleans honour their transform).
+    segments = arch_segment_count(win_w, max(8, gothic * 4))
+    if gothic > 0:
+        cutter_tpl = create_gothic_arch_cutter(
+            win_w, win_h, t + 2.0, segments=segments,
+            name=f"_cwin_{axis}_tpl", shared=True
+        )
+    else:
+        cutter_tpl = create_box_object(
+            win_w, win_h, t + 2.0,
+            location=(0, 0, win_h / 2),
+            name=f"_cwin_{axis}_tpl"
+        )
+    frame_tpl = None
+    if gothic >= 1 and detail >= 1:
+        frame_tpl = create_arch_frame(
+            win_w, win_h, depth=1.5, frame_thickness=1.5, segments=segments,
+            name=f"_cframe_{axis}_tpl", shared=True
+        )
+    sill_w = win_w + 4.0
+    sill_h = 2.0
+    sill_d = t + 2.0
+    sills  = bmesh.new()
+
+    cz    = h * 0.46
+    along = spacing * np.arange(1, count + 1)
+    for i, pos_along in enumerate(along.tolist()):
+        positions.append((pos_along, cz))
+
+        # The cutter's location is baked before its 90° turn on wing B, so
+        # the turn swings the location about the world origin as well.
+        loc = (pos_along, 0, cz) if axis == 'X' else (-pos_along, 0, cz)
+        cutter = link_instance(cutter_tpl, loc, name=f"_cwin_{axis}_{i}")
+        cutter.rotation_euler.z = turn
+        openings.append(cutter)
 
         # Raised arch frame around window
-        if gothic >= 1 and detail >= 1:
-            frame = create_arch_frame(
-                win_w, win_h, depth=1.5, frame_thickness=1.5,
-                segments=max(8, gothic * 4),
-                name=f"_cframe_{axis}_{i}"
-            )
+        if frame_tpl is not None:
             if axis == 'X':
-                frame.location = Vector((pos_along, -(t / 2 + 0.3), cz))
+                loc = (pos_along, -(t / 2 + 0.3), cz)
             else:
-                frame.location = Vector((-(t / 2 + 0.3), pos_along, cz))
-                frame.rotation_euler.z = math.radians(90)
-            bpy.context.view_layer.objects.active = frame
-            frame.select_set(True)
-            bpy.ops.object.transform_apply(location=True, rotation=True)
-            boolean_union(corner, frame)
+                loc = (-(t / 2 + 0.3), pos_along, cz)
+            frame = link_instance(frame_tpl, loc, name=f"_cframe_{axis}_{i}")
+            frame.rotation_euler.z = turn
+            ornaments.append(frame)
 
         # Window sill
-        sill_w = win_w + 4.0
-        sill_h = 2.0
-        sill_d = t + 2.0
+        sill_z = cz - win_h / 2 - sill_h / 2 + 0.5
         if axis == 'X':
-            sill = create_box_object(
-                sill_w, sill_h, sill_d,
-                location=(pos_along, 0, cz - win_h / 2 - sill_h / 2 + 0.5),
-                name=f"_csill_{axis}_{i}"
-            )
+            create_box_bmesh(sills, sill_w, sill_h, sill_d,
+                             location=(pos_along, 0, sill_z))
         else:
-            sill = create_box_object(
-                sill_d, sill_h, sill_w,
-                location=(0, pos_along, cz - win_h / 2 - sill_h / 2 + 0.5),
-                name=f"_csill_{axis}_{i}"
-            )
-        boolean_union(corner, sill)
+            create_box_bmesh(sills, sill_d, sill_h, sill_w,
+                             location=(0, pos_along, sill_z))
 
+    if sills.verts:
+        ornaments.append(sills)
+    else:
+        sills.free()
+
+    for tpl in (cutter_tpl, frame_tpl):
+        if tpl is not None:
+            delete_object(tpl)
     return positions
 
 
-def _add_wing_pilasters(corner, positions, h, t, axis):
-    """Add pilasters between window positions on a wing."""
+def _add_wing_pilasters(ornaments, positions, h, t, axis):
+    """Collect pilasters between window positions on a wing."""
     pil_w = max(2.5, t * 0.7)
     pil_h = h * 0.82
     pil_d = max(1.5, t * 0.5)
-    for i in range(len(positions) - 1):
-        p1 = positions[i][0]
-        p2 = positions[i + 1][0]
-        mid = (p1 + p2) / 2.0
-        pilaster = create_pilaster(pil_w, pil_h, pil_d, name=f"_cpil_{axis}_{i}")
+    tpl   = create_pilaster(pil_w, pil_h, pil_d, name=f"_cpil_{axis}_tpl", shared=True)
+    xs    = np.array([pos for pos, _ in positions])
+    mids  = (xs[:-1] + xs[1:]) / 2.0                # between neighbouring windows
+    for i, mid in enumerate(mids.tolist()):
         if axis == 'X':
-            pilaster.location = Vector((mid, -(t / 2 + pil_d / 2 - 0.5), 0))
+            loc = (mid, -(t / 2 + pil_d / 2 - 0.5), 0)
         else:
-            pilaster.location = Vector((-(t / 2 + pil_d / 2 - 0.5), mid, 0))
-            pilaster.rotation_euler.z = math.radians(90)
-        bpy.context.view_layer.objects.active = pilaster
-        pilaster.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=True)
-        boolean_union(corner, pilaster)
+            loc = (-(t / 2 + pil_d / 2 - 0.5), mid, 0)
+        pilaster = link_instance(tpl, loc, name=f"_cpil_{axis}_{i}")
+        if axis == 'Y':
+            pilaster.rotation_euler.z = QUARTER_TURN
+        ornaments.append(pilaster)
+    delete_object(tpl)
 
 
-def _add_corner_buttresses(corner, d, h, t, gothic, rng):
-    """Add buttresses at wing ends and inner/outer corner."""
+def _add_corner_buttresses(ornaments, d, h, t, gothic):
+    """Collect buttresses at wing ends and inner/outer corner."""
     butt_w = max(t * 1.8, 6.0)
     butt_h = h * 0.85
     butt_d = max(t * 2.5, 10.0)
 
-    buttress_positions = []
-    # Wing A end (far X)
-    buttress_positions.append((d - butt_w / 2, 0, 0, 'X'))
-    # Wing B end (far Y)
-    buttress_positions.append((0, d - butt_w / 2, math.radians(90), 'Y'))
-
+    buttress_positions = (
+        (d - butt_w / 2, 0, 0, 'X'),                # wing A end (far X)
+        (0, d - butt_w / 2, QUARTER_TURN, 'Y'),     # wing B end (far Y)
+    )
     if gothic >= 2:
         # Outer corner buttress (diagonal)
-        buttress_positions.append((t + butt_w, -(butt_d / 2 - 1), 0, 'X'))
+        buttress_positions += ((t + butt_w, -(butt_d / 2 - 1), 0, 'X'),)
 
+    # All buttresses share one size: one template, linked per position
+    tpl = create_buttress(
+        butt_w, butt_h, butt_d,
+        taper=0.5, name="_cbutt_tpl", shared=True
+    )
     for px, py, rot, axis in buttress_positions:
-        butt = create_buttress(
-            butt_w, butt_h, butt_d,
-            taper=0.5, name="_cbutt"
-        )
         if axis == 'X':
-            butt.location = Vector((px, -(t / 2 + butt_d / 2 - 1.0), 0))
+            loc = (px, -(t / 2 + butt_d / 2 - 1.0), 0)
         else:
-            butt.location = Vector((-(t / 2 + butt_d / 2 - 1.0), px, 0))
-            butt.rotation_euler.z = math.radians(90)
-        bpy.context.view_layer.objects.active = butt
-        butt.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=True)
-        boolean_union(corner, butt)
+            loc = (-(t / 2 + butt_d / 2 - 1.0), px, 0)
+        butt = link_instance(tpl, loc, name="_cbutt")
+        if axis == 'Y':
+            butt.rotation_euler.z = QUARTER_TURN
+        ornaments.append(butt)
+    delete_object(tpl)
 
 
-def _add_wing_skulls(corner, positions, h, t, axis):
-    """Place skulls above windows on a wing."""
+def _add_wing_skulls(ornaments, positions, h, t, axis):
+    """Collect skulls above windows on a wing."""
     skull_w = 6.0
     skull_h = 7.0
+    if not positions:
+        return
+    tpl = create_skull_relief(skull_w, skull_h, depth=1.2,
+                              name=f"_cskull_{axis}_tpl", shared=True)
     for i, (pos, wz) in enumerate(positions):
-        skull = create_skull_relief(skull_w, skull_h, depth=1.2,
-                                    name=f"_cskull_{axis}_{i}")
         skull_z = min(wz + 28.0, h - 5.0)
         if axis == 'X':
-            skull.location = Vector((pos, -(t / 2 + 0.3), skull_z))
+            loc = (pos, -(t / 2 + 0.3), skull_z)
         else:
-            skull.location = Vector((-(t / 2 + 0.3), pos, skull_z))
-            skull.rotation_euler.z = math.radians(90)
-        bpy.context.view_layer.objects.active = skull
-        skull.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=True)
-        boolean_union(corner, skull)
-
-
-def _add_wall_panel_lines(corner, d, h, t, detail):
-    """Add horizontal panel lines to simulate stone courses."""
-    count = max(3, int(h / 12))
-    add_panel_lines(corner, direction='HORIZONTAL', count=count,
-                    line_width=0.7, line_depth=0.4)
+            loc = (-(t / 2 + 0.3), pos, skull_z)
+        skull = link_instance(tpl, loc, name=f"_cskull_{axis}_{i}")
+        if axis == 'Y':
+            skull.rotation_euler.z = QUARTER_TURN
+        ornaments.append(skull)
+    delete_object(tpl)
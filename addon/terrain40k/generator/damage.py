@@ -11,31 +11,95 @@ intensity (0.0–1.0) scales the amount within the chosen state.
 All damage via boolean operations → watertight output.
 """
 
-import bpy
 import math
 import random
-from mathutils import Vector
+from dataclasses import dataclass
+import numpy as np
+from mathutils import Euler, Vector
 from ..utils.mesh import (
-    create_box_object,
+    create_box_object_fast,
     create_cylinder_object,
-    boolean_difference,
+    boolean_difference_many,
 )
 
+# Holes are cylinders turned from Z into the wall's Y axis
+QUARTER_TURN = math.radians(90)
 
-def apply_damage(obj, state='CLEAN', intensity=0.5, seed=42):
+
+@dataclass(frozen=True, slots=True)
+class DamageCut:
+    """
+    One damage cutter, turned about the world origin by the XYZ euler rot:
+        'BOX'  size = (width, height, depth), X/Y centred on loc, Z loc.z up
+        'CYL'  size = (radius, height, segments), axis Z from loc.z up
+    """
+    kind: str
+    size: tuple
+    loc:  tuple
+    rot:  tuple
+    name: str
+
+
+def apply_damage(obj, state='CLEAN', intensity=0.5, seed=42, cuts=None):
     """
     state:     'CLEAN' | 'DAMAGED' | 'RUINED' | 'HALF'
     intensity: 0.0–1.0, scales damage within the state.
+    cuts:      result of plan_damage for obj's bounds, if already computed.
+    """
+    if cuts is None:
+        mn, mx, _, _ = _bb(obj)
+        cuts = plan_damage(state, intensity, seed, mn, mx)
+    # Subtracting the cuts one by one equals subtracting their union, so all
+    # of them go in ONE boolean (self-intersecting: cutters overlap freely)
+    boolean_difference_many(obj, [_cutter(cut) for cut in cuts], self_intersect=True)
+
+
+def plan_damage(state, intensity, seed, mn, mx):
+    """
+    The DamageCuts apply_damage makes on a piece with local bounds mn–mx,
+    in cutting order.  Touches no bpy, so a generator can plan the damage
+    before building the ornament the cutters would remove anyway.
+
+    Values are drawn from random.Random(seed) in a fixed order, so a seed
+    always gives the same ruin.  A plan draws a few dozen values at most;
+    keep it on random.Random — another generator would re-roll every
+    saved seed for no measurable gain.
     """
     rng = random.Random(seed)
-    if state == 'CLEAN':
-        return
-    elif state == 'DAMAGED':
-        _apply_damaged(obj, intensity, rng)
+    mn, mx = Vector(mn), Vector(mx)
+    sz, cy = mx - mn, (mn.y + mx.y) / 2.0
+    if state == 'DAMAGED':
+        return _plan_damaged(mn, mx, sz, cy, intensity, rng)
     elif state == 'RUINED':
-        _apply_ruined(obj, intensity, rng)
+        return _plan_ruined(mn, mx, sz, cy, intensity, rng)
     elif state == 'HALF':
-        _apply_half(obj, intensity, rng)
+        return _plan_half(mn, mx, sz, cy, intensity, rng)
+    return []
+
+
+def damage_removes(cuts, lo, hi):
+    """
+    True if one of cuts swallows the whole box lo–hi, i.e. anything inside
+    it would be cut away completely.  Cylinders are tested against their
+    inscribed radius, so the answer is conservative.
+    """
+    corners = np.array([(x, y, z) for x in (lo[0], hi[0])
+                                  for y in (lo[1], hi[1])
+                                  for z in (lo[2], hi[2])])
+    for cut in cuts:
+        # Into the cutter's unturned frame: q = R⁻¹·p (row vectors: p·R)
+        q = corners @ np.array(Euler(cut.rot).to_matrix()) - cut.loc
+        a, b, c = cut.size
+        if not np.all((q[:, 2] >= 0.0) & (q[:, 2] <= b)):
+            continue
+        if cut.kind == 'BOX':
+            inside = (np.abs(q[:, 0]) <= a / 2) & (np.abs(q[:, 1]) <= c / 2)
+        else:
+            r_in   = a * math.cos(math.pi / c)
+            inside = np.hypot(q[:, 0], q[:, 1]) <= r_in
+        if np.all(inside):
+            return True
+    return False
 
 
 # ── helpers ────────────────────────────────────────────────────────────────
@@ -48,11 +112,30 @@ def _bb(obj):
     return mn, mx, mx - mn, (mn.y + mx.y) / 2.0
 
 
-def _xfm(obj):
-    """Apply rotation transform to obj."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.transform_apply(rotation=True)
+def _cutter(cut):
+    """Cutter object for one DamageCut."""
+    if cut.kind == 'BOX':
+        c = create_box_object_fast(*cut.size, location=cut.loc, name=cut.name)
+        c.rotation_euler = cut.rot
+        _turn_about_origin(c)
+    else:
+        r, height, segments = cut.size
+        c = create_cylinder_object(r, height, segments=segments,
+                                   location=cut.loc, name=cut.name)
+        # The location is already in the mesh, so the turn is about the
+        # world origin as the box cutters' is — the boolean reads it off
+        # the transform, no bake needed.
+        c.rotation_euler = cut.rot
+    return c
+
+
+def _turn_about_origin(obj):
+    """
+    Box cutters are placed at their location and then turned about the
+    world origin.  On a shared unit-cube instance that is a transform, not
+    a mesh edit: rotate the location along with the object.
+    """
+    obj.location = obj.rotation_euler.to_matrix() @ obj.location
 
 
 # ── CLEAN ──────────────────────────────────────────────────────────────────
@@ -61,12 +144,12 @@ def _xfm(obj):
 
 # ── DAMAGED ────────────────────────────────────────────────────────────────
 
-def _apply_damaged(obj, intensity, rng):
+def _plan_damaged(mn, mx, sz, cy, intensity, rng):
     """
     Cracks, chips, bullet holes, mini-breaks at top.
     intensity 0→1 scales frequency and severity.
     """
-    mn, mx, sz, cy = _bb(obj)
+    cuts = []
 
     # Bullet holes (always present)
     n_holes = max(1, round(1 + intensity * 5))
@@ -75,14 +158,10 @@ def _apply_damaged(obj, intensity, rng):
         d = rng.uniform(sz.y * 0.5, sz.y + 2.0)
         cx = rng.uniform(mn.x + 4, mx.x - 4)
         cz = rng.uniform(mn.z + 5, mx.z - 8)
-        h = create_cylinder_object(r, d, segments=8,
-                                   location=(cx, mn.y - 0.5, cz),
-                                   name=f"_hole{i}")
-        h.rotation_euler.x = math.radians(90)
-        h.rotation_euler.y = rng.uniform(-0.25, 0.25)
-        h.rotation_euler.z = rng.uniform(-0.25, 0.25)
-        _xfm(h)
-        boolean_difference(obj, h)
+        rot_y = rng.uniform(-0.25, 0.25)
+        rot_z = rng.uniform(-0.25, 0.25)
+        cuts.append(DamageCut('CYL', (r, d, 8), (cx, mn.y - 0.5, cz),
+                              (QUARTER_TURN, rot_y, rot_z), f"_hole{i}"))
 
     # Surface chips (biased toward edges)
     n_chips = max(1, round(1 + intensity * 4))
@@ -96,13 +175,10 @@ def _apply_damaged(obj, intensity, rng):
         else:
             cx = rng.uniform(mn.x + cw, mx.x - cw)
         cz = rng.uniform(mn.z, mx.z - ch)
-        c = create_box_object(cw, ch, cd,
-                              location=(cx, mn.y, cz),
-                              name=f"_chip{i}")
-        c.rotation_euler.z = rng.uniform(-0.4, 0.4)
-        c.rotation_euler.x = rng.uniform(-0.2, 0.2)
-        _xfm(c)
-        boolean_difference(obj, c)
+        rot_z = rng.uniform(-0.4, 0.4)
+        rot_x = rng.uniform(-0.2, 0.2)
+        cuts.append(DamageCut('BOX', (cw, ch, cd), (cx, mn.y, cz),
+                              (rot_x, 0.0, rot_z), f"_chip{i}"))
 
     # Cracks – diagonal on wall face, rotate around Y
     if intensity > 0.25:
@@ -113,14 +189,11 @@ def _apply_damaged(obj, intensity, rng):
             cd = rng.uniform(sz.y * 0.5, sz.y + 2.0)
             cx = rng.uniform(mn.x + 5, mx.x - 5)
             cz = rng.uniform(mn.z + ch * 0.1, mx.z - ch)
-            c = create_box_object(cw, ch, cd,
-                                  location=(cx, cy, cz),
-                                  name=f"_crack{i}")
             # Diagonal on XZ wall face
-            c.rotation_euler.y = rng.uniform(0.35, 1.05)
-            c.rotation_euler.z = rng.uniform(-0.15, 0.15)
-            _xfm(c)
-            boolean_difference(obj, c)
+            rot_y = rng.uniform(0.35, 1.05)
+            rot_z = rng.uniform(-0.15, 0.15)
+            cuts.append(DamageCut('BOX', (cw, ch, cd), (cx, cy, cz),
+                                  (0.0, rot_y, rot_z), f"_crack{i}"))
 
     # Mini-breaks at top edge
     if intensity > 0.55:
@@ -130,23 +203,21 @@ def _apply_damaged(obj, intensity, rng):
             bh = rng.uniform(sz.z * 0.04, sz.z * 0.14)
             bd = sz.y + 4.0
             cx = rng.uniform(mn.x + bw, mx.x - bw)
-            c = create_box_object(bw, bh, bd,
-                                  location=(cx, cy, mx.z - bh * 0.6),
-                                  name=f"_minibreak{i}")
-            c.rotation_euler.y = rng.uniform(-0.2, 0.2)
-            c.rotation_euler.z = rng.uniform(-0.15, 0.15)
-            _xfm(c)
-            boolean_difference(obj, c)
+            rot_y = rng.uniform(-0.2, 0.2)
+            rot_z = rng.uniform(-0.15, 0.15)
+            cuts.append(DamageCut('BOX', (bw, bh, bd), (cx, cy, mx.z - bh * 0.6),
+                                  (0.0, rot_y, rot_z), f"_minibreak{i}"))
+    return cuts
 
 
 # ── RUINED ─────────────────────────────────────────────────────────────────
 
-def _apply_ruined(obj, intensity, rng):
+def _plan_ruined(mn, mx, sz, cy, intensity, rng):
     """
     Large holes, major edge breakouts, missing wall segment.
     intensity 0→1 scales severity.
     """
-    mn, mx, sz, cy = _bb(obj)
+    cuts = []
 
     # Large holes through the full wall thickness
     n_holes = max(1, round(1 + intensity * 3))
@@ -155,13 +226,9 @@ def _apply_ruined(obj, intensity, rng):
         safe_w = max(r + 3, sz.x * 0.15)
         cx = rng.uniform(mn.x + safe_w, mx.x - safe_w)
         cz = rng.uniform(mn.z + r + 2, mx.z - r - 4)
-        h = create_cylinder_object(r, sz.y + 6.0, segments=12,
-                                   location=(cx, mn.y - 0.5, cz),
-                                   name=f"_rhole{i}")
-        h.rotation_euler.x = math.radians(90)
-        h.rotation_euler.y = rng.uniform(-0.15, 0.15)
-        _xfm(h)
-        boolean_difference(obj, h)
+        rot_y = rng.uniform(-0.15, 0.15)
+        cuts.append(DamageCut('CYL', (r, sz.y + 6.0, 12), (cx, mn.y - 0.5, cz),
+                              (QUARTER_TURN, rot_y, 0.0), f"_rhole{i}"))
 
     # Major edge breakouts (top corners)
     if intensity > 0.2:
@@ -173,13 +240,10 @@ def _apply_ruined(obj, intensity, rng):
             side = rng.choice(['left', 'right'])
             cx = (mn.x + bw * 0.35) if side == 'left' else (mx.x - bw * 0.35)
             cz = mx.z - bh * 0.5 + rng.uniform(-bh * 0.3, bh * 0.2)
-            b = create_box_object(bw, bh, bd,
-                                  location=(cx, cy, cz),
-                                  name=f"_rbreak{i}")
-            b.rotation_euler.z = rng.uniform(-0.5, 0.5)
-            b.rotation_euler.x = rng.uniform(-0.2, 0.2)
-            _xfm(b)
-            boolean_difference(obj, b)
+            rot_z = rng.uniform(-0.5, 0.5)
+            rot_x = rng.uniform(-0.2, 0.2)
+            cuts.append(DamageCut('BOX', (bw, bh, bd), (cx, cy, cz),
+                                  (rot_x, 0.0, rot_z), f"_rbreak{i}"))
 
     # Missing wall segment from one edge
     if intensity > 0.55:
@@ -189,23 +253,19 @@ def _apply_ruined(obj, intensity, rng):
         side = rng.choice(['left', 'right'])
         cx = (mn.x + sw * 0.45) if side == 'left' else (mx.x - sw * 0.45)
         sh = sz.z * rng.uniform(0.55, 0.90)
-        s = create_box_object(sw, sh, sd,
-                              location=(cx, cy, mx.z - sh),
-                              name="_rseg")
-        s.rotation_euler.y = rng.uniform(-0.1, 0.1)
-        _xfm(s)
-        boolean_difference(obj, s)
+        rot_y = rng.uniform(-0.1, 0.1)
+        cuts.append(DamageCut('BOX', (sw, sh, sd), (cx, cy, mx.z - sh),
+                              (0.0, rot_y, 0.0), "_rseg"))
+    return cuts
 
 
 # ── HALF ───────────────────────────────────────────────────────────────────
 
-def _apply_half(obj, intensity, rng):
+def _plan_half(mn, mx, sz, cy, intensity, rng):
     """
     Remove 30–60 % of wall with an angled break edge and jagged chunks.
     intensity 0→1 controls how much is removed (30 %→60 %).
     """
-    mn, mx, sz, cy = _bb(obj)
-
     cut_fraction = 0.30 + intensity * 0.30   # 30–60 %
     from_left = rng.choice([True, False])
     break_x = (mn.x + sz.x * cut_fraction) if from_left else (mx.x - sz.x * cut_fraction)
@@ -218,13 +278,8 @@ def _apply_half(obj, intensity, rng):
     # Main cutter – oversized box, rotation creates angled break line in XZ
     big = sz.x + 60.0
     cut_cx = (break_x - big / 2) if from_left else (break_x + big / 2)
-
-    main = create_box_object(big, sz.z + 20.0, sz.y + 20.0,
-                             location=(cut_cx, cy, mn.z - 10.0),
-                             name="_half_main")
-    main.rotation_euler.y = math.radians(angle_deg)
-    _xfm(main)
-    boolean_difference(obj, main)
+    cuts = [DamageCut('BOX', (big, sz.z + 20.0, sz.y + 20.0), (cut_cx, cy, mn.z - 10.0),
+                      (0.0, math.radians(angle_deg), 0.0), "_half_main")]
 
     # Jagged chunks along the break edge
     n_jags = 3 + round(intensity * 4)
@@ -234,10 +289,8 @@ def _apply_half(obj, intensity, rng):
         jd = sz.y + 6.0
         jz = rng.uniform(mn.z, mx.z - jh)
         jx = break_x + rng.uniform(-sz.x * 0.08, sz.x * 0.08)
-        jag = create_box_object(jw, jh, jd,
-                                location=(jx, cy, jz),
-                                name=f"_jag{i}")
-        jag.rotation_euler.z = rng.uniform(-0.55, 0.55)
-        jag.rotation_euler.x = rng.uniform(-0.15, 0.15)
-        _xfm(jag)
-        boolean_difference(obj, jag)
+        rot_z = rng.uniform(-0.55, 0.55)
+        rot_x = rng.uniform(-0.15, 0.15)
+        cuts.append(DamageCut('BOX', (jw, jh, jd), (jx, cy, jz),
+                              (rot_x, 0.0, rot_z), f"_jag{i}"))
+    return cuts
@@ -12,20 +12,42 @@ All dimensions in mm (1 BU = 1 mm).
 import bpy
 import bmesh
 import math
+import numpy as np
 from mathutils import Vector
 from ..utils.mesh import (
     create_box_object,
+    create_box_object_fast,
     create_cylinder_object,
     extrude_profile_to_solid,
     create_box_bmesh,
     create_object_from_bmesh,
     boolean_union,
     boolean_difference,
+    boolean_chain,
+    cached_template,
+    instance_template,
+    shared_template,
 )
 
 
 # ── Gothic Arch ────────────────────────────────────────────────────────────
 
+# Target chord length (mm) of the arch tessellation, and its floor
+ARCH_SEG_LEN      = 2.0
+ARCH_MIN_SEGMENTS = 6
+
+
+def arch_segment_count(width, max_segments):
+    """
+    Arch segments for a lancet of this width: about ARCH_SEG_LEN mm per
+    chord (the two arcs span ≈ 2π/3 · width), at least ARCH_MIN_SEGMENTS,
+    never more than max_segments.  Finer chords don't show on a print but
+    every extra face slows the window booleans down.
+    """
+    n = math.ceil(2 * math.pi / 3 * width / ARCH_SEG_LEN)
+    return min(max(n, ARCH_MIN_SEGMENTS), max_segments)
+
+
 def gothic_arch_profile(width, height, segments=12):
     """
     Generate 2D profile points (x, z) for a gothic pointed arch.
@@ -36,53 +58,64 @@ def gothic_arch_profile(width, height, segments=12):
     # Lower rectangular portion (~50% of height)
     rect_h = height * 0.50
     arch_h = height - rect_h
-    points = []
-    points.append((-hw, 0))
-    points.append((-hw, rect_h))
     # Pointed arch: each arc centered at the opposite base corner
     # Radius = full width for equilateral pointed arch
     radius = width
     n = max(segments // 2, 4)
+    t = np.arange(1, n + 1) / n
     # Left arc: center at (hw, rect_h), sweeps from (-hw, rect_h) to peak
     start_angle = math.atan2(0, -width)  # = pi
     peak_y = arch_h
     peak_angle = math.atan2(peak_y, -hw)
-    for i in range(1, n + 1):
-        t = i / n
-        angle = start_angle + t * (peak_angle - start_angle)
-        x = hw + radius * math.cos(angle)
-        z = rect_h + radius * math.sin(angle)
-        # Clamp z to not exceed height
-        z = min(z, height)
-        points.append((x, z))
+    left = start_angle + t * (peak_angle - start_angle)
     # Right arc: center at (-hw, rect_h), sweeps from peak to (hw, rect_h)
     peak_angle_r = math.atan2(peak_y, hw)
     end_angle = 0.0
-    for i in range(1, n):
-        t = i / n
-        angle = peak_angle_r + t * (end_angle - peak_angle_r)
-        x = -hw + radius * math.cos(angle)
-        z = rect_h + radius * math.sin(angle)
-        z = min(z, height)
-        points.append((x, z))
+    right = peak_angle_r + t[:-1] * (end_angle - peak_angle_r)
+    # Both arcs in one vectorised pass; z clamped to not exceed height
+    angles  = np.concatenate((left, right))
+    centres = np.concatenate((np.full(n, hw), np.full(n - 1, -hw)))
+    xs = centres + radius * np.cos(angles)
+    zs = np.minimum(rect_h + radius * np.sin(angles), height)
+
+    points = [(-hw, 0), (-hw, rect_h)]
+    points.extend(zip(xs.tolist(), zs.tolist()))
     points.append((hw, rect_h))
     points.append((hw, 0))
     return points
 
 
-def create_gothic_arch_cutter(width, height, depth, segments=12, name="ArchCutter"):
-    """Create a solid gothic arch shape for boolean cutting (windows/doors)."""
+def create_gothic_arch_cutter(width, height, depth, segments=12, name="ArchCutter",
+                              shared=False):
+    """
+    Create a solid gothic arch shape for boolean cutting (windows/doors).
+    shared=True returns an operand-only object on a session-wide mesh
+    (see shared_template) — for templates that are only linked / merged.
+    """
+    place = shared_template if shared else cached_template
+    return place(_build_gothic_arch_cutter,
+                 (width, height, depth, segments), name=name)
+
+
+def _build_gothic_arch_cutter(width, height, depth, segments):
     profile = gothic_arch_profile(width, height, segments)
-    obj = extrude_profile_to_solid(profile, depth, offset_y=0.0, name=name)
-    return obj
+    return extrude_profile_to_solid(profile, depth, offset_y=0.0, name="_arch_tpl")
 
 
 def create_arch_frame(width, height, depth, frame_thickness=1.5,
-                      segments=12, name="ArchFrame"):
+                      segments=12, name="ArchFrame", shared=False):
     """
     Create a raised arch frame / surround for a window opening.
     This is the decorative border that protrudes from the wall around windows.
+    shared: see create_gothic_arch_cutter.
     """
+    place = shared_template if shared else cached_template
+    return place(_build_arch_frame,
+                 (width, height, depth, frame_thickness, segments), name=name)
+
+
+def _build_arch_frame(width, height, depth, frame_thickness, segments):
+    name = "_frame_tpl"
     # Outer arch (larger)
     outer_w = width + frame_thickness * 2
     outer_h = height + frame_thickness
@@ -93,10 +126,8 @@ def create_arch_frame(width, height, depth, frame_thickness=1.5,
     inner = create_gothic_arch_cutter(
         width + 0.2, height + 0.1, depth + 2.0, segments, name=name + "_inner"
     )
+    # The modifier honours the operand transform — no need to bake it
     inner.location.z = -0.05
-    bpy.context.view_layer.objects.active = inner
-    inner.select_set(True)
-    bpy.ops.object.transform_apply(location=True)
     boolean_difference(outer, inner)
     outer.name = name
     return outer
@@ -104,7 +135,7 @@ def create_arch_frame(width, height, depth, frame_thickness=1.5,
 
 # ── Skull Motif ────────────────────────────────────────────────────────────
 
-def create_skull_relief(width=6.0, height=7.0, depth=1.5, name="Skull"):
+def create_skull_relief(width=6.0, height=7.0, depth=1.5, name="Skull", shared=False):
     """
     Imperial skull motif for wall decoration.  FDM-optimized box-based geometry.
 
@@ -114,9 +145,16 @@ def create_skull_relief(width=6.0, height=7.0, depth=1.5, name="Skull"):
         Z from 0 (bottom) to height (top)
         X from −width/2 to +width/2
 
-    Place with:  skull.location = Vector((cx, -(t/2 - overlap), skull_z))
+    Place with:  skull.location = (cx, -(t/2 - overlap), skull_z)
     where overlap ≥ 0.5 mm ensures a solid boolean union with the wall.
+    shared: see create_gothic_arch_cutter.
     """
+    place = shared_template if shared else cached_template
+    return place(_build_skull_relief, (width, height, depth), name=name)
+
+
+def _build_skull_relief(width, height, depth):
+    name = "_skull_tpl"
     if width < 4.0:
         return create_box_object(width, height * 0.8, depth,
                                  location=(0, -depth / 2, 0), name=name)
@@ -139,7 +177,10 @@ def create_skull_relief(width=6.0, height=7.0, depth=1.5, name="Skull"):
         jaw_w, jaw_h, depth * 0.7,
         location=(0, -depth * 0.35, 0), name="_jaw"
     )
-    boolean_union(cranium, jaw)
+
+    # Eyes, nose and tooth gaps are disjoint boxes: collect them and cut all
+    # of them right after the jaw union, in one modifier stack.
+    cutters = []
 
     # ── Eye sockets (rectangular — better at FDM scale) ──────────────────
     eye_w = width  * 0.22
@@ -147,33 +188,34 @@ def create_skull_relief(width=6.0, height=7.0, depth=1.5, name="Skull"):
     eye_x = width  * 0.26
     eye_z = jaw_h  + cranium_h * 0.38
     for side in [-1, 1]:
-        eye = create_box_object(
+        cutters.append(create_box_object_fast(
             eye_w, eye_h, cut_depth,
             location=(side * eye_x, -depth / 2, eye_z), name="_eye"
-        )
-        boolean_difference(cranium, eye)
+        ))
 
     # ── Nose cavity ───────────────────────────────────────────────────────
     nose_w = width  * 0.15
     nose_h = height * 0.13
     nose_z = jaw_h  + cranium_h * 0.08
-    nose = create_box_object(
+    cutters.append(create_box_object_fast(
         nose_w, nose_h, cut_depth,
         location=(0, -depth / 2, nose_z), name="_nose"
-    )
-    boolean_difference(cranium, nose)
+    ))
 
     # ── Tooth gaps (only if skull wide enough for FDM) ───────────────────
     if width >= 7.0:
         tgw = width  * 0.11
         tgh = jaw_h  * 0.38
         for tx in (-width * 0.17, 0.0, width * 0.17):
-            tg = create_box_object(
+            cutters.append(create_box_object_fast(
                 tgw, tgh, cut_depth,
                 location=(tx, -depth * 0.35, 0), name="_tgap"
-            )
-            boolean_difference(cranium, tg)
+            ))
 
+    boolean_chain(cranium, [
+        ('UNION',      [jaw],   'EXACT', False),
+        ('DIFFERENCE', cutters, 'EXACT', False),
+    ])
     cranium.name = name
     return cranium
 
@@ -215,10 +257,7 @@ def create_aquila_relief(width, height, depth=1.2, name="Aquila"):
             width=width * 0.2, height=height * 0.3, depth=depth * 0.6,
             name="_aquila_skull"
         )
-        skull.location = Vector((0, -depth * 0.3, 0))
-        bpy.context.view_layer.objects.active = skull
-        skull.select_set(True)
-        bpy.ops.object.transform_apply(location=True)
+        skull.location = (0.0, -depth * 0.3, 0.0)
         boolean_union(obj, skull)
 
     return obj
@@ -296,12 +335,19 @@ def create_fluted_column(radius, height, flute_count=8, flute_depth=0.6,
 
 # ── Pilaster (Wall-Embedded Half-Column) ──────────────────────────────────
 
-def create_pilaster(width, height, depth, name="Pilaster"):
+def create_pilaster(width, height, depth, name="Pilaster", shared=False):
     """
     Create a pilaster: a flat, wall-embedded decorative column.
     Has a subtle base, shaft, and capital.
     Typical between windows on Sector Imperialis walls.
+    shared: see create_gothic_arch_cutter.
     """
+    place = shared_template if shared else cached_template
+    return place(_build_pilaster, (width, height, depth), name=name)
+
+
+def _build_pilaster(width, height, depth):
+    name = "_pil_tpl"
     base_h = max(height * 0.07, 2.0)
     cap_h = max(height * 0.06, 1.5)
     shaft_h = height - base_h - cap_h
@@ -335,12 +381,19 @@ def create_pilaster(width, height, depth, name="Pilaster"):
 
 # ── Buttress ───────────────────────────────────────────────────────────────
 
-def create_buttress(width, height, depth, taper=0.65, name="Buttress"):
+def create_buttress(width, height, depth, taper=0.65, name="Buttress", shared=False):
     """
     Create a flying buttress / Strebepfeiler.
     Tapers from full width at bottom to taper*width at top.
     Includes a stepped base for authentic gothic look.
+    shared: see create_gothic_arch_cutter.
     """
+    place = shared_template if shared else cached_template
+    return place(_build_buttress, (width, height, depth, taper), name=name)
+
+
+def _build_buttress(width, height, depth, taper):
+    name = "_butt_tpl"
     bm = bmesh.new()
     hw = width / 2.0
     hd = depth / 2.0
@@ -381,7 +434,8 @@ def create_buttress(width, height, depth, taper=0.65, name="Buttress"):
 
 def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
                           line_width=0.8, line_depth=0.5, front_face_y=None,
-                          boss_depth=0.0, texture_depth=0.0):
+                          boss_depth=0.0, texture_depth=0.0,
+                          z_min=None, z_max=None):
     """
     Cut a grid of mortar lines into a wall surface to simulate stone blocks.
     Alternating horizontal courses with staggered vertical joints.
@@ -398,12 +452,26 @@ def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
     texture_depth: if >= 0.25, two shallow horizontal scratches are cut into
         each individual stone face.  All boolean differences — no void risk.
         Gives a rough, hand-dressed stone appearance.  Recommended: 0.3 mm.
+
+    z_min / z_max: limit the grid to this Z range (default: bounding box).
+        Pass the band edges of a wall — bands stand in front of the face, so
+        grooves at the face Y would tunnel through their solid body.
+
+    All cutters (mortar lines + scratches) are collected into one mesh and cut
+    in a single boolean; bosses likewise go in as one union.  A detail-3 wall
+    has well over 100 cutters, and each separate boolean re-solves the whole
+    wall.  The grid is laid out from the initial bounding box only, so the
+    result matches cutting line by line.
     """
     if target_obj is None:
         return
     bb = target_obj.bound_box
     min_co = Vector(bb[0])
     max_co = Vector(bb[6])
+    if z_min is not None:
+        min_co.z = max(min_co.z, z_min)
+    if z_max is not None:
+        max_co.z = min(max_co.z, z_max)
     size = max_co - min_co
 
     # Y centre and total depth of each mortar-line cutter.
@@ -416,6 +484,9 @@ def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
         cut_y     = min_co.y - 0.01                 # legacy: bounding-box front
         cut_depth = line_depth
 
+    cut_bm  = bmesh.new()   # every mortar line / scratch, cut in one boolean
+    boss_bm = bmesh.new()   # every boss, unioned in one boolean
+
     # Horizontal mortar lines — course heights vary per row (authentic ashlar)
     # Real hand-laid stone uses blocks of different heights; this cycle produces
     # a naturalistic pattern without randomness (deterministic = reproducible).
@@ -424,24 +495,20 @@ def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
     z   = min_co.z + block_height * _COURSE_CYCLE[0]
     while z < max_co.z - 2.0:
         ch = block_height * _COURSE_CYCLE[row % len(_COURSE_CYCLE)]
-        cutter = create_box_object(
-            size.x + 2, line_width, cut_depth,
+        create_box_bmesh(
+            cut_bm, size.x + 2, line_width, cut_depth,
             location=(min_co.x + size.x / 2, cut_y, z),
-            name=f"_mortar_h_{row}"
         )
-        boolean_difference(target_obj, cutter)
         # Vertical joints sized to this course's actual block height
         offset    = (block_width / 2.0) if (row % 2 == 1) else 0.0
         x         = min_co.x + offset + block_width
         bh_vert   = ch - line_width
         if bh_vert >= 0.8:                           # FDM minimum
             while x < max_co.x - 2.0:
-                vcutter = create_box_object(
-                    line_width, bh_vert, cut_depth,
+                create_box_bmesh(
+                    cut_bm, line_width, bh_vert, cut_depth,
                     location=(x, cut_y, z - bh_vert / 2),
-                    name=f"_mortar_v_{row}"
                 )
-                boolean_difference(target_obj, vcutter)
                 x += block_width
 
         # Stone face texture — two shallow horizontal scratches per stone block.
@@ -475,12 +542,10 @@ def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
                             # Clamp so scratch stays inside stone face
                             t_z = max(face_z0 + 0.3,
                                       min(face_z0 + face_zh - t_w - 0.3, t_z))
-                            tcut = create_box_object(
-                                stone_sx, t_w, t_cd,
+                            create_box_bmesh(
+                                cut_bm, stone_sx, t_w, t_cd,
                                 location=(stone_cx, t_cy, t_z),
-                                name=f"_tex_{row}_{col}",
                             )
-                            boolean_difference(target_obj, tcut)
                     col += 1
                     bx  += block_width
 
@@ -506,47 +571,70 @@ def add_stone_block_lines(target_obj, block_height=8.0, block_width=12.0,
                     boss_h   = bz_h - 2 * bm
                     if boss_w >= 0.6:
                         boss_cx = (bx + bx_right) / 2
-                        boss = create_box_object(
-                            boss_w, boss_h, boss_yd,
+                        create_box_bmesh(
+                            boss_bm, boss_w, boss_h, boss_yd,
                             location=(boss_cx, boss_cy, bz_start + bm),
-                            name=f"_stone_boss_{row}"
                         )
-                        boolean_union(target_obj, boss)
                     bx += block_width
 
         row += 1
         z += block_height * _COURSE_CYCLE[row % len(_COURSE_CYCLE)]
 
+    # Vertical joints straddle the horizontal lines → overlapping shells
+    if cut_bm.faces:
+        boolean_difference(target_obj, create_object_from_bmesh(cut_bm, "_mortar"),
+                           self_intersect=True)
+    else:
+        cut_bm.free()
+    if boss_bm.faces:
+        boolean_union(target_obj, create_object_from_bmesh(boss_bm, "_stone_boss"))
+    else:
+        boss_bm.free()
+
 
 def add_panel_lines(target_obj, direction='HORIZONTAL', count=3,
                     line_width=0.8, line_depth=0.5):
     """
-    Cut shallow panel lines into a surface using boolean difference.
+    Cut shallow panel lines into a surface using one boolean difference.
     direction: 'HORIZONTAL' or 'VERTICAL'
     """
     if target_obj is None:
         return
     bb = target_obj.bound_box
-    min_co = Vector(bb[0])
-    max_co = Vector(bb[6])
+    bm = panel_line_cutter(Vector(bb[0]), Vector(bb[6]), direction, count,
+                           line_width, line_depth)
+    if bm is None:
+        return
+    # Parallel lines never overlap — a plain joined cutter is enough
+    boolean_difference(target_obj, create_object_from_bmesh(bm, "_panellines"))
+
+
+def panel_line_cutter(min_co, max_co, direction='HORIZONTAL', count=3,
+                      line_width=0.8, line_depth=0.5):
+    """
+    add_panel_lines' cutter for a target with bounds min_co..max_co, as a
+    BMesh (None if empty) — lets a caller cut it in its own boolean batch.
+    """
     size = max_co - min_co
+    bm = bmesh.new()
     for i in range(count):
         t = (i + 1) / (count + 1)
         if direction == 'HORIZONTAL':
             z = min_co.z + size.z * t
-            cutter = create_box_object(
-                size.x + 2, line_width, line_depth,
+            create_box_bmesh(
+                bm, size.x + 2, line_width, line_depth,
                 location=(min_co.x + size.x / 2, min_co.y - 0.01, z),
-                name=f"_panelline_{i}"
             )
         else:
             x = min_co.x + size.x * t
-            cutter = create_box_object(
-                line_width, size.z + 2, line_depth,
+            create_box_bmesh(
+                bm, line_width, size.z + 2, line_depth,
                 location=(x, min_co.y - 0.01, min_co.z + size.z / 2),
-                name=f"_panelline_{i}"
             )
-        boolean_difference(target_obj, cutter)
+    if not bm.faces:
+        bm.free()
+        return None
+    return bm
 
 
 # ── Pillar (Legacy, simple version) ───────────────────────────────────────
@@ -589,17 +677,22 @@ def create_pillar(radius, height, base_width=None, capital_width=None,
 
 # ── Rivets ─────────────────────────────────────────────────────────────────
 
-def add_rivets(target_obj, positions, rivet_radius=0.8, rivet_depth=0.6):
+def add_rivets(target_obj, positions, rivet_radius=0.8, rivet_depth=0.6, solver='EXACT'):
     """
-    Add rivet bumps at specified positions (list of Vector).
+    Add rivet bumps at specified positions ((x, y, z) sequence or (N, 3) array).
     Only added if rivet_radius >= 0.6mm (FDM minimum).
+    All rivets are instanced into one mesh and unioned in a single boolean.
     """
-    if rivet_radius < 0.6:
+    if rivet_radius < 0.6 or not len(positions):
         return
-    for pos in positions:
-        rivet = create_cylinder_object(
-            rivet_radius, rivet_depth, segments=8,
-            location=(pos.x, pos.y - rivet_depth * 0.5, pos.z),
-            name="_rivet"
-        )
-        boolean_union(target_obj, rivet, remove_other=True)
+    # Centre each rivet half a depth in front of its position (one new array;
+    # the caller's positions are never written to)
+    offsets = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+    offsets = offsets - np.float32((0.0, rivet_depth * 0.5, 0.0))
+    rivets = instance_template(_build_rivet, (rivet_radius, rivet_depth),
+                               offsets, name="_rivets")
+    boolean_union(target_obj, rivets, remove_other=True, solver=solver)
+
+
+def _build_rivet(radius, depth):
+    return create_cylinder_object(radius, depth, segments=8, name="_rivet_tpl")
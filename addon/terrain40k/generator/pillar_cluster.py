@@ -3,18 +3,18 @@ Pillar Cluster / Scatter generator for Warhammer 40K terrain.
 Generates groups of gothic pillars with bases, optionally damaged.
 """
 
-import bpy
 import math
 import random
-from mathutils import Vector
 from ..utils.mesh import (
     create_box_object,
-    boolean_union,
+    boolean_union_many,
     cleanup_mesh,
+    csg_engine,
 )
 from .gothic_details import create_pillar, create_fluted_column, create_skull_relief
 from .connectors import add_connectors
 from .damage import apply_damage
+from .result_cache import cached_parts, dict_key, quantize_params
 
 
 def generate_pillar_cluster(params):
@@ -32,9 +32,21 @@ def generate_pillar_cluster(params):
         seed (int): Random seed
         connector_type (str): 'NONE','PINS','MAGNETS','BOTH'
         split_mode (str): 'AUTO','OFF','MANUAL'
+        csg_engine (str): 'BLENDER','MANIFOLD' (see utils.mesh)
 
-    Returns: list of objects
+    Returns: list of objects (repeat params are served from the result cache)
     """
+    params = quantize_params(params)
+
+    def build():
+        with csg_engine(params.get('csg_engine')):
+            return _build_pillar_cluster(params)
+
+    return cached_parts(dict_key('PILLAR', params), build)
+
+
+def _build_pillar_cluster(params):
+    """Uncached body of generate_pillar_cluster."""
     w = params.get('width', 80.0)
     h = params.get('height', 60.0)
     d = params.get('depth', 80.0)
@@ -106,18 +118,14 @@ def generate_pillar_cluster(params):
                 segments=max(8, 8 + gothic * 2),
                 name=f"Pillar_{i}"
             )
-        p.location = Vector((px, py, base_h))
-        bpy.context.view_layer.objects.active = p
-        p.select_set(True)
-        bpy.ops.object.transform_apply(location=True)
+        p.location = (px, py, base_h)
         pillars.append(p)
 
-    # --- Union all pillars with base ---
+    # Pillars, skull and debris are unioned with the base in ONE boolean;
+    # boolean_union_many appends parts that touch nothing as plain shells
     result = base_platform
-    for p in pillars:
-        boolean_union(result, p, remove_other=True)
-
     result.name = "Pillar_Cluster"
+    additions = pillars
 
     # --- Skull decorations on base (gothic 3) ---
     if gothic >= 3 and len(positions_used) >= 2:
@@ -125,15 +133,14 @@ def generate_pillar_cluster(params):
         sx = (positions_used[0][0] + positions_used[1][0]) / 2
         sy = (positions_used[0][1] + positions_used[1][1]) / 2
         skull = create_skull_relief(width=6.0, height=7.0, depth=1.0, name="_pil_skull")
-        skull.location = Vector((sx, sy, base_h + 0.5))
-        bpy.context.view_layer.objects.active = skull
-        skull.select_set(True)
-        bpy.ops.object.transform_apply(location=True)
-        boolean_union(result, skull, remove_other=True)
+        skull.location = (sx, sy, base_h + 0.5)
+        additions.append(skull)
 
     # --- Scatter debris around pillars ---
     if detail >= 1 and damage_val > 0.1:
-        _add_debris(result, w, d, base_h, damage_val, rng)
+        additions += _make_debris(w, d, base_h, damage_val, rng)
+
+    boolean_union_many(result, additions)
 
     # --- Damage ---
     if damage_val > 0.2:
@@ -153,9 +160,10 @@ def generate_pillar_cluster(params):
     return [result]
 
 
-def _add_debris(target, area_w, area_d, base_h, intensity, rng):
-    """Add small debris blocks around the base."""
-    count = max(1, int(intensity * 5))
+def _make_debris(area_w, area_d, base_h, intensity, rng):
+    """Small debris blocks around the base, for the caller to union."""
+    count        = max(1, int(intensity * 5))
+    debris_parts = []
     for i in range(count):
         dw = rng.uniform(2.0, 6.0)
         dh = rng.uniform(1.5, 4.0)
@@ -171,7 +179,5 @@ def _add_debris(target, area_w, area_d, base_h, intensity, rng):
         debris.rotation_euler.x = rng.uniform(-0.3, 0.3)
         debris.rotation_euler.y = rng.uniform(-0.3, 0.3)
         debris.rotation_euler.z = rng.uniform(0, math.pi)
-        bpy.context.view_layer.objects.active = debris
-        debris.select_set(True)
-        bpy.ops.object.transform_apply(location=True, rotation=True)
-        boolean_union(target, debris, remove_other=True)
+        debris_parts.append(debris)
+    return debris_parts
@@ -0,0 +1,101 @@
+"""
+Session cache of finished generator output.
+
+Batch scripts and repeated Generate clicks often rebuild identical pieces.
+Finished part meshes are kept per canonical params key (floats rounded to
+1 µm) and copied on a repeat call, which skips every boolean.  Bump
+CACHE_VERSION whenever a generator's output changes so stale entries can
+never match.
+
+Generators quantize their inputs first (see QUANTA), so scripted params
+that differ only below print resolution build — and hit — the same entry.
+"""
+
+from collections import OrderedDict
+
+import bpy
+
+from ..utils.mesh import delete_object, object_matrix
+
+CACHE_VERSION = 1
+CACHE_SIZE = 16
+
+_CACHE = OrderedDict()
+
+# Decimals kept per float param: 0.1 mm for dimensions, which is below
+# FDM / resin resolution (lossless for a print); 0.01 for fine settings.
+QUANTA = {
+    "width": 1,
+    "height": 1,
+    "depth": 1,
+    "wall_thickness": 1,
+    "mortar_width": 1,
+    "magnet_diameter": 1,
+    "magnet_height": 1,
+    "bevel_width": 2,
+    "pin_tolerance": 2,
+    "damage_intensity": 2,
+}
+
+
+def quantize(name, value):
+    """value rounded to QUANTA[name] decimals; anything else unchanged."""
+    decimals = QUANTA.get(name)
+    if decimals is None or not isinstance(value, float):
+        return value
+    return round(value, decimals)
+
+
+def quantize_params(params):
+    """Copy of a params dict with every float quantized (see QUANTA)."""
+    return {k: quantize(k, v) for k, v in params.items()}
+
+
+def params_key(kind, values):
+    """Hashable key for one generator (kind) and its flat parameter values."""
+    items = tuple(round(v, 3) if isinstance(v, float) else v for v in values)
+    return (CACHE_VERSION, kind, items)
+
+
+def dict_key(kind, params):
+    """params_key for a params dict — key order and float noise don't matter."""
+    return params_key(kind, (x for item in sorted(params.items()) for x in item))
+
+
+def cached_parts(key, build):
+    """
+    Objects for key: copies of the cached part meshes on a hit, otherwise
+    build() — whose returned objects are then cached.
+    """
+    hit = _CACHE.get(key)
+    if hit is not None:
+        parts = []
+        try:
+            for entry in hit:
+                parts.append(_instance_cached_part(*entry))
+            _CACHE.move_to_end(key)
+            return parts
+        except ReferenceError:  # a cached mesh was freed (file reload)
+            # Drop the parts built before the stale entry — build() makes
+            # a full set of its own
+            for obj in parts:
+                delete_object(obj)
+            del _CACHE[key]
+
+    parts = build()
+    _CACHE[key] = [(p.name, p.data.copy(), object_matrix(p).copy()) for p in parts]
+    if len(_CACHE) > CACHE_SIZE:
+        for _, mesh, _ in _CACHE.popitem(last=False)[1]:
+            try:
+                bpy.data.meshes.remove(mesh)
+            except ReferenceError:
+                pass
+    return parts
+
+
+def _instance_cached_part(name, mesh, matrix):
+    """New object with its own copy of a cached part mesh."""
+    obj = bpy.data.objects.new(name, mesh.copy())
+    obj.matrix_basis = matrix
+    bpy.context.collection.objects.link(obj)
+    return obj
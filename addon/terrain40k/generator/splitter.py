@@ -5,8 +5,14 @@ Build volume: 256 x 256 x 256 mm.
 
 import bpy
 import bmesh
+import math
+from itertools import product
 from mathutils import Vector
-from ..utils.mesh import boolean_difference, create_box_object, cleanup_mesh
+from ..utils.mesh import (
+    boolean_difference,
+    create_box_bmesh,
+    cleanup_mesh,
+)
 
 # BambuLab A1 build volume (mm)
 BED_X = 256.0
@@ -33,77 +39,83 @@ def should_split(obj):
     return dims.x > MAX_X or dims.y > MAX_Y or dims.z > MAX_Z
 
 
+def may_exceed_bed(*extents):
+    """
+    Cheap pre-check for should_split from planned extents (mm): False when
+    every one fits the bed, so the finished mesh need not be measured.
+    """
+    return max(extents) > min(MAX_X, MAX_Y, MAX_Z)
+
+
 def split_for_print(obj, bed_x=MAX_X, bed_y=MAX_Y):
     """
     Split an object into segments that fit the print bed.
-    Uses bisection along the longest axis.
-    Returns list of resulting objects.
+    The split grid (nx × ny equal cells) is planned once from the bounding
+    box; every cell is a copy of the object with everything outside the cell
+    removed by a single boolean.  Returns list of resulting objects, each
+    already run through cleanup_mesh — callers need not clean obj first.
     """
     dims, min_co, max_co = get_dimensions(obj)
     if dims.x <= bed_x and dims.y <= bed_y and dims.z <= MAX_Z:
+        cleanup_mesh(obj)
         return [obj]
 
-    # Determine split axis (longest that exceeds bed)
-    if dims.x > bed_x and dims.x >= dims.y:
-        axis = 'X'
-        split_pos = (min_co.x + max_co.x) / 2.0
-    elif dims.y > bed_y:
-        axis = 'Y'
-        split_pos = (min_co.y + max_co.y) / 2.0
-    else:
-        axis = 'X'
-        split_pos = (min_co.x + max_co.x) / 2.0
-
-    # Create two halves using boolean intersection approach
-    # Duplicate the object for the second half
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.duplicate()
-    obj_copy = bpy.context.active_object
-    obj_copy.name = obj.name + "_B"
-    obj.name = obj.name + "_A"
-
-    big = max(dims.x, dims.y, dims.z) + 10.0
-
-    if axis == 'X':
-        # Cut right half from obj (keep left)
-        cutter_a = create_box_object(
-            dims.x, big, big,
-            location=(split_pos + dims.x / 2.0, (min_co.y + max_co.y) / 2,
-                      (min_co.z + max_co.z) / 2),
-            name="_split_cut_a"
-        )
-        boolean_difference(obj, cutter_a)
-        # Cut left half from copy (keep right)
-        cutter_b = create_box_object(
-            dims.x, big, big,
-            location=(split_pos - dims.x / 2.0, (min_co.y + max_co.y) / 2,
-                      (min_co.z + max_co.z) / 2),
-            name="_split_cut_b"
-        )
-        boolean_difference(obj_copy, cutter_b)
-    else:
-        cutter_a = create_box_object(
-            big, dims.y, big,
-            location=((min_co.x + max_co.x) / 2, split_pos + dims.y / 2.0,
-                      (min_co.z + max_co.z) / 2),
-            name="_split_cut_a"
-        )
-        boolean_difference(obj, cutter_a)
-        cutter_b = create_box_object(
-            big, dims.y, big,
-            location=((min_co.x + max_co.x) / 2, split_pos - dims.y / 2.0,
-                      (min_co.z + max_co.z) / 2),
-            name="_split_cut_b"
+    nx = max(1, math.ceil(dims.x / bed_x))
+    ny = max(1, math.ceil(dims.y / bed_y))
+    if nx * ny == 1:
+        # Only Z exceeds the bed — a vertical split is not supported
+        cleanup_mesh(obj)
+        return [obj]
+
+    cell_x = dims.x / nx
+    cell_y = dims.y / ny
+    cells  = list(product(range(nx), range(ny)))
+
+    # Copies first — the original is cut last and becomes the final cell
+    base_name = obj.name
+    parts = []
+    for i, j in cells[:-1]:
+        part = obj.copy()
+        part.data = obj.data.copy()
+        part.name = f"{base_name}_{i}{j}"
+        bpy.context.collection.objects.link(part)
+        parts.append(part)
+    obj.name = f"{base_name}_{nx - 1}{ny - 1}"
+    parts.append(obj)
+
+    # Cutter slabs extend PAD past the bounding box so no face is coplanar
+    pad   = 5.0
+    x_lo  = min_co.x - pad
+    x_hi  = max_co.x + pad
+    y_lo  = min_co.y - pad
+    y_hi  = max_co.y + pad
+    z_bot = min_co.z - pad
+    z_h   = dims.z + 2 * pad
+
+    def slab(bm, xa, xb, ya, yb):
+        create_box_bmesh(
+            bm, xb - xa, z_h, yb - ya,
+            location=((xa + xb) / 2, (ya + yb) / 2, z_bot),
         )
-        boolean_difference(obj_copy, cutter_b)
 
-    cleanup_mesh(obj)
-    cleanup_mesh(obj_copy)
+    for (i, j), part in zip(cells, parts):
+        x0 = min_co.x + i * cell_x
+        x1 = x0 + cell_x
+        y0 = min_co.y + j * cell_y
+        y1 = y0 + cell_y
+        # Inverted cell AABB: X slabs span the full Y range, Y slabs only
+        # the kept X range, so the slabs never overlap each other.
+        bm = bmesh.new()
+        if i > 0:
+            slab(bm, x_lo, x0, y_lo, y_hi)
+        if i < nx - 1:
+            slab(bm, x1, x_hi, y_lo, y_hi)
+        if j > 0:
+            slab(bm, x0, x1, y_lo, y0)
+        if j < ny - 1:
+            slab(bm, x0, x1, y1, y_hi)
+        boolean_difference(part, bm, solver='FAST')
+        bm.free()
+        cleanup_mesh(part)
 
-    # Recursively split if still too large
-    results = []
-    results.extend(split_for_print(obj, bed_x, bed_y))
-    results.extend(split_for_print(obj_copy, bed_x, bed_y))
-    return results
+    return parts
@@ -24,14 +24,23 @@ Y coordinate formula for element protruding P mm (flush with wall back):
 """
 
 import bpy
+import bmesh
+import functools
 import math
-import random
-from mathutils import Vector
+from dataclasses import astuple, dataclass, fields
+import numpy as np
 from ..utils.mesh import (
     create_box_object,
-    boolean_union,
-    boolean_difference,
+    create_box_bmesh,
+    create_prism_bmesh,
+    link_instance,
+    delete_object,
+    boolean_chain,
     cleanup_mesh,
+    dissolve_coplanar,
+    bevel_sharp_edges,
+    csg_engine,
+    world_bounds,
 )
 from .gothic_details import (
     create_gothic_arch_cutter,
@@ -41,10 +50,12 @@ from .gothic_details import (
     create_skull_relief,
     add_stone_block_lines,
     add_rivets,
+    arch_segment_count,
 )
 from .connectors import add_ground_wall_connectors
-from .damage import apply_damage
-from .splitter import should_split, split_for_print
+from .damage import apply_damage, damage_removes, plan_damage
+from .splitter import may_exceed_bed, should_split, split_for_print
+from .result_cache import cached_parts, params_key, quantize
 
 
 # ── Style presets (calibrated from binary-STL reference measurements) ────────
@@ -82,7 +93,58 @@ STYLE_PRESETS = {
 }
 
 
-def generate_wall_segment(params):
+# ── Parameters ───────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class WallParams:
+    """
+    Wall parameters resolved once from the operator / batch dict.  Keys the
+    wall does not use (depth, floor_count …) are dropped, missing keys get
+    these defaults.  Frozen, so it doubles as the result-cache key; floats
+    are quantized on construction (see result_cache.QUANTA).
+    """
+    width:            float = 100.0
+    height:           float = 80.0
+    wall_thickness:   float = 5.0
+    wall_style:       str   = 'VOY'
+    window_density:   int   = 2
+    detail_level:     int   = 1
+    gothic_style:     int   = 1
+    mortar_width:     float = 1.0
+    damage_state:     str   = 'CLEAN'
+    damage_intensity: float = 0.3
+    seed:             int   = 42
+    connector_type:   str   = 'NONE'
+    split_mode:       str   = 'AUTO'
+    bevel_width:      float = 0.0
+    magnet_diameter:  float = 3.0
+    magnet_height:    float = 2.0
+    csg_engine:       str | None = None
+    arch_segments:    int | None = None     # None: from style + detail
+
+    def __post_init__(self):
+        for f in fields(self):
+            value = getattr(self, f.name)
+            q     = quantize(f.name, value)
+            if q != value:
+                object.__setattr__(self, f.name, q)      # frozen
+
+    @classmethod
+    def from_dict(cls, params):
+        """WallParams from a params dict; a WallParams is returned as is."""
+        if isinstance(params, cls):
+            return params
+        return cls(**{f.name: params[f.name] for f in fields(cls) if f.name in params})
+
+
+# Mortar grids with fewer joints than this (tiny walls) are skipped
+MORTAR_MIN_JOINTS = 4
+
+# Recess panels removing less material than this (mm³) are not cut
+MIN_RECESS_VOLUME = 5.0
+
+
+def generate_wall_segment(params, plan=None):
     """
     Generate an Imperial Gothic wall segment.
 
@@ -97,46 +159,50 @@ def generate_wall_segment(params):
         1: lancet arch windows + pilasters + buttresses
         2: + raised window frames + window sills
         3: + skull reliefs in spandrel above arches
-    """
-    w          = params.get('width',          100.0)
-    h          = params.get('height',          80.0)
-    t          = params.get('wall_thickness',   5.0)
-    win_count  = params.get('window_density',    2)
-    detail     = params.get('detail_level',      1)
-    gothic     = params.get('gothic_style',      1)
-    damage     = params.get('damage_intensity', 0.3)
-    seed       = params.get('seed',             42)
-    connector  = params.get('connector_type',  'NONE')
-    split_mode = params.get('split_mode',      'AUTO')
-    bevel_w    = params.get('bevel_width',      0.0)
-    mortar_w   = params.get('mortar_width',     1.0)
-
-    # ── Style preset ─────────────────────────────────────────────────────────
-    sp             = STYLE_PRESETS.get(params.get('wall_style', 'VOY'), STYLE_PRESETS['VOY'])
-    win_ratio      = sp['win_ratio']
-    arch_seg_base  = sp['arch_seg_base']
-    block_scale    = sp['block_scale']
-    plinth_factor  = sp['plinth_factor']
-    cornice_factor = sp['cornice_factor']
-
-    rng = random.Random(seed)  # noqa: F841
-
-    # ── Protrusion depths — scale with wall thickness ────────────────────────
-    # This ensures nothing protrudes more than the wall is thick
-    p_pillar = max(t * 2.2,  7.0)   # cornice, pilasters, buttresses — ref: 2.09×t
-    p_plinth = max(t * 2.0,  7.0)   # base plinth — wider for freestanding stability
-    p_sill   = p_pillar + 1.5       # window sill (slightly past structural layer)
-    p_frame  = max(t * 0.6,  1.8)   # raised arch frame
-
-    # ── Element widths — scale with wall thickness ───────────────────────────
-    butt_w = max(7.0, t * 1.5)      # end buttresses: narrow fin face (ref: 4–7.4 mm)
-    pil_w  = max(8.0, t * 2.0)     # internal pilasters (ref: 8–12 mm)
 
-    # ── Vertical zones ───────────────────────────────────────────────────────
-    plinth_h   = max(min(h * plinth_factor,  10.0), 7.0)
-    cornice_h  = max(min(h * cornice_factor,  7.0), 5.0)
-    win_zone_h = h - plinth_h - cornice_h
-    win_bottom = plinth_h
+    params: dict (see WallParams for keys and defaults) or WallParams.
+    plan: result of plan_wall_segment(params), if already computed.
+    params['csg_engine']: 'BLENDER' (default) or 'MANIFOLD' — see utils.mesh.
+    """
+    wp = WallParams.from_dict(params)
+
+    def build():
+        with csg_engine(wp.csg_engine):
+            return _build_wall_segment(wp, plan)
+
+    return cached_parts(params_key('WALL', astuple(wp)), build)
+
+
+def _build_wall_segment(wp, plan=None):
+    """Uncached body of generate_wall_segment; wp is a WallParams."""
+    w          = wp.width
+    h          = wp.height
+    t          = wp.wall_thickness
+    win_count  = wp.window_density
+    detail     = wp.detail_level
+    gothic     = wp.gothic_style
+    damage     = wp.damage_intensity
+    seed       = wp.seed
+    connector  = wp.connector_type
+    split_mode = wp.split_mode
+    bevel_w    = wp.bevel_width
+    mortar_w   = wp.mortar_width
+
+    # ── Layout (bpy-free, see plan_wall_segment) ─────────────────────────────
+    plan = plan if plan is not None else plan_wall_segment(wp)
+    arch_segments = plan['arch_segments']
+    block_scale   = plan['block_scale']
+    p_pillar      = plan['p_pillar']
+    p_plinth      = plan['p_plinth']
+    p_sill        = plan['p_sill']
+    p_frame       = plan['p_frame']
+    butt_w        = plan['butt_w']
+    pil_w         = plan['pil_w']
+    plinth_h      = plan['plinth_h']
+    cornice_h     = plan['cornice_h']
+    win_zone_h    = plan['win_zone_h']
+    win_bottom    = plan['win_bottom']
+    windows       = plan['windows']
 
     # ── Main wall slab (Z = 0 → h) ──────────────────────────────────────────
     wall = create_box_object(w, h, t, location=(0, 0, 0), name="Wall_Segment")
@@ -146,53 +212,92 @@ def generate_wall_segment(params):
     # cut into the CLEAN slab. Cutting on a pristine mesh guarantees the
     # boolean solver succeeds; cutting after 20+ unions often fails silently.
     win_positions = []
-    bay_w      = w / win_count if win_count > 0 else w
-    win_xs     = [-w / 2 + (k + 0.5) * bay_w for k in range(win_count)]
-    int_pil_xs = [-w / 2 + k * bay_w          for k in range(1, win_count)]
-
-    # ── CUT WINDOWS FIRST — into the clean wall slab ─────────────────────────
-    if win_count > 0 and win_zone_h > 10.0:
+    int_pil_xs    = plan['int_pil_xs']
+
+    # ── CSG batches ──────────────────────────────────────────────────────────
+    # Builders only collect geometry; the wall then takes three booleans
+    # instead of one per part (each re-solves the whole, growing wall):
+    #   openings       — window cutters, cut first into the CLEAN slab
+    #   additive_parts — template instances (frames, pilasters, skulls) …
+    #   boxes_bm       — … plus every additive box, written into one BMesh
+    #   recess_bm      — shallow panel grooves, cut into the finished faces
+    openings       = []
+    additive_parts = []
+    boxes_bm       = bmesh.new()
+    recess_bm      = bmesh.new()
+    has_butt       = gothic >= 1 and detail >= 1
+
+    # ── Windows ──────────────────────────────────────────────────────────────
+    if windows:
         win_positions = _build_windows(
-            wall, win_xs, bay_w, pil_w, win_zone_h, win_bottom,
-            t, gothic, detail, p_pillar, p_sill, p_frame,
-            win_ratio=win_ratio, arch_seg_base=arch_seg_base,
+            openings, additive_parts, boxes_bm, windows,
+            t, gothic, detail, p_pillar, p_sill, p_frame, segments=arch_segments,
         )
 
-    # ── Plinth + cornice bands ───────────────────────────────────────────────
+    # ── Ornament (detail ≥ 1) ────────────────────────────────────────────────
+    # Every ornament needs detail ≥ 1, so LOD-0 walls (the bulk of large
+    # batches) stop at the window openings and skip all builders below.
     if detail >= 1:
-        _build_band(wall, w, plinth_h,  t, p_plinth, z=0,             name="_plinth",  lip_at_top=True)
-        _build_band(wall, w, cornice_h, t, p_pillar, z=h - cornice_h, name="_cornice", lip_at_top=False)
-
-    # ── Rear face detailing ───────────────────────────────────────────────────
-    if detail >= 1:
-        _build_rear_face(wall, w, h, t, plinth_h, cornice_h,
+        # ── Plinth + cornice bands ───────────────────────────────────────────
+        # The plinth panel stops at the end buttresses, which stand in front of it
+        plinth_half_w = (w / 2 - butt_w) if has_butt else None
+        _build_band(boxes_bm, recess_bm, w, plinth_h, t, p_plinth, z=0,
+                    lip_at_top=True, recess_half_w=plinth_half_w)
+        _build_band(boxes_bm, recess_bm, w, cornice_h, t, p_pillar, z=h - cornice_h,
+                    lip_at_top=False)
+
+        # ── Rear face detailing ──────────────────────────────────────────────
+        _build_rear_face(boxes_bm, recess_bm, w, h, t, plinth_h, cornice_h,
                          win_count, win_zone_h, win_bottom)
 
-    # ── Buttresses + pilasters ───────────────────────────────────────────────
-    if win_count > 0 and win_zone_h > 10.0:
-        if gothic >= 1 and detail >= 1:
-            _build_end_buttresses(wall, w, h, t, butt_w, p_pillar)
-
-        if gothic >= 1 and detail >= 1 and int_pil_xs:
-            _build_pilasters(wall, int_pil_xs, pil_w, win_zone_h, t, win_bottom, p_pillar)
+        # ── Buttresses + pilasters ───────────────────────────────────────────
+        if has_butt:
+            _build_end_buttresses(boxes_bm, w, h, t, butt_w, p_pillar)
+        if has_butt and len(int_pil_xs) and win_positions:
+            _build_pilasters(additive_parts, recess_bm, int_pil_xs, pil_w, win_zone_h,
+                             t, win_bottom, p_pillar)
 
-        # Front string courses — arch_h from first position tuple element [2]
-        if detail >= 1 and win_positions:
+        if win_positions:
+            # Front string courses — arch_h from first position tuple element [2]
             _build_front_stringcourses(
-                wall, w, t, win_bottom, win_positions[0][2], p_pillar
+                boxes_bm, w, t, win_bottom, win_positions[0][2], p_pillar
             )
 
-    elif gothic >= 1 and detail >= 1:
-        _build_end_buttresses(wall, w, h, t, butt_w, p_pillar)
-
-    # ── Spandrel fill ─────────────────────────────────────────────────────────
-    if 1 <= gothic < 3 and detail >= 1 and win_positions:
-        _build_spandrel_fill(wall, win_positions, h, cornice_h, t,
-                             p_frame, gothic, detail)
-
-    # ── Skulls in spandrel above arches (gothic 3 only) ──────────────────────
-    if gothic >= 3 and detail >= 2 and win_positions:
-        _build_skulls(wall, win_positions, h, cornice_h, t)
+            # ── Spandrel fill (gothic 1–2) / skulls (gothic 3) ───────────────
+            if 1 <= gothic < 3:
+                _build_spandrel_fill(boxes_bm, recess_bm, win_positions, h,
+                                     cornice_h, t, p_frame, gothic, detail)
+            elif gothic >= 3 and detail >= 2:
+                _build_skulls(additive_parts, plan['skulls'], t)
+
+    # ── Damage plan ──────────────────────────────────────────────────────────
+    # The cutters only depend on the finished wall's bounds, which the
+    # collected parts already fix.  Plan them now and drop every opening or
+    # ornament a cutter swallows whole — it would only be cut away again.
+    cuts = []
+    if wp.damage_state != 'CLEAN':
+        cuts = plan_damage(wp.damage_state, damage, seed,
+                           *_collected_bounds(wall, additive_parts, boxes_bm))
+        openings[:]       = _drop_swallowed(openings, cuts)
+        additive_parts[:] = _drop_swallowed(additive_parts, cuts)
+
+    # ── Apply the batches ────────────────────────────────────────────────────
+    # Openings → ornament → recesses, baked as one modifier stack.
+    # The box BMesh holds overlapping shells, so the union self-intersects.
+    recess_cuts = []
+    for bm, parts in ((boxes_bm, additive_parts), (recess_bm, recess_cuts)):
+        if bm.verts:
+            parts.append(bm)
+        else:
+            bm.free()
+    boolean_chain(wall, [
+        ('DIFFERENCE', openings,       'EXACT' if gothic >= 1 else 'FAST', False),
+        ('UNION',      additive_parts, 'EXACT', True),
+        ('DIFFERENCE', recess_cuts,    'FAST',  False),
+    ])
+    # The union splits every face it touches; merge the fragments back so
+    # mortar, bevel, damage and split all start from the minimal surface.
+    dissolve_coplanar(wall)
 
     # ── Mauerwerk-Fugen — unabhängig von detail_level ─────────────────────────
     # mortar_width=0 schaltet die Fugen aus; jeder Wert >0 aktiviert sie.
@@ -209,59 +314,197 @@ def generate_wall_segment(params):
             bh, bw = 13.0, 20.0
         bh = max(6.0, bh * block_scale)
         bw = max(8.0, bw * block_scale)
-        add_stone_block_lines(wall,
-                              block_height=bh, block_width=bw,
-                              line_width=mortar_w, line_depth=line_d,
-                              front_face_y=-(t / 2),
-                              boss_depth=boss_d,
-                              texture_depth=0.3)
+        # Grid only between the bands (detail ≥ 1 puts solid bands in front
+        # of the face there); a grid of < 4 joints is not worth its boolean.
+        z_lo, z_hi = (plinth_h, h - cornice_h) if detail >= 1 else (0.0, h)
+        n_joints   = max(0, int(w / bw) - 1) + max(0, int((z_hi - z_lo) / bh) - 1)
+        if n_joints >= MORTAR_MIN_JOINTS:
+            add_stone_block_lines(wall,
+                                  block_height=bh, block_width=bw,
+                                  line_width=mortar_w, line_depth=line_d,
+                                  front_face_y=-(t / 2),
+                                  boss_depth=boss_d,
+                                  texture_depth=0.3,
+                                  z_min=z_lo, z_max=z_hi)
 
     # ── Rivets ───────────────────────────────────────────────────────────────
     if detail >= 3 and t >= 2.5:
-        _add_wall_rivets(wall, w, h, t)
+        _add_wall_rivets(wall, w, h, t, plinth_h, cornice_h, cuts)
 
     # ── Bevel ────────────────────────────────────────────────────────────────
     if bevel_w > 0:
-        _apply_bevel(wall, bevel_w)
+        bevel_sharp_edges(wall, bevel_w)
 
     # ── Damage ───────────────────────────────────────────────────────────────
-    apply_damage(wall, params.get('damage_state', 'CLEAN'), damage, seed)
+    apply_damage(wall, wp.damage_state, damage, seed, cuts=cuts)
 
     # ── Connectors ───────────────────────────────────────────────────────────
     # Ground wall: female sockets on top + both side edges. No bottom connector.
     if connector != 'NONE':
         add_ground_wall_connectors(
             wall, w=w, h=h, t=t,
-            magnet_diameter=params.get('magnet_diameter', 3.0),
-            magnet_height=params.get('magnet_height', 2.0),
+            magnet_diameter=wp.magnet_diameter,
+            magnet_height=wp.magnet_height,
         )
 
-    # ── Cleanup ──────────────────────────────────────────────────────────────
-    cleanup_mesh(wall)
-
-    # ── Split for print ──────────────────────────────────────────────────────
-    if split_mode == 'AUTO' and should_split(wall):
+    # ── Split for print / cleanup ────────────────────────────────────────────
+    # split_for_print cleans every part it returns, so a wall that gets split
+    # skips the whole-wall cleanup pass on its largest intermediate mesh.
+    # Only the slab's w × h can reach the bed limit (nothing protrudes more
+    # than a few wall thicknesses), so most walls skip the bounds read.
+    if split_mode == 'AUTO' and may_exceed_bed(w, h) and should_split(wall):
         parts = split_for_print(wall)
         for i, p in enumerate(parts):
             p.name = f"Wall_Segment_{i:02d}"
-            cleanup_mesh(p)
         return parts
 
+    cleanup_mesh(wall)
     return [wall]
 
 
-# ── Shared helper ────────────────────────────────────────────────────────────
+# ── Layout planning (plain arithmetic — no bpy) ─────────────────────────────
+
+def plan_wall_segment(params):
+    """
+    Every dimension of the wall that is plain arithmetic on params: style
+    preset, protrusion depths, element widths, vertical zones, the bay
+    layout and the window / skull placements.  Touches no bpy, so a batch
+    can prepare plans up front (or off the main thread) and hand them to
+    generate_wall_segment.
+    params: dict or WallParams.
+
+    Plans are memoised on the params they depend on (mm values rounded to
+    1 µm), so a terrain set of same-sized walls computes its layout once.
+    The returned plan is shared between calls: treat it as read-only.
+    """
+    wp = WallParams.from_dict(params)
+    return _plan(round(wp.width, 3), round(wp.height, 3), round(wp.wall_thickness, 3),
+                 wp.window_density, wp.wall_style, wp.detail_level, wp.gothic_style,
+                 wp.arch_segments)
+
+
+@functools.lru_cache(maxsize=64)
+def _plan(w, h, t, win_count, wall_style, detail, gothic, arch_segments_override):
+    """Memoised body of plan_wall_segment."""
+    # ── Style preset ─────────────────────────────────────────────────────────
+    sp = STYLE_PRESETS.get(wall_style, STYLE_PRESETS['VOY'])
+
+    # ── Protrusion depths — scale with wall thickness ────────────────────────
+    # This ensures nothing protrudes more than the wall is thick
+    p_pillar = max(t * 2.2,  7.0)   # cornice, pilasters, buttresses — ref: 2.09×t
+    p_plinth = max(t * 2.0,  7.0)   # base plinth — wider for freestanding stability
+    p_sill   = p_pillar + 1.5       # window sill (slightly past structural layer)
+    p_frame  = max(t * 0.6,  1.8)   # raised arch frame
 
-def _loc_xfm(obj):
-    """Bake the object's location offset into its mesh data."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.transform_apply(location=True)
+    # ── Element widths — scale with wall thickness ───────────────────────────
+    butt_w = max(7.0, t * 1.5)      # end buttresses: narrow fin face (ref: 4–7.4 mm)
+    pil_w  = max(8.0, t * 2.0)     # internal pilasters (ref: 8–12 mm)
+
+    # ── Vertical zones ───────────────────────────────────────────────────────
+    plinth_h   = max(min(h * sp['plinth_factor'],  10.0), 7.0)
+    cornice_h  = max(min(h * sp['cornice_factor'],  7.0), 5.0)
+
+    # ── Pillar–window rhythm ─────────────────────────────────────────────────
+    # Bay centres / internal bay boundaries as float64 arrays (empty for 0 / 1)
+    bay_w  = w / win_count if win_count > 0 else w
+    ks     = np.arange(max(win_count, 0), dtype=np.float64)
+    win_xs = -w / 2 + (ks + 0.5) * bay_w
+    pil_xs = -w / 2 + ks[1:] * bay_w
+    win_xs.flags.writeable = pil_xs.flags.writeable = False
+
+    # ── Openings and spandrel skulls ─────────────────────────────────────────
+    win_zone_h = h - plinth_h - cornice_h
+    windows    = ()
+    if win_count > 0 and win_zone_h > 10.0:
+        windows = tuple(_compute_window_plan(win_xs, bay_w, pil_w, win_zone_h,
+                                             plinth_h, sp['win_ratio']))
+
+    # ── Arch resolution ──────────────────────────────────────────────────────
+    # Detail ≤ 1 prints can't resolve the preset's full arc: halve it.
+    # Narrow lancets get fewer segments still (see arch_segment_count).
+    seg_base      = sp['arch_seg_base'] // (2 if detail <= 1 else 1)
+    arch_segments = max(seg_base, gothic * 4)
+    if windows:
+        arch_segments = arch_segment_count(windows[0][3], arch_segments)
+    arch_segments = arch_segments_override or arch_segments
+
+    return {
+        'win_ratio':     sp['win_ratio'],
+        'arch_seg_base': sp['arch_seg_base'],
+        'arch_segments': arch_segments,
+        'block_scale':   sp['block_scale'],
+        'p_pillar':      p_pillar,
+        'p_plinth':      p_plinth,
+        'p_sill':        p_sill,
+        'p_frame':       p_frame,
+        'butt_w':        butt_w,
+        'pil_w':         pil_w,
+        'plinth_h':      plinth_h,
+        'cornice_h':     cornice_h,
+        'win_zone_h':    win_zone_h,
+        'win_bottom':    plinth_h,
+        'bay_w':         bay_w,
+        'win_xs':        win_xs,
+        'int_pil_xs':    pil_xs,
+        'windows':       windows,
+        'skulls':        tuple(_compute_skull_plan(windows, h, cornice_h)),
+    }
+
+
+def _compute_window_plan(win_xs, bay_w, pil_w, win_zone_h, win_bottom, win_ratio):
+    """
+    Window openings as (cx, win_bottom, arch_h, win_w) tuples.
+
+    Arch fills ~85% of window zone; remaining ~15% (5–12 mm) = spandrel
+    above the arch, reserved for skull reliefs.
+    """
+    spandrel_h = max(min(win_zone_h * 0.15, 12.0), 5.0)
+    arch_h     = win_zone_h - spandrel_h
+
+    margin = 2.0
+    win_w  = min(bay_w - pil_w - 2 * margin, arch_h * win_ratio)
+    win_w  = max(win_w, 5.0)
+
+    return [(cx, win_bottom, arch_h, win_w) for cx in win_xs.tolist()]
+
+
+def _compute_skull_plan(win_positions, h, cornice_h):
+    """(cx, skull_z, skull_w, skull_h) for every spandrel with room for a skull."""
+    if not win_positions:
+        return []
+    cx, win_btm, arch_h, _win_w = np.asarray(win_positions, dtype=np.float64).T
+    spandrel_z     = win_btm + arch_h
+    spandrel_avail = h - cornice_h - spandrel_z
+
+    skull_w = np.clip(spandrel_avail * 0.9, 6.0, 12.0)
+    skull_h = np.minimum(skull_w * 1.2, spandrel_avail - 1.0)
+    skull_z = spandrel_z + (spandrel_avail - skull_h) * 0.4
+    keep    = (spandrel_avail >= 5.0) & (skull_h >= 5.0)
+
+    return list(zip(cx[keep].tolist(), skull_z[keep].tolist(),
+                    skull_w[keep].tolist(), skull_h[keep].tolist()))
+
+
+def _compute_rivet_positions(w, h, t):
+    """
+    Rivet centres on the front face as a (2n, 3) array:
+    rows [:n] along the base, rows [n:] along the top.
+    """
+    cols = np.arange(-int(w / 2) + 8, int(w / 2) - 5, 12, dtype=np.float32)
+    n    = cols.size
+    pos  = np.empty((2 * n, 3), dtype=np.float32)
+    pos[:n, 0] = cols
+    pos[n:, 0] = cols
+    pos[:, 1]  = -(t / 2) - 0.1
+    pos[:n, 2] = 6.0
+    pos[n:, 2] = h - 6.0
+    return pos
 
 
 # ── Horizontal bands (plinth / cornice) ─────────────────────────────────────
 
-def _build_band(wall, w, band_h, t, protrude, z, name, lip_at_top=True):
+def _build_band(boxes_bm, recess_bm, w, band_h, t, protrude, z,
+                lip_at_top=True, recess_half_w=None):
     """
     Horizontal band with layered masonry (Depth Pass):
       Level 0 — main slab flush with wall back (Y = +t/2), protruding `protrude` mm
@@ -271,54 +514,50 @@ def _build_band(wall, w, band_h, t, protrude, z, name, lip_at_top=True):
 
     lip_at_top=True  → shadow ledge at top of band  (plinth → wall zone transition)
     lip_at_top=False → shadow ledge at bottom of band (cornice hangs over wall)
+
+    boxes_bm / recess_bm: the wall's shared additive-box / recess BMeshes.
+
+    recess_half_w: clamp the face panel to |X| ≤ this.  Recesses are cut after
+    every part is unioned, so the panel must stop where an end buttress stands
+    in front of the band — otherwise it would hollow out the buttress.
+
+    The mortar grid never reaches these layers (its grooves sit at the wall
+    face, Y ≈ –t/2, the band front is ≥ 7 mm further out), so they are kept
+    at every detail level; they cost no booleans of their own.
     """
-    band = create_box_object(
-        w, band_h, t + protrude,
-        location=(0, -protrude / 2, z), name=name
-    )
-    boolean_union(wall, band)
+    # Every tier shares the band's back face and X extent, so their union is
+    # one stepped prism: tiers are (z, height, protrusion).
+    tiers = [(z, band_h, protrude)]
+
+    lip_h = min(1.5, band_h * 0.28)
+    if band_h >= 3.0:
+        # Sub-plinth corbel step (plinth mode only, lip_at_top=True):
+        # Extra tier at the very base — wall → plinth → sub-plinth → ground.
+        # Adds a third horizontal level that gives the foundation visual weight
+        # and mimics the corbelled base found on all real Gothic plinths.
+        if lip_at_top:
+            sub_h   = min(2.0, band_h * 0.28)
+            sub_ext = 2.0
+            tiers.append((z, sub_h, protrude + sub_ext))
+
+            # Horizontal accent ribs — derived from Butress_Accents.stl (3-band pattern)
+            if band_h >= 5.0:
+                rib_h = max(0.8, band_h * 0.14)
+                rib_p = protrude + 0.8
+                for i in range(3):
+                    rz = z + band_h * (i + 0.5) / 3 - rib_h / 2
+                    tiers.append((rz, rib_h, rib_p))
+
+        # Shadow lip (Level 2): protrudes 0.8 mm more than the band
+        lip_ext = 0.8
+        lip_z   = (z + band_h - lip_h) if lip_at_top else z
+        tiers.append((lip_z, lip_h, protrude + lip_ext))
+
+    create_prism_bmesh(boxes_bm, _band_profile(tiers, t), w)
 
     if band_h < 3.0:
         return
 
-    # Sub-plinth corbel step (plinth mode only, lip_at_top=True):
-    # Extra tier at the very base — wall → plinth → sub-plinth → ground.
-    # Adds a third horizontal level that gives the foundation visual weight
-    # and mimics the corbelled base found on all real Gothic plinths.
-    if lip_at_top:
-        sub_h   = min(2.0, band_h * 0.28)
-        sub_ext = 2.0
-        sub_p   = protrude + sub_ext
-        sub = create_box_object(
-            w, sub_h, t + sub_p,
-            location=(0, -sub_p / 2, z), name=name + "_sub"
-        )
-        boolean_union(wall, sub)
-
-        # Horizontal accent ribs — derived from Butress_Accents.stl (3-band pattern)
-        if band_h >= 5.0:
-            rib_h = max(0.8, band_h * 0.14)
-            rib_p = protrude + 0.8
-            for i in range(3):
-                rz  = z + band_h * (i + 0.5) / 3 - rib_h / 2
-                rib = create_box_object(
-                    w, rib_h, t + rib_p,
-                    location=(0, -rib_p / 2, rz),
-                    name=f"{name}_rib{i}",
-                )
-                boolean_union(wall, rib)
-
-    # Shadow lip (Level 2): protrudes 0.8 mm more than the band
-    lip_h   = min(1.5, band_h * 0.28)
-    lip_ext = 0.8
-    lip_p   = protrude + lip_ext
-    lip_z   = (z + band_h - lip_h) if lip_at_top else z
-    lip = create_box_object(
-        w, lip_h, t + lip_p,
-        location=(0, -lip_p / 2, lip_z), name=name + "_lip"
-    )
-    boolean_union(wall, lip)
-
     # Recessed face panel (Level 1): 1.0 mm groove on band front face
     # Margin accounts for lip so panel never overlaps the shadow ledge
     margin_x   = max(4.0, w * 0.04)
@@ -328,18 +567,44 @@ def _build_band(wall, w, band_h, t, protrude, z, name, lip_at_top=True):
     panel_h    = band_h - margin_bot - margin_top
     recess_d   = 1.0
     if panel_w >= 8.0 and panel_h >= 1.5:
+        if recess_half_w is not None:
+            panel_w = min(panel_w, 2 * recess_half_w)
         front_y = -(t / 2 + protrude)
         cut_y   = front_y + recess_d / 2
-        cutter  = create_box_object(
-            panel_w, panel_h, recess_d + 0.4,
-            location=(0, cut_y, z + margin_bot), name=name + "_recess"
-        )
-        boolean_difference(wall, cutter)
+        # The buttress clamp can leave a sliver — too small to print
+        if panel_w * panel_h * recess_d >= MIN_RECESS_VOLUME:
+            create_box_bmesh(
+                recess_bm, panel_w, panel_h, recess_d + 0.4,
+                location=(0, cut_y, z + margin_bot),
+            )
+
+
+def _band_profile(tiers, t):
+    """
+    (y, z) outline of stacked band tiers (z, height, protrusion) that all
+    reach back to Y = +t/2: the front steps out to the deepest tier at
+    every height.  Counter-clockwise for create_prism_bmesh.
+    """
+    zs = sorted({z for z0, th, _ in tiers for z in (z0, z0 + th)})
+    runs = []                                    # (z_lo, z_hi, protrusion)
+    for lo, hi in zip(zs, zs[1:]):
+        mid = (lo + hi) / 2
+        p   = max(tp for z0, th, tp in tiers if z0 <= mid <= z0 + th)
+        if runs and runs[-1][2] == p:
+            runs[-1] = (runs[-1][0], hi, p)
+        else:
+            runs.append((lo, hi, p))
+
+    back    = t / 2
+    outline = [(back, zs[0]), (back, zs[-1])]
+    for lo, hi, p in reversed(runs):
+        outline += [(-(back + p), hi), (-(back + p), lo)]
+    return outline
 
 
 # ── Rear face detailing ──────────────────────────────────────────────────────
 
-def _build_rear_face(wall, w, h, t, plinth_h, cornice_h,
+def _build_rear_face(boxes_bm, recess_bm, w, h, t, plinth_h, cornice_h,
                      win_count, win_zone_h, win_bottom):
     """
     Minimal rear-face detailing: horizontal bands + shallow bay recesses.
@@ -348,23 +613,26 @@ def _build_rear_face(wall, w, h, t, plinth_h, cornice_h,
     Rear protrusion formula (protrude P from back face Y = +t/2):
         depth = t + P,  loc_y = +P / 2
         → back at Y = +(t/2 + P),  front flush at Y = −t/2
+
+    Not worth a visibility guard: plan_wall_segment floors plinth_h at 7 mm
+    and cornice_h at 5 mm, so both rear bands always show, and they are two
+    boxes in the shared box BMesh — no booleans of their own.  The mortar
+    grid only grooves the front face, so it never hides the rear cornice.
     """
-    p_rear        = max(t * 0.25, 0.8)   # shallow — never dominates the front
+    p_rear       = max(t * 0.25, 0.8)   # shallow — never dominates the front
     p_rear_plinth = max(t * 0.5,  1.5)   # wider at base for freestanding stability
 
     # ── Rear plinth band ─────────────────────────────────────────────────────
-    rb = create_box_object(
-        w, plinth_h, t + p_rear_plinth,
-        location=(0, p_rear_plinth / 2, 0), name="_rear_plinth"
+    create_box_bmesh(
+        boxes_bm, w, plinth_h, t + p_rear_plinth,
+        location=(0, p_rear_plinth / 2, 0),
     )
-    boolean_union(wall, rb)
 
     # ── Rear cornice band ─────────────────────────────────────────────────────
-    rc = create_box_object(
-        w, cornice_h, t + p_rear,
-        location=(0, p_rear / 2, h - cornice_h), name="_rear_cornice"
+    create_box_bmesh(
+        boxes_bm, w, cornice_h, t + p_rear,
+        location=(0, p_rear / 2, h - cornice_h),
     )
-    boolean_union(wall, rc)
 
     # ── Bay panel recesses (only when no windows in the bay) ─────────────────
     # When windows are present the bay already has an opening; skip to avoid
@@ -378,17 +646,15 @@ def _build_rear_face(wall, w, h, t, plinth_h, cornice_h,
         panel_h  = win_zone_h - 2 * inset_z
 
         if panel_w >= 5.0 and panel_h >= 5.0:
-            cutter = create_box_object(
-                panel_w, panel_h, recess_d * 2,
+            create_box_bmesh(
+                recess_bm, panel_w, panel_h, recess_d * 2,
                 location=(0, t / 2, win_bottom + inset_z),
-                name="_rear_panel"
             )
-            boolean_difference(wall, cutter)
 
 
 # ── End buttresses ───────────────────────────────────────────────────────────
 
-def _build_end_buttresses(wall, w, h, t, butt_w, p_pillar):
+def _build_end_buttresses(boxes_bm, w, h, t, butt_w, p_pillar):
     """
     Three-tier stepped buttresses at both wall ends (authentic Gothic setback profile).
 
@@ -412,62 +678,55 @@ def _build_end_buttresses(wall, w, h, t, butt_w, p_pillar):
     h2 = butt_h * 0.32
     h3 = butt_h - h1 - h2
 
+    # (width, height, depth, loc_y, z) per tier — identical at both ends
+    tiers = (
+        (butt_w,        h1, t + p1, -p1 / 2, 0.0),
+        (butt_w * 0.92, h2, t + p2, -p2 / 2, h1),
+        (butt_w * 0.84, h3, t + p3, -p3 / 2, h1 + h2),
+    )
     for px in (-w / 2 + butt_w / 2, w / 2 - butt_w / 2):
-        b1 = create_box_object(
-            butt_w, h1, t + p1,
-            location=(px, -p1 / 2, 0), name="_butt1"
-        )
-        boolean_union(wall, b1)
-        b2 = create_box_object(
-            butt_w * 0.92, h2, t + p2,
-            location=(px, -p2 / 2, h1), name="_butt2"
-        )
-        boolean_union(wall, b2)
-        b3 = create_box_object(
-            butt_w * 0.84, h3, t + p3,
-            location=(px, -p3 / 2, h1 + h2), name="_butt3"
-        )
-        boolean_union(wall, b3)
+        for tw, th, td, ty, tz in tiers:
+            create_box_bmesh(boxes_bm, tw, th, td, location=(px, ty, tz))
 
 
 # ── Internal pilasters ───────────────────────────────────────────────────────
 
-def _build_pilasters(wall, pil_xs, pil_w, pil_h, t, z_bottom, p_pillar):
+def _build_pilasters(additive_parts, recess_bm, pil_xs, pil_w, pil_h, t,
+                     z_bottom, p_pillar):
     """
     Flat pilasters at internal bay boundaries (window edges).
     Same protrusion as plinth / cornice for visual continuity.
     """
-    pil_d = t + p_pillar
-    loc_y = -p_pillar / 2
+    pil_d   = t + p_pillar
+    loc_y   = -p_pillar / 2
+    pil_tpl = create_pilaster(pil_w, pil_h, pil_d, name="_pil_tpl", shared=True)
+
+    # Recessed panel on pilaster shaft face (Level 1: 1.0 mm inset)
+    # Mirrors the zone proportions used inside create_pilaster.  Every
+    # pilaster has the same size, so the panel is sized once.
+    base_h_pil = max(pil_h * 0.07, 2.0)
+    cap_h_pil  = max(pil_h * 0.06, 1.5)
+    shaft_h    = pil_h - base_h_pil - cap_h_pil
+    pan_margin = 1.5
+    pan_w      = pil_w - 2 * pan_margin
+    pan_h      = shaft_h - 2 * pan_margin
+    recess_d   = 1.0
+    has_panel  = pan_w >= 3.0 and pan_h >= 5.0
+    cut_y      = -(t / 2 + p_pillar) + recess_d / 2
+    pan_z      = z_bottom + base_h_pil + pan_margin
+
     for i, px in enumerate(pil_xs):
-        pil = create_pilaster(pil_w, pil_h, pil_d, name=f"_pil_{i}")
-        pil.location = Vector((px, loc_y, z_bottom))
-        _loc_xfm(pil)
-        boolean_union(wall, pil)
-
-        # Recessed panel on pilaster shaft face (Level 1: 1.0 mm inset)
-        # Mirrors the zone proportions used inside create_pilaster
-        base_h_pil = max(pil_h * 0.07, 2.0)
-        cap_h_pil  = max(pil_h * 0.06, 1.5)
-        shaft_h    = pil_h - base_h_pil - cap_h_pil
-        pan_margin = 1.5
-        pan_w      = pil_w - 2 * pan_margin
-        pan_h      = shaft_h - 2 * pan_margin
-        recess_d   = 1.0
-        if pan_w >= 3.0 and pan_h >= 5.0:
-            front_y = -(t / 2 + p_pillar)
-            cut_y   = front_y + recess_d / 2
-            cutter  = create_box_object(
-                pan_w, pan_h, recess_d + 0.4,
-                location=(px, cut_y, z_bottom + base_h_pil + pan_margin),
-                name=f"_pil_panel_{i}"
-            )
-            boolean_difference(wall, cutter)
+        additive_parts.append(link_instance(pil_tpl, (px, loc_y, z_bottom), name=f"_pil_{i}"))
+        if has_panel:
+            create_box_bmesh(recess_bm, pan_w, pan_h, recess_d + 0.4,
+                             location=(px, cut_y, pan_z))
+
+    delete_object(pil_tpl)
 
 
 # ── Front-face string courses ────────────────────────────────────────────────
 
-def _build_front_stringcourses(wall, w, t, win_bottom, arch_h, p_pillar):
+def _build_front_stringcourses(boxes_bm, w, t, win_bottom, arch_h, p_pillar):
     """
     Two thin projecting courses running the full wall width on the front face.
 
@@ -485,141 +744,205 @@ def _build_front_stringcourses(wall, w, t, win_bottom, arch_h, p_pillar):
     p_sc = p_pillar * 0.5
     sc_h = 1.5
     for sc_z in (win_bottom, win_bottom + arch_h):
-        sc = create_box_object(
-            w, sc_h, t + p_sc,
-            location=(0, -p_sc / 2, sc_z), name="_front_sc"
+        create_box_bmesh(
+            boxes_bm, w, sc_h, t + p_sc,
+            location=(0, -p_sc / 2, sc_z),
         )
-        boolean_union(wall, sc)
 
 
 # ── Windows ──────────────────────────────────────────────────────────────────
 
-def _build_windows(wall, win_xs, bay_w, pil_w, win_zone_h, win_bottom,
-                   t, gothic, detail, p_pillar, p_sill, p_frame,
-                   win_ratio=0.26, arch_seg_base=12):
+def _build_windows(openings, additive_parts, boxes_bm, positions,
+                   t, gothic, detail, p_pillar, p_sill, p_frame, segments=12):
     """
-    Cut lancet arch openings and add frames + sills.
-    Returns list of (cx, win_bottom_z, arch_h) tuples.
-
-    Arch fills ~85% of window zone; remaining ~15% (5–12 mm) = spandrel
-    above the arch, reserved for skull reliefs.
+    Collect lancet arch openings plus their frames, hoods and sills.
+    positions: plan['windows'], (cx, win_bottom_z, arch_h, win_w) tuples —
+    the layout every later ornament pass keys off (pilasters, string
+    courses, spandrel fill, skulls), so it is returned unchanged.
+    The openings are only collected: generate_wall_segment cuts all N in
+    the first, single DIFFERENCE step of its boolean chain.
     """
-    spandrel_h = max(min(win_zone_h * 0.15, 12.0), 5.0)
-    arch_h     = win_zone_h - spandrel_h
-
-    margin = 2.0
-    win_w  = min(bay_w - pil_w - 2 * margin, arch_h * win_ratio)
-    win_w  = max(win_w, 5.0)
-
-    segments  = max(arch_seg_base, gothic * 4)
-    positions = []
-
-    for i, cx in enumerate(win_xs):
+    if not positions:
+        return positions
+
+    # Every window in the wall has the same size: build the arch cutter and
+    # frame once and place linked duplicates that share the mesh.
+    _, win_bottom, arch_h, win_w = positions[0]
+    cutter_tpl, frame_tpl = _window_templates(win_w, arch_h, t, gothic, detail,
+                                              p_frame, segments)
+    box_cuts   = None              # gothic 0: every box cutter in one BMesh
+
+    # Hood / sill sizes depend only on the shared window size — the loop
+    # below just places boxes.
+    ornament = gothic >= 1 and detail >= 1
+    ft       = 1.5 if gothic >= 2 else 1.2  # frame thickness ref
+    hood_w_a = win_w + ft * 2 + 2.0
+    hood_w_b = hood_w_a + 1.5
+    hood_p_a = p_frame + 1.5
+    hood_p_b = p_frame + 2.2
+    hood_z   = win_bottom + arch_h
+    sill_w   = win_w + 4.0
+    sill_h   = 2.0
+
+    for i, (cx, *_) in enumerate(positions):
 
         # ── Arch cutter ───────────────────────────────────────────────────
-        if gothic >= 1:
-            cutter = create_gothic_arch_cutter(
-                win_w, arch_h, t + 2.0,
-                segments=segments, name=f"_win_cut_{i}"
-            )
+        if cutter_tpl is not None:
+            openings.append(link_instance(cutter_tpl, (cx, 0, win_bottom),
+                                          name=f"_win_cut_{i}"))
         else:
-            cutter = create_box_object(
-                win_w, arch_h, t + 2.0,
-                location=(0, 0, 0), name=f"_win_cut_{i}"
+            if box_cuts is None:
+                box_cuts = bmesh.new()
+                openings.append(box_cuts)
+            create_box_bmesh(
+                box_cuts, win_w, arch_h, t + 2.0,
+                location=(cx, 0, win_bottom),
             )
-        cutter.location = Vector((cx, 0, win_bottom))
-        _loc_xfm(cutter)
-        boolean_difference(wall, cutter)
-        positions.append((cx, win_bottom, arch_h, win_w))
 
         # ── Raised arch frame (window thickness / mass rule) ──────────────
         # Always applied at gothic >= 1 so every window shows a reveal frame.
         # Thinner border at gothic 1 (1.2 mm vs 1.5 mm) stays FDM-safe.
-        if gothic >= 1 and detail >= 1:
-            frame_thick = 1.5 if gothic >= 2 else 1.2
-            frame_d     = p_frame + 0.5   # 0.5 mm overlap into wall
-            frame       = create_arch_frame(
-                win_w, arch_h,
-                depth=frame_d, frame_thickness=frame_thick,
-                segments=segments, name=f"_frame_{i}"
-            )
-            frame.location = Vector((cx, -(t / 2 + p_frame / 2 - 0.25), win_bottom))
-            _loc_xfm(frame)
-            boolean_union(wall, frame)
+        if frame_tpl is not None:
+            additive_parts.append(link_instance(
+                frame_tpl, (cx, -(t / 2 + p_frame / 2 - 0.25), win_bottom),
+                name=f"_frame_{i}"
+            ))
 
         # ── Hood molding / Dripstone above arch ───────────────────────────
         # 2-step "eyebrow" projecting above the arch peak.
         # Step B (upper) protrudes more → casts a hard shadow down over the
         # arch frame and reveals window mass from a 45° viewing angle.
         # Both steps are vertical faces in FDM print orientation — no overhang.
-        if gothic >= 1 and detail >= 1:
-            ft           = 1.5 if gothic >= 2 else 1.2  # frame thickness ref
-            hood_w_a     = win_w + ft * 2 + 2.0
-            hood_w_b     = hood_w_a + 1.5
-            hood_p_a     = p_frame + 1.5
-            hood_p_b     = p_frame + 2.2
-            hood_z       = win_bottom + arch_h
-            hood_a = create_box_object(
-                hood_w_a, 1.2, t + hood_p_a,
-                location=(cx, -hood_p_a / 2, hood_z), name=f"_hood_a_{i}"
-            )
-            boolean_union(wall, hood_a)
-            hood_b = create_box_object(
-                hood_w_b, 1.0, t + hood_p_b,
-                location=(cx, -hood_p_b / 2, hood_z + 1.2), name=f"_hood_b_{i}"
-            )
-            boolean_union(wall, hood_b)
+        if ornament:
+            _hood_bmesh(boxes_bm, cx, hood_z, t,
+                        hood_w_a, 1.2, hood_p_a, hood_w_b, 1.0, hood_p_b)
 
         # ── Window sill / ledge (≥ 0.8 mm per window-mass rule) ───────────
-        if gothic >= 1 and detail >= 1:
-            sill_w = win_w + 4.0
-            sill_h = 2.0
-            sill   = create_box_object(
-                sill_w, sill_h, t + p_sill,
+        if ornament:
+            create_box_bmesh(
+                boxes_bm, sill_w, sill_h, t + p_sill,
                 location=(cx, -p_sill / 2, win_bottom - sill_h),
-                name=f"_sill_{i}"
             )
-            boolean_union(wall, sill)
 
+    # Template meshes are session-wide (shared=True): delete_object only
+    # drops the template objects, later walls reuse the meshes.
+    for tpl in (cutter_tpl, frame_tpl):
+        if tpl is not None:
+            delete_object(tpl)
     return positions
 
 
+def _window_templates(win_w, arch_h, t, gothic, detail, p_frame, segments):
+    """Shared arch cutter and frame template objects (None if the style has none)."""
+    cutter_tpl = frame_tpl = None
+    if gothic >= 1:
+        cutter_tpl = create_gothic_arch_cutter(
+            win_w, arch_h, t + 2.0,
+            segments=segments, name="_win_cut_tpl", shared=True
+        )
+    if gothic >= 1 and detail >= 1:
+        frame_tpl = create_arch_frame(
+            win_w, arch_h,
+            depth=p_frame + 0.5,                    # 0.5 mm overlap into wall
+            frame_thickness=1.5 if gothic >= 2 else 1.2,
+            segments=segments, name="_frame_tpl", shared=True
+        )
+    return cutter_tpl, frame_tpl
+
+
+def warm_window_templates(params):
+    """
+    Build the shared window templates a wall with params will use, so the
+    next generate_wall_segment call with that window size skips them.
+    """
+    wp   = WallParams.from_dict(params)
+    plan = plan_wall_segment(wp)
+    if not plan['windows']:
+        return
+    _, _, arch_h, win_w = plan['windows'][0]
+    for tpl in _window_templates(win_w, arch_h, wp.wall_thickness, wp.gothic_style,
+                                 wp.detail_level, plan['p_frame'],
+                                 plan['arch_segments']):
+        if tpl is not None:
+            delete_object(tpl)
+
+
+def _hood_bmesh(bm, cx, z, t, w_a, h_a, p_a, w_b, h_b, p_b):
+    """
+    Two-step hood as ONE closed shell: step A (w_a × h_a, protruding p_a)
+    with the wider, deeper step B on top.  Stacking two boxes instead would
+    leave coincident faces at the step for the union to resolve.
+    Both steps are flush with the wall back (Y = +t/2).
+    """
+    a, b   = w_a / 2, w_b / 2
+    ya, yc = -(t / 2 + p_a), -(t / 2 + p_b)
+    yb     = t / 2
+    z1, z2 = z + h_a, z + h_a + h_b
+
+    def v(x, y, zz):
+        return bm.verts.new((cx + x, y, zz))
+
+    a0 = [v(-a, ya, z),  v(a, ya, z),  v(a, yb, z),  v(-a, yb, z)]    # A bottom
+    a1 = [v(-a, ya, z1), v(a, ya, z1), v(a, yb, z1), v(-a, yb, z1)]   # A top
+    b1 = [v(-b, yc, z1), v(b, yc, z1), v(b, yb, z1), v(-b, yb, z1)]   # B bottom
+    b2 = [v(-b, yc, z2), v(b, yc, z2), v(b, yb, z2), v(-b, yb, z2)]   # B top
+
+    faces = [
+        bm.faces.new(a0),                                   # A bottom
+        bm.faces.new([a0[0], a0[1], a1[1], a1[0]]),         # A front
+        bm.faces.new([a0[1], a0[2], a1[2], a1[1]]),         # A right
+        bm.faces.new([a0[3], a0[0], a1[0], a1[3]]),         # A left
+        bm.faces.new(b2),                                   # B top
+        bm.faces.new([b1[0], b1[1], b2[1], b2[0]]),         # B front
+        bm.faces.new([b1[1], b1[2], b2[2], b2[1]]),         # B right
+        bm.faces.new([b1[3], b1[0], b2[0], b2[3]]),         # B left
+        # Underside of B around A's top: one U-shaped face
+        bm.faces.new([b1[0], b1[1], b1[2], a1[2], a1[1], a1[0], a1[3], b1[3]]),
+        # Back (Y = +t/2): one T-shaped face over both steps
+        bm.faces.new([a0[3], a0[2], a1[2], b1[2], b2[2], b2[3], b1[3], a1[3]]),
+    ]
+    bmesh.ops.recalc_face_normals(bm, faces=faces)
+
+
 # ── Skull reliefs ─────────────────────────────────────────────────────────────
 
-def _build_skulls(wall, win_positions, h, cornice_h, t):
+def _build_skulls(additive_parts, plan, t):
     """
     Skull reliefs centred in the spandrel above each arch.
 
     create_skull_relief convention: back face at local Y = 0, protrudes in –Y.
     Place at  Y = –(t/2 – overlap)  so the back face embeds 0.5 mm inside
     the wall front face (Y = –t/2), guaranteeing a solid boolean union.
+
+    The skull relief itself is boolean-heavy (eyes, nose, teeth), so one relief
+    is built per distinct size and copied to every spandrel.
+    plan: plan['skulls'], (cx, skull_z, skull_w, skull_h) tuples.
     """
     skull_overlap = 0.5        # mm the skull back face sits inside the wall
     skull_depth   = 1.8        # relief protrusion depth
 
-    for cx, win_btm, arch_h, _win_w in win_positions:
-        spandrel_z     = win_btm + arch_h
-        spandrel_avail = h - cornice_h - spandrel_z
-        if spandrel_avail < 5.0:
-            continue
-
-        skull_w = max(6.0, min(12.0, spandrel_avail * 0.9))
-        skull_h = min(skull_w * 1.2, spandrel_avail - 1.0)
-        if skull_h < 5.0:
-            continue
+    if not plan:
+        return
 
-        skull_z = spandrel_z + (spandrel_avail - skull_h) * 0.4
-        skull   = create_skull_relief(width=skull_w, height=skull_h,
-                                      depth=skull_depth, name="_skull")
+    templates = {}
+    for cx, skull_z, skull_w, skull_h in plan:
+        key = (skull_w, skull_h)
+        if key not in templates:
+            templates[key] = create_skull_relief(width=skull_w, height=skull_h,
+                                                 depth=skull_depth, name="_skull_tpl",
+                                                 shared=True)
         # back face (local Y=0) → world Y = –(t/2) + overlap (inside wall)
-        skull.location = Vector((cx, -(t / 2 - skull_overlap), skull_z))
-        _loc_xfm(skull)
-        boolean_union(wall, skull)
+        additive_parts.append(link_instance(templates[key],
+                                            (cx, -(t / 2 - skull_overlap), skull_z),
+                                            name="_skull"))
+    for tpl in templates.values():
+        delete_object(tpl)
 
 
 # ── Spandrel fill (gothic 1–2) ────────────────────────────────────────────────
 
-def _build_spandrel_fill(wall, win_positions, h, cornice_h, t, p_frame, gothic, detail):
+def _build_spandrel_fill(boxes_bm, recess_bm, win_positions, h, cornice_h,
+                         t, p_frame, gothic, detail):
     """
     Structural / decorative fill for the spandrel zone at gothic 1–2.
     (gothic >= 3 uses skull reliefs instead — handled separately.)
@@ -638,12 +961,10 @@ def _build_spandrel_fill(wall, win_positions, h, cornice_h, t, p_frame, gothic,
         # ── Lintel band (Level 2 — protrudes p_frame from wall) ──────────────
         lintel_h = min(2.0, spandrel_avail * 0.35)
         lintel_w = win_w + 3.0
-        lintel   = create_box_object(
-            lintel_w, lintel_h, t + p_frame,
+        create_box_bmesh(
+            boxes_bm, lintel_w, lintel_h, t + p_frame,
             location=(cx, -p_frame / 2, spandrel_z),
-            name="_lintel"
         )
-        boolean_union(wall, lintel)
 
         # ── Framed recessed panel filling the remaining spandrel (always) ─────
         # Outer frame box protrudes frame_p from wall (Level 2).
@@ -655,11 +976,10 @@ def _build_spandrel_fill(wall, win_positions, h, cornice_h, t, p_frame, gothic,
             panel_z  = spandrel_z + lintel_h + 0.5
             if panel_w >= 4.0 and panel_h >= 2.5:
                 frame_p   = p_frame * 0.6
-                frame_box = create_box_object(
-                    panel_w, panel_h, t + frame_p,
-                    location=(cx, -frame_p / 2, panel_z), name="_sp_frame"
+                create_box_bmesh(
+                    boxes_bm, panel_w, panel_h, t + frame_p,
+                    location=(cx, -frame_p / 2, panel_z),
                 )
-                boolean_union(wall, frame_box)
 
                 # Recessed interior (Level 1: 0.8 mm groove on frame face)
                 inner_margin = 1.2
@@ -669,40 +989,53 @@ def _build_spandrel_fill(wall, win_positions, h, cornice_h, t, p_frame, gothic,
                 if inner_w >= 3.0 and inner_h >= 1.5:
                     front_y = -(t / 2 + frame_p)
                     cut_y   = front_y + recess_d / 2
-                    cutter  = create_box_object(
-                        inner_w, inner_h, recess_d + 0.4,
+                    create_box_bmesh(
+                        recess_bm, inner_w, inner_h, recess_d + 0.4,
                         location=(cx, cut_y, panel_z + inner_margin),
-                        name="_sp_recess"
                     )
-                    boolean_difference(wall, cutter)
-
-
-# ── Rivets ────────────────────────────────────────────────────────────────────
 
-def _add_wall_rivets(wall, w, h, t):
-    """Rows of rivets at base and top band for industrial gothic flavour."""
-    y_pos = -(t / 2) - 0.1
-    positions = []
-    for rx in range(-int(w / 2) + 8, int(w / 2) - 5, 12):
-        positions.append(Vector((rx, y_pos, 6.0)))
-        positions.append(Vector((rx, y_pos, h - 6.0)))
-    add_rivets(wall, positions, rivet_radius=0.8, rivet_depth=0.8)
 
 
-# ── Bevel ─────────────────────────────────────────────────────────────────────
-
-def _apply_bevel(obj, width):
-    if width <= 0:
-        return
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    mod = obj.modifiers.new("Bevel", 'BEVEL')
-    mod.width = width
-    mod.segments = 1
-    mod.limit_method = 'ANGLE'
-    mod.angle_limit = math.radians(60)
-    try:
-        bpy.ops.object.modifier_apply(modifier=mod.name)
-    except RuntimeError:
-        if mod.name in [m.name for m in obj.modifiers]:
-            obj.modifiers.remove(mod)
+def _add_wall_rivets(wall, w, h, t, plinth_h, cornice_h, cuts=()):
+    """
+    Rows of rivets at base and top band for industrial gothic flavour.
+    A rivet (Z-up cylinder, 0.8 mm tall) that sits wholly inside the plinth
+    or cornice — both stand in front of the face — is buried, so skipped;
+    so is one that a damage cut (see plan_damage) removes whole.
+    """
+    depth, r  = 0.8, 0.8
+    positions = _compute_rivet_positions(w, h, t)
+    z         = positions[:, 2]
+    positions = positions[(z + depth > plinth_h) & (z < h - cornice_h)]
+    if cuts:
+        lo = positions - (r, depth / 2 + r, 0.0)
+        hi = positions + (r, r - depth / 2, depth)
+        positions = positions[[not damage_removes(cuts, a, b) for a, b in zip(lo, hi)]]
+    add_rivets(wall, positions, rivet_radius=0.8, rivet_depth=depth, solver='FAST')
+
+
+# ── Damage culling ───────────────────────────────────────────────────────────
+
+def _collected_bounds(wall, parts, boxes_bm):
+    """(min, max) of the slab plus every collected additive part and box."""
+    bounds = [world_bounds(wall)]
+    bounds += [world_bounds(p) for p in parts if isinstance(p, bpy.types.Object)]
+    if boxes_bm.verts:
+        co = np.array([v.co[:] for v in boxes_bm.verts])
+        bounds.append((co.min(axis=0), co.max(axis=0)))
+    bounds = [b for b in bounds if b is not None]
+    return (np.min([lo for lo, _ in bounds], axis=0),
+            np.max([hi for _, hi in bounds], axis=0))
+
+
+def _drop_swallowed(parts, cuts):
+    """parts without the objects some damage cut removes whole (deleted)."""
+    kept = []
+    for part in parts:
+        if isinstance(part, bpy.types.Object):
+            bounds = world_bounds(part)
+            if bounds is not None and damage_removes(cuts, *bounds):
+                delete_object(part)
+                continue
+        kept.append(part)
+    return kept
@@ -3,63 +3,107 @@ Operators for terrain40k addon.
 """
 
 import bpy
-from .generator.wall_segment import generate_wall_segment
+from .generator.wall_segment import generate_wall_segment, warm_window_templates
 from .generator.corner_ruin import generate_corner_ruin
 from .generator.pillar_cluster import generate_pillar_cluster
 
 
+# ── Generator dispatch ───────────────────────────────────────────────────────
+# Each generator with the params keys it reads.  Only those properties are
+# read, so a result-cache key never differs by a setting the generator
+# ignores (and the connector sizes drop out while connectors are off).
+_COMMON_PARAMS = (
+    'width', 'height', 'detail_level', 'gothic_style', 'damage_intensity',
+    'seed', 'connector_type', 'csg_engine',
+)
+_CONNECTOR_PARAMS = ('pin_tolerance', 'magnet_diameter', 'magnet_height')
+
+_GENERATORS = {
+    'WALL':   (generate_wall_segment, _COMMON_PARAMS + (
+        'wall_thickness', 'wall_style', 'window_density', 'mortar_width',
+        'damage_state', 'split_mode', 'bevel_width',
+        'magnet_diameter', 'magnet_height')),
+    'CORNER': (generate_corner_ruin, _COMMON_PARAMS + (
+        'depth', 'wall_thickness', 'window_density',
+        'split_mode') + _CONNECTOR_PARAMS),
+    'PILLAR': (generate_pillar_cluster, _COMMON_PARAMS + (
+        'depth',) + _CONNECTOR_PARAMS),
+}
+
+# Params keys stored under a different property name
+_PROP_NAMES = {'seed': 'random_seed'}
+
+
+def generator_params(module_type):
+    """Params keys the generator for module_type reads (empty if unknown)."""
+    entry = _GENERATORS.get(module_type)
+    return entry[1] if entry else ()
+
+
+def _read_params(props, keys):
+    """Params dict holding keys, read from the scene properties."""
+    if props.connector_type == 'NONE':
+        keys = [k for k in keys if k not in _CONNECTOR_PARAMS]
+    return {k: getattr(props, _PROP_NAMES.get(k, k)) for k in keys}
+
+
 class TERRAIN40K_OT_generate(bpy.types.Operator):
     """Generate a 40K terrain module based on current settings"""
     bl_idname = "terrain40k.generate"
     bl_label = "Generate Module"
     bl_options = {'REGISTER', 'UNDO'}
 
+    _timer = None
+
+    def invoke(self, context, event):
+        # The booleans can't be split across ticks, so the build still blocks
+        # the UI — but it starts one timer tick later, after the status bar
+        # has drawn, and Esc cancels it until then.
+        wm = context.window_manager
+        context.workspace.status_text_set(
+            f"Generating {context.scene.terrain40k.module_type.lower()}…  (Esc to cancel)")
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._end_modal(context)
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        self._end_modal(context)
+        return self.execute(context)
+
+    def _end_modal(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+
     def execute(self, context):
         props = context.scene.terrain40k
-        params = {
-            'width': props.width,
-            'height': props.height,
-            'depth': props.depth,
-            'wall_thickness': props.wall_thickness,
-            'floor_count': props.floor_count,
-            'wall_style': props.wall_style,
-            'window_density': props.window_density,
-            'detail_level': props.detail_level,
-            'gothic_style': props.gothic_style,
-            'mortar_width': props.mortar_width,
-            'damage_state': props.damage_state,
-            'damage_intensity': props.damage_intensity,
-            'seed': props.random_seed,
-            'connector_type': props.connector_type,
-            'split_mode': props.split_mode,
-            'bevel_width': props.bevel_width,
-            'pin_tolerance': props.pin_tolerance,
-            'magnet_diameter': props.magnet_diameter,
-            'magnet_height': props.magnet_height,
-        }
-
-        generators = {
-            'WALL': generate_wall_segment,
-            'CORNER': generate_corner_ruin,
-            'PILLAR': generate_pillar_cluster,
-        }
-
-        gen_func = generators.get(props.module_type)
-        if gen_func is None:
+        entry = _GENERATORS.get(props.module_type)
+        if entry is None:
             self.report({'ERROR'}, f"Unknown module type: {props.module_type}")
             return {'CANCELLED'}
-
-        # Set scene to millimeters if not already
-        scene = context.scene
-        if scene.unit_settings.length_unit != 'MILLIMETERS':
-            scene.unit_settings.length_unit = 'MILLIMETERS'
-            scene.unit_settings.scale_length = 0.001
-
-        # Clear previously generated objects if requested
+        gen_func, keys = entry
+        params = _read_params(props, keys)
+
+        # Set scene to millimeters if not already.  Each setting is only
+        # written when it differs: a unit write tags the whole scene.
+        units = context.scene.unit_settings
+        if units.length_unit != 'MILLIMETERS':
+            units.length_unit = 'MILLIMETERS'
+        if abs(units.scale_length - 0.001) > 1e-9:
+            units.scale_length = 0.001
+
+        # Clear previously generated objects if requested — in one batch,
+        # together with the meshes only they used (else every Generate
+        # would leave its old meshes behind as orphans)
         if props.auto_clear:
-            to_remove = [o for o in context.scene.objects if o.get('terrain40k')]
-            for o in to_remove:
-                bpy.data.objects.remove(o, do_unlink=True)
+            old    = [o for o in context.scene.objects if o.get('terrain40k')]
+            meshes = {o.data for o in old if o.type == 'MESH'}
+            bpy.data.batch_remove(old)
+            bpy.data.batch_remove([m for m in meshes if m.users == 0])
 
         try:
             results = gen_func(params)
@@ -77,13 +121,15 @@ class TERRAIN40K_OT_generate(bpy.types.Operator):
             for obj in results:
                 obj['terrain40k'] = True
 
-        # Select generated objects and zoom to them
-        bpy.ops.object.select_all(action='DESELECT')
+        # Select generated objects (deselecting only what is selected — no
+        # select_all walk over the scene) and optionally zoom to them
+        for obj in context.selected_objects:
+            obj.select_set(False)
         if results:
             for obj in results:
                 obj.select_set(True)
             context.view_layer.objects.active = results[0]
-            # Zoom viewport to selection
+        if results and props.zoom_on_generate:
             for area in context.screen.areas:
                 if area.type == 'VIEW_3D':
                     for region in area.regions:
@@ -111,11 +157,26 @@ class TERRAIN40K_OT_randomize_seed(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def _warm_templates():
+    """
+    One-shot timer: build the window templates for the scene's wall
+    settings, so the first Generate doesn't pay for them.  Runs after
+    register() because bpy.data is read-only while add-ons register.
+    """
+    props = getattr(bpy.context.scene, "terrain40k", None)
+    if props is not None and props.module_type == 'WALL':
+        warm_window_templates(_read_params(props, generator_params('WALL')))
+    return None
+
+
 def register():
     bpy.utils.register_class(TERRAIN40K_OT_generate)
     bpy.utils.register_class(TERRAIN40K_OT_randomize_seed)
+    bpy.app.timers.register(_warm_templates, first_interval=1.0)
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_warm_templates):
+        bpy.app.timers.unregister(_warm_templates)
     bpy.utils.unregister_class(TERRAIN40K_OT_randomize_seed)
     bpy.utils.unregister_class(TERRAIN40K_OT_generate)
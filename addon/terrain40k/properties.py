@@ -149,6 +149,17 @@ class Terrain40KProperties(bpy.types.PropertyGroup):
         default='AUTO',
         description="Auto-split large pieces for BambuLab A1 print bed",
     )
+    csg_engine: EnumProperty(
+        name="Boolean Engine",
+        items=[
+            ('BLENDER',  "Blender",  "Blender's Boolean modifier (always available)"),
+            ('MANIFOLD', "Manifold", "Manifold solver — much faster on many cutters. "
+                                     "Native on Blender 4.5+, else the manifold3d "
+                                     "library; falls back to Blender if neither"),
+        ],
+        default='BLENDER',
+        description="Solver used for every boolean of the generated module",
+    )
     bevel_width: FloatProperty(
         name="Bevel Width",
         default=0.0,
@@ -186,6 +197,11 @@ class Terrain40KProperties(bpy.types.PropertyGroup):
         default=True,
         description="Delete previously generated terrain objects before generating a new one",
     )
+    zoom_on_generate: BoolProperty(
+        name="Zoom to Result",
+        default=False,
+        description="Frame the generated objects in the 3D viewport after generating",
+    )
 
 
 def register():
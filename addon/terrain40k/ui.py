@@ -5,6 +5,8 @@ Sidebar panel in the N-key menu under category "40K Terrain".
 
 import bpy
 
+from .operators import generator_params
+
 
 class TERRAIN40K_PT_main_panel(bpy.types.Panel):
     bl_label = "40K Terrain Generator"
@@ -16,6 +18,12 @@ class TERRAIN40K_PT_main_panel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         props = context.scene.terrain40k
+        # Settings the selected generator ignores are not drawn at all
+        used = generator_params(props.module_type)
+
+        def prop(box, name, **kwargs):
+            if name in used:
+                box.prop(props, name, **kwargs)
 
         # Module type
         layout.prop(props, "module_type")
@@ -26,23 +34,22 @@ class TERRAIN40K_PT_main_panel(bpy.types.Panel):
         box.label(text="Dimensions (mm)", icon='ORIENTATION_LOCAL')
         box.prop(props, "width")
         box.prop(props, "height")
-        if props.module_type in ('CORNER', 'PILLAR'):
-            box.prop(props, "depth")
-        box.prop(props, "wall_thickness")
+        prop(box, "depth")
+        prop(box, "wall_thickness")
 
         # Style
         box = layout.box()
         box.label(text="Style", icon='SCULPTMODE_HLT')
-        box.prop(props, "wall_style")
+        prop(box, "wall_style")
         box.separator()
-        box.prop(props, "window_density")
+        prop(box, "window_density")
         box.prop(props, "detail_level")
         box.prop(props, "gothic_style")
-        box.prop(props, "mortar_width", slider=True)
-        box.prop(props, "damage_state")
-        if props.damage_state != 'CLEAN':
+        prop(box, "mortar_width", slider=True)
+        prop(box, "damage_state")
+        if 'damage_state' not in used or props.damage_state != 'CLEAN':
             box.prop(props, "damage_intensity", slider=True)
-        box.prop(props, "bevel_width")
+        prop(box, "bevel_width")
 
         # Seed
         box = layout.box()
@@ -56,18 +63,20 @@ class TERRAIN40K_PT_main_panel(bpy.types.Panel):
         box.label(text="Connectors", icon='LINKED')
         box.prop(props, "connector_type")
         if props.connector_type in ('PINS', 'BOTH'):
-            box.prop(props, "pin_tolerance")
+            prop(box, "pin_tolerance")
         if props.connector_type in ('MAGNETS', 'BOTH'):
-            box.prop(props, "magnet_diameter")
-            box.prop(props, "magnet_height")
+            prop(box, "magnet_diameter")
+            prop(box, "magnet_height")
 
         # Print
         box = layout.box()
         box.label(text="3D Print", icon='MOD_SOLIDIFY')
-        box.prop(props, "split_mode")
+        prop(box, "split_mode")
+        box.prop(props, "csg_engine")
 
         layout.separator()
         layout.prop(props, "auto_clear")
+        layout.prop(props, "zoom_on_generate")
         row = layout.row(align=True)
         row.scale_y = 2.0
         row.operator("terrain40k.generate", text="Generate Module", icon='MESH_CUBE')
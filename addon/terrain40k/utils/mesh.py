@@ -6,8 +6,29 @@ All geometry helpers assume 1 Blender Unit = 1 mm.
 
 import bpy
 import bmesh
+import contextlib
+import functools
+from collections import OrderedDict
 import math
-from mathutils import Vector
+import numpy as np
+from mathutils import Matrix, Vector
+
+# FAST solver overlap threshold (mm): faces closer than this count as coplanar
+FAST_OVERLAP_THRESHOLD = 0.001
+
+# solver='AUTO' picks FAST for operands up to this many faces (primitives)
+AUTO_FAST_MAX_FACES = 200
+
+# Distinct template meshes (boxes, arches, skulls …) kept per session
+TEMPLATE_CACHE_SIZE = 128
+
+# Boolean backend: 'BLENDER' (Boolean modifier) or 'MANIFOLD' — the Boolean
+# modifier's own Manifold solver on Blender 4.5+, else the manifold3d
+# package when it is importable; any failure falls back to BLENDER
+CSG_ENGINE = 'BLENDER'
+
+# Edges sharper than this get the edge bevel (same limit as the old modifier)
+BEVEL_ANGLE = math.radians(60)
 
 
 def create_object_from_bmesh(bm, name="TerrainPart"):
@@ -20,6 +41,58 @@ def create_object_from_bmesh(bm, name="TerrainPart"):
     return obj
 
 
+def _object_from_buffers(name, co, loop_vert, loop_start):
+    """
+    New linked object whose mesh is written straight from flat buffers:
+    co (3 floats per vertex), loop_vert (vertex per face corner) and
+    loop_start (first corner of each face).  One foreach_set per array.
+    """
+    mesh = bpy.data.meshes.new(name)
+    _write_buffers(mesh, co, loop_vert, loop_start)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _write_buffers(mesh, co, loop_vert, loop_start):
+    """Replace mesh's geometry with flat buffers (see _object_from_buffers)."""
+    mesh.clear_geometry()
+    mesh.vertices.add(len(co) // 3)
+    mesh.vertices.foreach_set("co", co)
+    mesh.loops.add(len(loop_vert))
+    mesh.loops.foreach_set("vertex_index", loop_vert)
+    mesh.polygons.add(len(loop_start))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    mesh.update(calc_edges=True)
+
+
+def _mesh_buffers(mesh):
+    """mesh as (co, loop_vert, loop_start) flat buffers — one foreach_get each."""
+    co         = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    loop_vert  = np.empty(len(mesh.loops),        dtype=np.int32)
+    loop_start = np.empty(len(mesh.polygons),     dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    return co, loop_vert, loop_start
+
+
+def _concat_meshes(mesh, others):
+    """
+    Append others' geometry to mesh as separate shells by concatenating
+    their buffers (indices offset per mesh) — no bmesh round-trip.
+    """
+    bufs = [_mesh_buffers(m) for m in (mesh, *others)]
+    vert_offsets = np.cumsum([0] + [len(co) // 3 for co, _, _ in bufs[:-1]])
+    loop_offsets = np.cumsum([0] + [len(lv) for _, lv, _ in bufs[:-1]])
+    _write_buffers(
+        mesh,
+        np.concatenate([co for co, _, _ in bufs]),
+        np.concatenate([lv + off for (_, lv, _), off in zip(bufs, vert_offsets)]).astype(np.int32),
+        np.concatenate([ls + off for (_, _, ls), off in zip(bufs, loop_offsets)]).astype(np.int32),
+    )
+
+
 def create_box_bmesh(bm, width, height, depth, location=(0, 0, 0)):
     """Create a solid box in an existing bmesh. Returns list of created verts."""
     ox, oy, oz = location
@@ -45,148 +118,712 @@ def create_box_bmesh(bm, width, height, depth, location=(0, 0, 0)):
     return verts
 
 
+def create_prism_bmesh(bm, profile, width, x=0.0):
+    """
+    Extrude a closed (y, z) profile along X into an existing bmesh, centred
+    on `x`.  The profile must run counter-clockwise seen from +X (Y right,
+    Z up) and have no repeated points.  Returns list of created verts.
+    """
+    hw    = width / 2
+    left  = [bm.verts.new((x - hw, y, z)) for y, z in profile]
+    right = [bm.verts.new((x + hw, y, z)) for y, z in profile]
+    bm.faces.new(right)                                   # +X cap
+    bm.faces.new(left[::-1])                              # –X cap
+    # Sides pair each ring with itself rotated by one — no per-face modulo
+    for l0, l1, r1, r0 in zip(left, left[1:] + left[:1], right[1:] + right[:1], right):
+        bm.faces.new((l0, l1, r1, r0))
+    return left + right
+
+
+# Box topology in create_box_bmesh's vertex order / winding (outward normals)
+_BOX_CORNERS = np.array([
+    (-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0),
+    (-0.5, -0.5, 1.0), (0.5, -0.5, 1.0), (0.5, 0.5, 1.0), (-0.5, 0.5, 1.0),
+], dtype=np.float32)
+_BOX_LOOP_VERT = np.array([
+    0, 3, 2, 1,   4, 5, 6, 7,   0, 1, 5, 4,
+    2, 3, 7, 6,   3, 0, 4, 7,   1, 2, 6, 5,
+], dtype=np.int32)
+_BOX_LOOP_START = np.arange(0, 24, 4, dtype=np.int32)
+
+
 def create_box_object(width, height, depth, location=(0, 0, 0), name="Box"):
-    """Create a standalone box object."""
+    """
+    Create a standalone box object.  The 8 corners are written straight into
+    a new mesh — no bmesh, no builder, no template cache entry per size.
+    """
+    co = _BOX_CORNERS * np.array((width, depth, height), dtype=np.float32)
+    co += np.asarray(location, dtype=np.float32)
+    return _object_from_buffers(name, co.ravel(), _BOX_LOOP_VERT, _BOX_LOOP_START)
+
+
+# ── Shared unit cube ─────────────────────────────────────────────────────────
+
+_UNIT_CUBE_MESH = None
+
+
+def _unit_cube():
+    """
+    Lazily created 1×1×1 box mesh shared by every create_box_object_fast
+    instance.  Same convention as create_box_bmesh: X/Y centred, Z = 0 → 1.
+    Tagged so delete_object never frees it; rebuilt after a file reload.
+    """
+    global _UNIT_CUBE_MESH
+    try:
+        if _UNIT_CUBE_MESH is not None:
+            _UNIT_CUBE_MESH.name    # raises ReferenceError once freed
+            return _UNIT_CUBE_MESH
+    except ReferenceError:
+        pass
     bm = bmesh.new()
-    create_box_bmesh(bm, width, height, depth, location)
+    create_box_bmesh(bm, 1.0, 1.0, 1.0)
     bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-    obj = create_object_from_bmesh(bm, name)
+    mesh = bpy.data.meshes.new("_unit_cube")
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh["terrain40k_shared"] = True
+    _UNIT_CUBE_MESH = mesh
+    return mesh
+
+
+def create_box_object_fast(width, height, depth, location=(0, 0, 0), name="Box"):
+    """
+    Box as an instance of the shared unit cube, sized through obj.scale.
+    Operand-only: boolean operands and *_many merges honour the object
+    transform, but the mesh is shared — never edit it, bake transforms
+    into it or use the object as a boolean target.
+    """
+    obj = bpy.data.objects.new(name, _unit_cube())
+    obj.scale    = (width, depth, height)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+# ── Template cache ───────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _template_buffers(builder, args):
+    """Build a template once and keep its raw vertex / face buffers."""
+    obj  = builder(*args)
+    mesh = obj.data
+    co         = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    loop_start = np.empty(len(mesh.polygons),     dtype=np.int32)
+    loop_vert  = np.empty(len(mesh.loops),        dtype=np.int32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+    delete_object(obj)
+    return co, loop_start, loop_vert
+
+
+def cached_template(builder, args, location=(0, 0, 0), name="Template"):
+    """
+    New object holding the mesh builder(*args) creates, rebuilt from cached
+    buffers instead of re-running the builder (and its booleans) every call.
+    builder must be deterministic and return an object at the origin.
+    Float args are rounded to 1 µm so equal sizes share one cache entry.
+    """
+    return instance_template(builder, args, [location], name)
+
+
+_SHARED_TEMPLATES = OrderedDict()
+
+
+def shared_template(builder, args, location=(0, 0, 0), name="Template"):
+    """
+    Operand-only object on a session-wide mesh for builder(*args): every
+    wall of a batch that needs the same arch / frame / pilaster links the
+    same datablock instead of getting its own copy.  Same rules as
+    create_box_object_fast — never edit the mesh or bake transforms into it.
+    Least recently used meshes beyond TEMPLATE_CACHE_SIZE are released.
+
+    The meshes carry no fake user, so they never end up in a saved .blend.
+    One freed by undo, a file reload or an orphan purge is rebuilt from the
+    _template_buffers cache — a foreach_set, not another builder run.
+    """
+    args = tuple(round(a, 3) if isinstance(a, float) else a for a in args)
+    key  = (builder, args)
+    mesh = _SHARED_TEMPLATES.get(key)
+    try:
+        if mesh is not None:
+            mesh.name           # raises ReferenceError once freed
+            _SHARED_TEMPLATES.move_to_end(key)
+    except ReferenceError:
+        mesh = None
+    if mesh is None:
+        tmp  = instance_template(builder, args, [(0, 0, 0)], name)
+        mesh = tmp.data
+        bpy.data.objects.remove(tmp, do_unlink=True)
+        mesh["terrain40k_shared"] = True
+        _SHARED_TEMPLATES[key] = mesh
+        if len(_SHARED_TEMPLATES) > TEMPLATE_CACHE_SIZE:
+            _release_shared(_SHARED_TEMPLATES.popitem(last=False)[1])
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
     return obj
 
 
+def _release_shared(mesh):
+    """Untag an evicted shared mesh so it is freed like any helper mesh."""
+    try:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        else:
+            del mesh["terrain40k_shared"]
+    except ReferenceError:
+        pass
+
+
+def instance_template(builder, args, offsets, name="Instances"):
+    """
+    One object holding a copy of the cached builder(*args) mesh at every
+    offset — offsets is a sequence of (x, y, z) or an (N, 3) array.
+    The copies are tiled with NumPy and written in a single foreach_set,
+    so N instances cost one mesh build, not N objects.
+    """
+    args = tuple(round(a, 3) if isinstance(a, float) else a for a in args)
+    co, loop_start, loop_vert = _template_buffers(builder, args)
+    offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+    n       = len(offsets)
+    n_verts = len(co) // 3
+    n_loops = len(loop_vert)
+
+    if n == 1 and not offsets.any():
+        all_co = co
+    else:
+        all_co = (co.reshape(1, -1, 3) + offsets[:, None, :]).ravel()
+    if n > 1:
+        k          = np.arange(n, dtype=np.int32)[:, None]
+        loop_vert  = (loop_vert[None, :]  + k * n_verts).ravel()
+        loop_start = (loop_start[None, :] + k * n_loops).ravel()
+
+    return _object_from_buffers(name, all_co, loop_vert, loop_start)
+
+
 def create_cylinder_object(radius, height, segments=16, location=(0, 0, 0), name="Cylinder"):
-    """Create a solid cylinder (capped top and bottom)."""
-    bm = bmesh.new()
+    """
+    Create a solid cylinder (capped top and bottom).  Like create_box_object
+    the rings are written straight into a new mesh — no bmesh — with the
+    winding fixed by _cylinder_topology, so no normal recalculation either.
+    """
     ox, oy, oz = location
-    # Bottom ring
-    bottom_verts = []
-    for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        x = ox + radius * math.cos(angle)
-        y = oy + radius * math.sin(angle)
-        bottom_verts.append(bm.verts.new((x, y, oz)))
-    # Top ring
-    top_verts = []
-    for i in range(segments):
-        angle = 2 * math.pi * i / segments
-        x = ox + radius * math.cos(angle)
-        y = oy + radius * math.sin(angle)
-        top_verts.append(bm.verts.new((x, y, oz + height)))
-    # Bottom cap
-    bm.faces.new(list(reversed(bottom_verts)))
-    # Top cap
-    bm.faces.new(top_verts)
-    # Side faces
-    for i in range(segments):
-        j = (i + 1) % segments
-        bm.faces.new([bottom_verts[i], bottom_verts[j], top_verts[j], top_verts[i]])
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-    obj = create_object_from_bmesh(bm, name)
-    return obj
+    angles = np.linspace(0.0, 2 * math.pi, segments, endpoint=False)
+    co = np.empty((2, segments, 3), dtype=np.float32)
+    co[:, :, 0] = ox + radius * np.cos(angles)
+    co[:, :, 1] = oy + radius * np.sin(angles)
+    co[0, :, 2] = oz
+    co[1, :, 2] = oz + height
+    return _object_from_buffers(name, co.ravel(), *_cylinder_topology(segments))
+
+
+@functools.lru_cache(maxsize=None)
+def _cylinder_topology(segments):
+    """
+    (loop_vert, loop_start) of a capped cylinder whose vertices are the
+    bottom ring [0, n) then the top ring [n, 2n), both counter-clockwise
+    seen from +Z.  Outward normals: bottom cap reversed, then top cap,
+    then one quad per side.
+    """
+    n    = segments
+    i    = np.arange(n, dtype=np.int32)
+    j    = (i + 1) % n
+    side = np.column_stack((i, j, n + j, n + i)).ravel()
+    loop_vert  = np.concatenate((i[::-1], n + i, side)).astype(np.int32)
+    loop_start = np.concatenate(([0, n], 2 * n + 4 * i)).astype(np.int32)
+    return loop_vert, loop_start
 
 
 def extrude_profile_to_solid(profile_points_xz, depth, offset_y=0.0, name="Profile"):
     """
     Take a list of (x, z) 2D points forming a closed profile,
     extrude along Y axis to create a watertight solid.
-    Points must be in order (CW or CCW, normals will be recalculated).
+    Points must be in order (CW or CCW — a CW profile is reversed, so the
+    faces are always wound with outward normals, no recalculation needed).
+    Written straight into a new mesh, like create_box_object.
     """
-    bm = bmesh.new()
-    n = len(profile_points_xz)
+    pts = np.asarray(profile_points_xz, dtype=np.float64)
+    x, z = pts[:, 0], pts[:, 1]
+    if np.dot(x, np.roll(z, -1)) < np.dot(np.roll(x, -1), z):   # CW in XZ
+        pts = pts[::-1]
+    n      = len(pts)
     half_d = depth / 2.0
-    front_verts = []
-    back_verts = []
-    for x, z in profile_points_xz:
-        front_verts.append(bm.verts.new((x, offset_y - half_d, z)))
-        back_verts.append(bm.verts.new((x, offset_y + half_d, z)))
-    # Front face
+    co = np.empty((2, n, 3), dtype=np.float32)
+    co[:, :, 0] = pts[:, 0]
+    co[0, :, 1] = offset_y - half_d             # front ring [0, n)
+    co[1, :, 1] = offset_y + half_d             # back ring [n, 2n)
+    co[:, :, 2] = pts[:, 1]
+
+    # Front face in profile order (normal –Y), back face reversed (+Y),
+    # then one quad per profile edge
+    i    = np.arange(n, dtype=np.int32)
+    j    = (i + 1) % n
+    side = np.column_stack((i, n + i, n + j, j)).ravel()
+    loop_vert  = np.concatenate((i, n + i[::-1], side)).astype(np.int32)
+    loop_start = np.concatenate(([0, n], 2 * n + 4 * i)).astype(np.int32)
+    return _object_from_buffers(name, co.ravel(), loop_vert, loop_start)
+
+
+def apply_modifier(obj, mod):
+    """
+    Bake a single modifier into obj's mesh without bpy.ops.
+
+    The object is evaluated through the depsgraph and the evaluated mesh is
+    swapped in for the original data; the modifier is always removed.
+    No operator dispatch, undo push or selection / active-object changes.
+    Returns False (mesh untouched) if evaluation produced no faces.
+    """
+    return apply_modifiers(obj, [mod])
+
+
+def apply_modifiers(obj, mods):
+    """
+    Bake several stacked modifiers in one depsgraph evaluation — one mesh
+    round-trip for the whole stack.  Same contract as apply_modifier.
+    """
     try:
-        bm.faces.new(front_verts)
-    except ValueError:
-        pass
-    # Back face (reversed)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        new_mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+    finally:
+        for mod in mods:
+            obj.modifiers.remove(mod)
+    old_mesh = obj.data
+    if len(old_mesh.polygons) and not len(new_mesh.polygons):
+        bpy.data.meshes.remove(new_mesh)
+        return False
+    mesh_name = old_mesh.name
+    obj.data = new_mesh
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    new_mesh.name = mesh_name
+    return True
+
+
+def object_matrix(obj):
+    """
+    obj's world matrix, current even right after its transform was set.
+    obj.matrix_world is only refreshed by a depsgraph evaluation, so a
+    helper placed through .location still reads as identity there.
+    Generator objects are never parented: for them it is matrix_basis,
+    which is rebuilt from location / rotation / scale on every read.
+    """
+    return obj.matrix_world if obj.parent is not None else obj.matrix_basis
+
+
+def world_bounds(obj):
+    """
+    (min, max) world-space corners of obj's vertices, or None if empty.
+    obj may also be a collected BMesh, whose coordinates are world space.
+    """
+    if isinstance(obj, bmesh.types.BMesh):
+        if not obj.verts:
+            return None
+        co = np.array([v.co[:] for v in obj.verts], dtype=np.float32)
+        return co.min(axis=0), co.max(axis=0)
+    mesh = obj.data
+    co   = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    if not len(co):
+        return None
+    mesh.vertices.foreach_get("co", co)
+    mw = np.array(object_matrix(obj), dtype=np.float32)
+    co = co.reshape(-1, 3) @ mw[:3, :3].T + mw[:3, 3]
+    return co.min(axis=0), co.max(axis=0)
+
+
+def _bbox_overlaps(a, b, eps=0.001):
+    """
+    True if the world AABBs of a and b intersect or touch (within eps).
+    Read from vertex data, not obj.bound_box, which can lag behind a mesh
+    just swapped in by apply_modifier.
+    """
+    ba, bb = world_bounds(a), world_bounds(b)
+    if ba is None or bb is None:
+        return False
+    return bool(np.all(ba[0] <= bb[1] + eps) and np.all(bb[0] <= ba[1] + eps))
+
+
+def _append_mesh(target, other):
+    """Add other's geometry to target's mesh as separate shells (no boolean)."""
+    mesh = other.data.copy()
+    mesh.transform(object_matrix(target).inverted() @ object_matrix(other))
+    _concat_meshes(target.data, [mesh])
+    bpy.data.meshes.remove(mesh)
+
+
+# ── Manifold backends ────────────────────────────────────────────────────────
+
+@contextlib.contextmanager
+def csg_engine(engine):
+    """Run the enclosed booleans with CSG_ENGINE = engine (None: unchanged)."""
+    global CSG_ENGINE
+    previous = CSG_ENGINE
+    if engine is not None:
+        CSG_ENGINE = engine
     try:
-        bm.faces.new(list(reversed(back_verts)))
-    except ValueError:
-        pass
-    # Side quads
-    for i in range(n):
-        j = (i + 1) % n
-        try:
-            bm.faces.new([front_verts[i], front_verts[j], back_verts[j], back_verts[i]])
-        except ValueError:
-            pass
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-    obj = create_object_from_bmesh(bm, name)
-    return obj
+        yield
+    finally:
+        CSG_ENGINE = previous
+
+
+@functools.lru_cache(maxsize=1)
+def _manifold3d():
+    """The manifold3d module, or None — it is not bundled with Blender."""
+    try:
+        import manifold3d
+    except ImportError:
+        return None
+    return manifold3d
+
 
+@functools.lru_cache(maxsize=1)
+def _native_manifold():
+    """True if the Boolean modifier offers the Manifold solver (Blender 4.5+)."""
+    solver = bpy.types.BooleanModifier.bl_rna.properties['solver']
+    return 'MANIFOLD' in solver.enum_items.keys()
 
-def boolean_operation(target, cutter, operation='DIFFERENCE', remove_cutter=True):
+
+def _modifier_solvers(solver):
     """
-    Apply a boolean modifier (EXACT solver) and clean up.
-    operation: 'DIFFERENCE', 'UNION', 'INTERSECT'
+    Boolean modifier solvers to try in turn for a requested solver: the
+    other classic solver is the fallback, and under CSG_ENGINE = 'MANIFOLD'
+    the native Manifold solver goes first where Blender has it.
+    """
+    solvers = ('FAST', 'EXACT') if solver == 'FAST' else ('EXACT', 'FAST')
+    if CSG_ENGINE == 'MANIFOLD' and _native_manifold():
+        solvers = ('MANIFOLD',) + solvers
+    return solvers
+
+
+def _use_manifold():
+    """True if booleans go through manifold3d (no native Manifold solver)."""
+    return (CSG_ENGINE == 'MANIFOLD' and not _native_manifold()
+            and _manifold3d() is not None)
+
+
+def _to_manifold(mesh, matrix=None):
+    """Triangulated mesh (optionally transformed) as a manifold3d.Manifold."""
+    m3d = _manifold3d()
+    mesh.calc_loop_triangles()
+    co   = np.empty(len(mesh.vertices) * 3,       dtype=np.float32)
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.uint32)
+    mesh.vertices.foreach_get("co", co)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    co = co.reshape(-1, 3)
+    if matrix is not None:
+        mw = np.array(matrix, dtype=np.float32)
+        co = co @ mw[:3, :3].T + mw[:3, 3]
+    m_mesh = m3d.Mesh(vert_properties=co, tri_verts=tris.reshape(-1, 3))
+    m_mesh.merge()
+    return m3d.Manifold(m_mesh)
+
+
+def _manifold_boolean(target, cutter, operation):
     """
-    if bpy.context.mode != 'OBJECT':
-        bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.select_all(action='DESELECT')
-    bpy.context.view_layer.objects.active = target
-    target.select_set(True)
+    target ∘ cutter with manifold3d, written back into target's mesh.
+    The cutter's shells are unioned first (they may overlap), like
+    use_self on the EXACT solver.  Returns False if either operand is not
+    a valid manifold, leaving target untouched.
+    """
+    m3d = _manifold3d()
+    a = _to_manifold(target.data)
+    b = _to_manifold(cutter.data,
+                     object_matrix(target).inverted() @ object_matrix(cutter))
+    if a.status() != m3d.Error.NoError or b.status() != m3d.Error.NoError:
+        return False
+    shells = b.decompose()
+    if len(shells) > 1:
+        b = m3d.Manifold.batch_boolean(shells, m3d.OpType.Add)
+    if operation == 'UNION':
+        out = a + b
+    elif operation == 'DIFFERENCE':
+        out = a - b
+    else:
+        out = a ^ b
+    result = out.to_mesh()
+    co     = np.ascontiguousarray(result.vert_properties[:, :3], dtype=np.float32)
+    tris   = np.ascontiguousarray(result.tri_verts, dtype=np.int32)
+    if len(target.data.polygons) and not len(tris):
+        return False
+
+    _write_buffers(target.data, co.ravel(), tris.ravel(),
+                   np.arange(0, tris.size, 3, dtype=np.int32))
+    return True
 
+
+def _resolve_solver(solver, operand_mesh, self_intersect=False):
+    """
+    'AUTO' → FAST for a small single-shell operand, EXACT otherwise (FAST
+    cannot resolve operands that overlap themselves).  Other values pass.
+    """
+    if solver != 'AUTO':
+        return solver
+    if self_intersect or len(operand_mesh.polygons) > AUTO_FAST_MAX_FACES:
+        return 'EXACT'
+    return 'FAST'
+
+
+def _add_boolean(target, operand, operation, solver, self_intersect=False):
+    """Add (not apply) a Boolean modifier with the addon's solver settings."""
     mod = target.modifiers.new(name="Bool_" + operation[:4], type='BOOLEAN')
     mod.operation = operation
-    mod.solver = 'EXACT'
-    mod.object = cutter
+    mod.solver = solver
+    if solver == 'EXACT':
+        mod.use_self = self_intersect
+    if solver == 'FAST':
+        # Operands are often flush with the target (coplanar faces)
+        mod.double_threshold = FAST_OVERLAP_THRESHOLD
+    mod.object = operand
+    return mod
+
+
+def boolean_operation(target, cutter, operation='DIFFERENCE', remove_cutter=True,
+                      solver='EXACT', self_intersect=False):
+    """
+    Apply a boolean modifier and clean up.
+    operation: 'DIFFERENCE', 'UNION', 'INTERSECT'
+    solver:    'EXACT' (robust, slow), 'FAST' (~10× faster, fine for
+               axis-aligned box operands) or 'AUTO' (FAST for operands up
+               to AUTO_FAST_MAX_FACES faces).  The other solver is tried if
+               the requested one fails.
+    self_intersect: set when the cutter is several overlapping shells
+               joined into one mesh (EXACT solver only).
+
+    cutter may be an Object or a BMesh.  A BMesh is left untouched (the
+    caller frees it); the modifier still needs an Object operand, so it is
+    wrapped in a short-lived one that is always removed.
+
+    Operands whose bounding box misses the target skip the solver: a
+    difference is a no-op and a union is a plain mesh append.
+    With CSG_ENGINE = 'MANIFOLD' the Manifold solver (native on Blender 4.5+,
+    else manifold3d) is tried first.
+    """
+    if isinstance(cutter, bmesh.types.BMesh):
+        mesh = bpy.data.meshes.new("_operand")
+        cutter.to_mesh(mesh)
+        cutter = bpy.data.objects.new("_operand", mesh)
+        bpy.context.collection.objects.link(cutter)
+        remove_cutter = True
+
     # Hide cutter from viewport to avoid visual clutter
     cutter.hide_set(True)
 
+    solver  = _resolve_solver(solver, cutter.data, self_intersect)
+    solvers = _modifier_solvers(solver)
     try:
-        try:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
-        except RuntimeError:
-            # Fallback: try FAST solver if EXACT fails
-            if mod.name in [m.name for m in target.modifiers]:
-                target.modifiers.remove(mod)
-            mod2 = target.modifiers.new(name="Bool_FAST", type='BOOLEAN')
-            mod2.operation = operation
-            mod2.solver = 'FAST'
-            mod2.object = cutter
+        if operation != 'INTERSECT' and not _bbox_overlaps(target, cutter):
+            if operation == 'UNION':
+                _append_mesh(target, cutter)
+            return
+        if _use_manifold():
             try:
-                bpy.ops.object.modifier_apply(modifier=mod2.name)
-            except RuntimeError:
-                if mod2.name in [m.name for m in target.modifiers]:
-                    target.modifiers.remove(mod2)
+                if _manifold_boolean(target, cutter, operation):
+                    return
+            except Exception:
+                pass            # fall back to the Blender solvers below
+        for sol in solvers:
+            mod = _add_boolean(target, cutter, operation, sol, self_intersect)
+            if apply_modifier(target, mod):
+                break
     finally:
         # Always remove cutter — even if a non-RuntimeError exception occurs
         if remove_cutter:
             try:
-                bpy.data.objects.remove(cutter, do_unlink=True)
+                delete_object(cutter)
             except Exception:
                 pass
 
 
-def boolean_difference(target, cutter, remove_cutter=True):
-    boolean_operation(target, cutter, 'DIFFERENCE', remove_cutter)
+def boolean_difference(target, cutter, remove_cutter=True, solver='EXACT',
+                       self_intersect=False):
+    boolean_operation(target, cutter, 'DIFFERENCE', remove_cutter, solver, self_intersect)
+
 
+def boolean_union(target, other, remove_other=True, solver='EXACT'):
+    boolean_operation(target, other, 'UNION', remove_other, solver)
 
-def boolean_union(target, other, remove_other=True):
-    boolean_operation(target, other, 'UNION', remove_other)
+
+def _local_meshes(target, parts):
+    """
+    Each part (Object or BMesh) as a temporary Mesh in target's local space.
+    Consumes the parts: objects are deleted, BMeshes freed.  The caller
+    removes the returned meshes.
+    """
+    to_local = object_matrix(target).inverted()
+    meshes = []
+    for part in parts:
+        if isinstance(part, bmesh.types.BMesh):
+            mesh = bpy.data.meshes.new("_merge")
+            part.to_mesh(mesh)
+            part.free()
+        else:
+            mesh = part.data.copy()
+            mesh.transform(to_local @ object_matrix(part))
+            delete_object(part)
+        meshes.append(mesh)
+    return meshes
+
+
+def _mesh_bounds(mesh):
+    """(min, max) local-space corners of mesh's vertices, or None if empty."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    if not len(co):
+        return None
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    return co.min(axis=0), co.max(axis=0)
+
+
+def _bounds_touch(a, b, eps=0.001):
+    if a is None or b is None:
+        return False
+    return bool(np.all(a[0] <= b[1] + eps) and np.all(b[0] <= a[1] + eps))
+
+
+def _meshes_to_bmesh(meshes):
+    """Concatenate meshes into one BMesh and remove them."""
+    bm = bmesh.new()
+    for mesh in meshes:
+        bm.from_mesh(mesh)
+        bpy.data.meshes.remove(mesh)
+    return bm
+
+
+def _merge_operands(target, parts):
+    """
+    Concatenate parts (Objects or BMeshes) into one BMesh in target's local
+    space.  Consumes the parts: objects are deleted, BMeshes freed.
+    """
+    return _meshes_to_bmesh(_local_meshes(target, parts))
+
+
+def boolean_union_many(target, parts, solver='EXACT'):
+    """
+    Union every part with target in ONE boolean.
+    Parts that touch neither the target nor any other part (by bounding
+    box) are plain mesh appends and skip the solver.  The rest go through
+    one union, in self-intersect mode only if two of them overlap.
+    """
+    if not parts:
+        return
+    meshes = _local_meshes(target, parts)
+    bounds = [_mesh_bounds(m) for m in meshes]
+    own    = _mesh_bounds(target.data)
+    touch  = [[_bounds_touch(a, b) for b in bounds] for a in bounds]
+
+    csg, loose = [], []
+    for i in range(len(meshes)):
+        isolated = (not _bounds_touch(own, bounds[i])
+                    and not any(touch[i][j] for j in range(len(meshes)) if j != i))
+        (loose if isolated else csg).append(i)
+
+    if csg:
+        self_intersect = any(touch[i][j] for i in csg for j in csg if i < j)
+        bm = _meshes_to_bmesh([meshes[i] for i in csg])
+        try:
+            boolean_operation(target, bm, 'UNION', solver=solver,
+                              self_intersect=self_intersect)
+        finally:
+            bm.free()
+    if loose:
+        _concat_meshes(target.data, [meshes[i] for i in loose])
+        for i in loose:
+            bpy.data.meshes.remove(meshes[i])
+
+
+def boolean_difference_many(target, cutters, solver='EXACT', self_intersect=False):
+    """
+    Cut every cutter from target in ONE boolean.
+    Pass self_intersect=True if the cutters overlap each other.
+    """
+    if not cutters:
+        return
+    bm = _merge_operands(target, cutters)
+    try:
+        boolean_operation(target, bm, 'DIFFERENCE', solver=solver,
+                          self_intersect=self_intersect)
+    finally:
+        bm.free()
+
+
+def boolean_chain(target, steps):
+    """
+    Several batched booleans evaluated as ONE modifier stack.
+    steps: (operation, parts, solver, self_intersect) tuples, applied in
+    order; parts are merged per step as in boolean_difference_many and are
+    consumed.  The whole stack is baked in a single depsgraph pass, so the
+    target mesh is round-tripped once instead of once per step.  If the
+    stacked result is empty, the steps are re-run one boolean at a time
+    (with the usual solver fallback).
+    """
+    if _use_manifold():
+        # manifold3d has no modifier stack to share — one boolean per step
+        for operation, parts, solver, self_intersect in steps:
+            if parts:
+                bm = _merge_operands(target, parts)
+                try:
+                    boolean_operation(target, bm, operation, solver=solver,
+                                      self_intersect=self_intersect)
+                finally:
+                    bm.free()
+        return
+
+    operands = []
+    try:
+        for operation, parts, solver, self_intersect in steps:
+            if not parts:
+                continue
+            bm   = _merge_operands(target, parts)
+            mesh = bpy.data.meshes.new("_operand")
+            bm.to_mesh(mesh)
+            bm.free()
+            solver = _resolve_solver(solver, mesh, self_intersect)
+            obj = bpy.data.objects.new("_operand", mesh)
+            obj.matrix_basis = object_matrix(target)
+            bpy.context.collection.objects.link(obj)
+            obj.hide_set(True)
+            operands.append((operation, obj, solver, self_intersect))
+        if not operands:
+            return
+
+        mods = [_add_boolean(target, obj, operation, _modifier_solvers(solver)[0],
+                             self_intersect)
+                for operation, obj, solver, self_intersect in operands]
+        if not apply_modifiers(target, mods):
+            for operation, obj, solver, self_intersect in operands:
+                boolean_operation(target, obj, operation, remove_cutter=False,
+                                  solver=solver, self_intersect=self_intersect)
+    finally:
+        for _, obj, _, _ in operands:
+            delete_object(obj)
 
 
 def cleanup_mesh(obj):
     """
     Full mesh cleanup: remove doubles, recalc normals, apply transforms.
-    Call this on every final output mesh.
+    Call this on every final output mesh — exactly once: generators skip it
+    on a wall that gets split, since split_for_print cleans every part it
+    returns (the parts' cut seams need the merge pass anyway).
+
+    Rotation / scale are baked in the same bmesh pass (the equivalent of
+    transform_apply(rotation=True, scale=True)), so cleaning each split
+    part costs no operator call or selection change.
+
+    All steps share one BMesh round-trip.  Merging comes first: normals are
+    made consistent per connected region, so seams must be welded before
+    the recalculation for a split part to come out as one oriented shell.
     """
     if obj is None or obj.type != 'MESH':
         return
-    # Apply transforms
-    bpy.ops.object.select_all(action='DESELECT')
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
+    rot_scale = obj.matrix_basis.to_3x3()
     # BMesh cleanup
     bm = bmesh.new()
     bm.from_mesh(obj.data)
+    # Apply transforms
+    if rot_scale != Matrix.Identity(3):
+        bmesh.ops.transform(bm, matrix=rot_scale.to_4x4(), verts=bm.verts)
+        obj.matrix_basis = Matrix.Translation(obj.matrix_basis.translation)
     # Merge by distance (remove doubles) - 0.01mm tolerance
     bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=0.01)
     # Recalculate normals
@@ -198,18 +835,79 @@ def cleanup_mesh(obj):
     obj.data.update()
 
 
+def dissolve_coplanar(obj, angle_limit=math.radians(0.1)):
+    """
+    Merge the coplanar face fragments a boolean leaves behind into n-gons.
+    Same surface, far fewer faces for the next boolean / bevel to process.
+    """
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bmesh.ops.dissolve_limit(bm, angle_limit=angle_limit,
+                             verts=bm.verts[:], edges=bm.edges[:])
+    bm.to_mesh(obj.data)
+    bm.free()
+    obj.data.update()
+
+
+def bevel_sharp_edges(obj, width, angle=BEVEL_ANGLE):
+    """
+    One-segment bevel on edges sharper than angle — same result as an
+    angle-limited Bevel modifier, but run as a bmesh op on the mesh data
+    (no modifier stack evaluation, no operator / undo push).  Cheaper than
+    a Bevel modifier baked with apply_modifier too: that path still
+    evaluates the object and allocates a second mesh datablock.
+    """
+    if width <= 0:
+        return
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    # Edges without exactly two faces report the 0.0 fallback: a leftover
+    # boundary or non-manifold edge is never beveled into a broken shell
+    edges = [e for e in bm.edges if e.calc_face_angle(0.0) > angle]
+    if edges:
+        bmesh.ops.bevel(bm, geom=edges, offset=width, offset_type='OFFSET',
+                        segments=1, profile=0.5, affect='EDGES',
+                        clamp_overlap=True)
+        bm.to_mesh(obj.data)
+    bm.free()
+
+
+def link_instance(obj, location=(0, 0, 0), name=None):
+    """
+    Linked duplicate of obj: a new object sharing obj's mesh datablock,
+    placed through obj.location.  Operand-only, like create_box_object_fast
+    — boolean operands and *_many merges honour the transform, but the
+    shared mesh must never be edited in place.
+    """
+    dup = bpy.data.objects.new(name or obj.name, obj.data)
+    dup.location = location
+    bpy.context.collection.objects.link(dup)
+    return dup
+
+
+def delete_object(obj):
+    """Remove a helper object together with its mesh (if nothing else uses it)."""
+    mesh = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh is not None and mesh.users == 0 and not mesh.get("terrain40k_shared"):
+        bpy.data.meshes.remove(mesh)
+
+
 def join_objects(objects, name="Joined"):
-    """Join multiple objects into one. Returns the joined object."""
+    """
+    Join multiple objects into one. Returns the joined object.
+    Geometry is appended to the first object's mesh by buffer concatenation
+    (_concat_meshes) — no join operator, no bmesh, no selection / active-
+    object changes.  The rest may also be BMeshes (see _local_meshes) and
+    are consumed.
+    """
     if not objects:
         return None
-    if len(objects) == 1:
-        objects[0].name = name
-        return objects[0]
-    bpy.ops.object.select_all(action='DESELECT')
-    for o in objects:
-        o.select_set(True)
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
-    result = bpy.context.active_object
+    result = objects[0]
+    if len(objects) > 1:
+        meshes = _local_meshes(result, objects[1:])
+        _concat_meshes(result.data, meshes)
+        for mesh in meshes:
+            bpy.data.meshes.remove(mesh)
     result.name = name
     return result
@@ -15,13 +15,17 @@ Usage:
 
 import argparse
 import ast
+import functools
 import json
 import os
 import py_compile
 import re
 import subprocess
 import sys
+import time
 import zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -32,6 +36,7 @@ ADDON_DIR = REPO_ROOT / "addon" / "terrain40k"
 STATE_FILE = REPO_ROOT / "docs" / "PROJECT_STATE.md"
 CHANGELOG = REPO_ROOT / "CHANGELOG.md"
 CONFIG_FILE = Path(__file__).resolve().parent / ".devtracker.json"
+STATUS_CACHE = Path(__file__).resolve().parent / ".devtracker_status.json"
 DEFAULT_REPO = "H9Lelouch/terrain40k"
 
 LABEL_MAP = {"bug": "bug", "feat": "enhancement", "task": "task"}
@@ -81,6 +86,40 @@ TASK_BODY = """\
 
 BODY_TEMPLATES = {"bug": BUG_BODY, "feat": FEAT_BODY, "task": TASK_BODY}
 
+# Everything `status` shows from GitHub, in one round-trip. Label counts are
+# totalCounts, so they are exact however many issues are open.
+STATUS_QUERY = """\
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    open: issues(states: OPEN) { totalCount }
+    bug: issues(states: OPEN, labels: ["bug"]) { totalCount }
+    enhancement: issues(states: OPEN, labels: ["enhancement"]) { totalCount }
+    task: issues(states: OPEN, labels: ["task"]) { totalCount }
+    labelled: issues(states: OPEN, labels: ["bug", "enhancement", "task"]) {
+      totalCount
+    }
+    milestones(first: 5, states: OPEN,
+               orderBy: {field: DUE_DATE, direction: ASC}) {
+      nodes {
+        title
+        open: issues(states: OPEN) { totalCount }
+        closed: issues(states: CLOSED) { totalCount }
+      }
+    }
+  }
+}
+"""
+STATUS_TTL = 60  # seconds a fetched status is reused by repeat `status` runs
+
+# ── Patterns (compiled once; the sync / validate loops reuse them) ─────────
+
+RE_CHECKBOX = re.compile(r"- \[(.?)\]")
+RE_UNCHECKED = re.compile(r"^[^\S\n]*- \[ \]", re.MULTILINE)
+RE_TAG = re.compile(r"\[.*?\]")
+RE_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+RE_TODO = re.compile(r"\b(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
+RE_BL_VERSION = re.compile(rb"""["']version["']\s*:\s*\(([\d\s,]+)\)""")
+
 
 # ── Error handling ─────────────────────────────────────────────────────────
 
@@ -167,14 +206,54 @@ def save_config(cfg):
         json.dump(cfg, f, indent=2)
 
 
+def fetch_status(repo):
+    """STATUS_QUERY result for repo, cached on disk for STATUS_TTL seconds."""
+    now = time.time()
+    try:
+        cached = json.loads(STATUS_CACHE.read_text(encoding="utf-8"))
+        if cached["repo"] == repo and now - cached["time"] < STATUS_TTL:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+    owner, name = repo.split("/", 1)
+    data = gh_run([
+        "api", "graphql", "-f", f"query={STATUS_QUERY}",
+        "-f", f"owner={owner}", "-f", f"name={name}",
+    ])["data"]["repository"]
+    STATUS_CACHE.write_text(
+        json.dumps({"repo": repo, "time": now, "data": data}), encoding="utf-8"
+    )
+    return data
+
+
+def drop_status_cache():
+    """Forget the cached status after a command changes issues/milestones."""
+    STATUS_CACHE.unlink(missing_ok=True)
+
+
 def get_bl_info_version():
     """Extract version string from bl_info in __init__.py."""
     init_path = ADDON_DIR / "__init__.py"
     if not init_path.exists():
         return None
-    with open(init_path, encoding="utf-8") as f:
-        tree = ast.parse(f.read())
-    for node in ast.walk(tree):
+    # Keyed by mtime: re-parsed only when the file changed
+    return _parse_bl_info_version(str(init_path), init_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_bl_info_version(path, mtime_ns):
+    with open(path, "rb") as f:
+        data = f.read()
+    # The "version": (x, y, z) literal inside bl_info, found without parsing
+    start = data.find(b"bl_info")
+    m = RE_BL_VERSION.search(data, start) if start >= 0 else None
+    if m:
+        parts = [p.strip() for p in m.group(1).split(b",")]
+        return ".".join(p.decode() for p in parts if p)
+    # Unusual layout: fall back to the AST
+    tree = ast.parse(data)
+    # bl_info is a module-level assignment: no need to walk nested bodies
+    for node in tree.body:
         if isinstance(node, ast.Assign):
             for target in node.targets:
                 if isinstance(target, ast.Name) and target.id == "bl_info":
@@ -189,6 +268,7 @@ def get_bl_info_version():
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_last_commit():
     result = subprocess.run(
         ["git", "log", "-1", "--format=%H|%s|%ci"],
@@ -208,11 +288,11 @@ def get_last_commit():
 
 def count_checkboxes(text):
     """Returns (checked, total) from markdown checkboxes."""
-    total = len(re.findall(r"- \[.?\]", text))
-    checked = len(re.findall(r"- \[x\]", text, re.IGNORECASE))
-    return checked, total
+    marks = RE_CHECKBOX.findall(text)
+    return sum(1 for m in marks if m in ("x", "X")), len(marks)
 
 
+@functools.lru_cache(maxsize=1)
 def get_latest_tag():
     result = subprocess.run(
         ["git", "describe", "--tags", "--abbrev=0"],
@@ -244,24 +324,17 @@ def cmd_status(args):
 
     # Open issues by label
     try:
-        issues = gh_run([
-            "issue", "list", "--repo", repo, "--state", "open",
-            "--json", "number,title,labels", "--limit", "200",
-        ])
+        gh_status = fetch_status(repo)
     except DevTrackerError as e:
         print(yellow(f"Could not fetch issues: {e}"))
-        issues = []
+        gh_status = None
 
     label_counts = {"bug": 0, "enhancement": 0, "task": 0, "other": 0}
-    for issue in issues:
-        labels = [lb["name"] for lb in issue.get("labels", [])]
-        matched = False
-        for lbl in labels:
-            if lbl in label_counts:
-                label_counts[lbl] += 1
-                matched = True
-        if not matched:
-            label_counts["other"] += 1
+    if gh_status:
+        for lbl in ("bug", "enhancement", "task"):
+            label_counts[lbl] = gh_status[lbl]["totalCount"]
+        label_counts["other"] = (gh_status["open"]["totalCount"]
+                                 - gh_status["labelled"]["totalCount"])
 
     print(bold("Open Issues"))
     for lbl, cnt in label_counts.items():
@@ -273,23 +346,20 @@ def cmd_status(args):
     print()
 
     # Milestones
-    try:
-        milestones = gh_run(["api", f"repos/{repo}/milestones"])
-        if milestones:
-            print(bold("Milestones"))
-            for ms in milestones[:5]:
-                title = ms["title"]
-                opn = ms["open_issues"]
-                closed = ms["closed_issues"]
-                total = opn + closed
-                pct = int(closed / total * 100) if total > 0 else 0
-                bar_len = 20
-                filled = int(bar_len * pct / 100)
-                bar = "#" * filled + "-" * (bar_len - filled)
-                print(f"  {title:<12} [{bar}] {closed}/{total} ({pct}%)")
-            print()
-    except DevTrackerError:
-        pass
+    milestones = gh_status["milestones"]["nodes"] if gh_status else []
+    if milestones:
+        print(bold("Milestones"))
+        for ms in milestones:
+            title = ms["title"]
+            opn = ms["open"]["totalCount"]
+            closed = ms["closed"]["totalCount"]
+            total = opn + closed
+            pct = int(closed / total * 100) if total > 0 else 0
+            bar_len = 20
+            filled = int(bar_len * pct / 100)
+            bar = "#" * filled + "-" * (bar_len - filled)
+            print(f"  {title:<12} [{bar}] {closed}/{total} ({pct}%)")
+        print()
 
     # Feature completion from PROJECT_STATE
     if STATE_FILE.exists():
@@ -362,6 +432,7 @@ def cmd_add(args):
         cmd.extend(["--milestone", cfg["default_milestone"]])
 
     result = gh_run(cmd, json_output=False)
+    drop_status_cache()
     print(green(f"Created issue: {result}"))
 
 
@@ -391,6 +462,7 @@ def cmd_close(args):
         ["issue", "close", str(args.number), "--repo", repo],
         json_output=False,
     )
+    drop_status_cache()
     print(green(f"Closed #{args.number}: {title}"))
 
 
@@ -494,35 +566,77 @@ def _update_roadmap_checkboxes(content, closed_feats):
     """Update - [ ] lines in roadmap if matching closed feature issues."""
     changes = []
     closed_titles = [_normalize(f["title"]) for f in closed_feats]
-    closed_words_list = [set(t.split()) for t in closed_titles]
-
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if re.match(r"\s*- \[ \]", line):
-            line_norm = _normalize(line)
-            line_words = set(line_norm.split())
-            for j, feat_words in enumerate(closed_words_list):
-                overlap = line_words & feat_words
-                # Match if 3+ meaningful words overlap or substring match
-                meaningful = {w for w in overlap if len(w) > 2}
-                if len(meaningful) >= 3 or closed_titles[j] in line_norm:
-                    lines[i] = line.replace("- [ ]", "- [x]", 1)
-                    changes.append(
-                        f"Checked: {line.strip()[:60]} "
-                        f"(matched #{closed_feats[j]['number']})"
-                    )
-                    break
-    return "\n".join(lines), changes
+
+    # Inverted index: meaningful word (3+ chars) -> features whose title has
+    # it, so a line only meets the features it shares words with
+    feats_by_word = defaultdict(list)
+    for j, title in enumerate(closed_titles):
+        for w in set(title.split()):
+            if len(w) > 2:
+                feats_by_word[w].append(j)
+
+    # One regex pass finds the unchecked lines; the output is stitched from
+    # the untouched spans in between
+    parts = []
+    pos = 0
+    for m in RE_UNCHECKED.finditer(content):
+        start = m.start()
+        end = content.find("\n", start)
+        if end < 0:
+            end = len(content)
+        line = content[start:end]
+        line_norm = _normalize(line)
+        overlap = Counter(
+            j for w in set(line_norm.split()) for j in feats_by_word.get(w, ())
+        )
+        # Match if 3+ meaningful words overlap or substring match;
+        # the first matching feature wins
+        matched = [j for j, n in overlap.items() if n >= 3]
+        matched += [j for j, t in enumerate(closed_titles) if t in line_norm]
+        if matched:
+            j = min(matched)
+            parts.append(content[pos:start])
+            parts.append(line.replace("- [ ]", "- [x]", 1))
+            pos = end
+            changes.append(
+                f"Checked: {line.strip()[:60]} "
+                f"(matched #{closed_feats[j]['number']})"
+            )
+    parts.append(content[pos:])
+    return "".join(parts), changes
 
 
 def _normalize(text):
     """Lowercase, strip markdown/punctuation, collapse whitespace."""
     text = text.lower()
-    text = re.sub(r"\[.*?\]", "", text)  # remove [BUG] [FEAT] etc
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    text = RE_TAG.sub("", text)  # remove [BUG] [FEAT] etc
+    text = RE_NON_ALNUM.sub(" ", text)
     return " ".join(text.split())
 
 
+def _validate_file(pf):
+    """Compile error (or None) and TODO lines for one file, read once."""
+    try:
+        source = pf.read_bytes()
+    except OSError:
+        return None, []
+    error = None
+    try:
+        # compile() on the bytes read here; py_compile would re-read the
+        # file and write a .pyc next to it
+        compile(source, str(pf), "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        error = str(py_compile.PyCompileError(type(e), e, str(pf)))
+    rel = pf.relative_to(REPO_ROOT)
+    todos = [
+        f"  {str(rel)}:{line_num}  {line.strip()}"
+        for line_num, line in enumerate(
+            source.decode("utf-8", errors="replace").splitlines(), 1)
+        if RE_TODO.search(line)
+    ]
+    return error, todos
+
+
 def cmd_validate(args):
     print(bold("VALIDATE terrain40k"))
     ok_count = 0
@@ -547,14 +661,11 @@ def cmd_validate(args):
         print(f"  {red('[FAIL]')} Could not parse bl_info version")
         fail_count += 1
 
-    # 2) Python compile check
-    py_files = list(ADDON_DIR.rglob("*.py"))
-    compile_errors = []
-    for pf in py_files:
-        try:
-            py_compile.compile(str(pf), doraise=True)
-        except py_compile.PyCompileError as e:
-            compile_errors.append(str(e))
+    # 2) Python compile check (the TODO scan of step 4 shares the same read)
+    py_files = sorted(ADDON_DIR.rglob("*.py"))
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = list(ex.map(_validate_file, py_files))
+    compile_errors = [err for err, _ in results if err]
     if compile_errors:
         print(f"  {red('[FAIL]')} {len(compile_errors)} file(s) have syntax errors:")
         for err in compile_errors:
@@ -579,16 +690,7 @@ def cmd_validate(args):
         warn_count += 1
 
     # 4) TODO/FIXME scan
-    todos = []
-    for pf in py_files:
-        try:
-            lines = pf.read_text(encoding="utf-8", errors="replace").splitlines()
-        except Exception:
-            continue
-        for line_num, line in enumerate(lines, 1):
-            if re.search(r"\b(TODO|FIXME|HACK|XXX)\b", line, re.IGNORECASE):
-                rel = pf.relative_to(REPO_ROOT)
-                todos.append(f"  {str(rel)}:{line_num}  {line.strip()}")
+    todos = [t for _, file_todos in results for t in file_todos]
     if todos:
         print(f"  {yellow('[WARN]')} {len(todos)} TODO/FIXME found:")
         for t in todos[:10]:
@@ -606,6 +708,21 @@ def cmd_validate(args):
     sys.exit(1 if fail_count > 0 else 0)
 
 
+def _addon_files(root, prefix="terrain40k"):
+    """(path, arcname) for every packaged file under root; skips whole
+    __pycache__ trees and stray .pyc files."""
+    files = []
+    with os.scandir(root) as it:
+        for entry in it:
+            arcname = f"{prefix}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    files.extend(_addon_files(entry.path, arcname))
+            elif not entry.name.endswith(".pyc"):
+                files.append((entry.path, arcname))
+    return files
+
+
 def cmd_build(args):
     version = get_bl_info_version() or "unknown"
     if args.out:
@@ -613,16 +730,12 @@ def cmd_build(args):
     else:
         out_path = REPO_ROOT / f"terrain40k-v{version}.zip"
 
-    file_count = 0
-    with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for src in sorted(ADDON_DIR.rglob("*")):
-            if src.is_dir():
-                continue
-            if "__pycache__" in src.parts or src.suffix == ".pyc":
-                continue
-            arcname = str(Path("terrain40k") / src.relative_to(ADDON_DIR))
+    files = sorted(_addon_files(ADDON_DIR), key=lambda f: f[1])
+    with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=6) as zf:
+        for src, arcname in files:
             zf.write(src, arcname)
-            file_count += 1
+    file_count = len(files)
 
     size_kb = out_path.stat().st_size / 1024
     print(green(f"Built: {out_path}"))
@@ -664,6 +777,7 @@ def cmd_milestone(args):
             "--method", "POST",
             "--field", f"title={version}",
         ])
+        drop_status_cache()
         print(green(f"Created milestone: {version}"))
         if isinstance(result, dict) and "html_url" in result:
             print(f"  URL: {result['html_url']}")
@@ -8,9 +8,13 @@ Usage:
 """
 
 import ast
+import functools
+import json
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -18,6 +22,52 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 ADDON_DIR = REPO_ROOT / "addon" / "terrain40k"
 STATE_FILE = REPO_ROOT / "docs" / "PROJECT_STATE.md"
 CHANGELOG_FILE = REPO_ROOT / "CHANGELOG.md"
+SCAN_CACHE = Path(__file__).resolve().parent / ".project_state_cache.json"
+
+# Patterns are compiled once and run over raw file bytes.  RE_GENERATE
+# matches a generator module's entry point, generate_<module>(params, ...);
+# drivers such as generate_walls_batch(params_list) don't count.
+RE_GENERATE = re.compile(rb"def generate_\w+\(params\b")
+RE_BL_VERSION = re.compile(rb"""["']version["']\s*:\s*\(([\d\s,]+)\)""")
+
+# features key -> marker pattern
+FEATURE_MARKERS = {
+    "cleanup_mesh": rb"def cleanup_mesh",
+    "boolean_ops": rb"def boolean_difference",
+    "connectors": rb"def add_connectors",
+    "damage": rb"def apply_damage",
+    "auto_split": rb"def split_for_print",
+    "gothic_arch": rb"(?i:gothic_arch)",
+    "buttress": rb"def create_buttress",
+    "pillar_primitive": rb"def create_pillar",
+}
+# Directories the markers live in; their files are scanned before the rest
+FEATURE_HINT_DIRS = ("generator", "utils")
+
+
+def _feature_alternation(markers):
+    return b"|".join(b"(?P<%s>%s)" % (key.encode(), marker)
+                     for key, marker in markers.items())
+
+
+# All markers in one alternation of named groups — a match's lastgroup is
+# its features key.  The shared "def " prefix is factored out, so the engine
+# tests it once per position instead of once per marker (~4x faster).
+RE_FEATURE = re.compile(
+    b"def (?:%s)|%s" % (
+        _feature_alternation({k: m[4:] for k, m in FEATURE_MARKERS.items()
+                              if m.startswith(b"def ")}),
+        _feature_alternation({k: m for k, m in FEATURE_MARKERS.items()
+                              if not m.startswith(b"def ")}),
+    )
+)
+
+# The three header fields update_state_header rewrites, in one alternation
+RE_STATE_HEADER = re.compile(
+    r"(?P<date>Last updated: \d{4}-\d{2}-\d{2})"
+    r"|(?P<version>Version: [\d.]+)"
+    r"|(?P<tag>`[\d.]+` — )"
+)
 
 
 def get_bl_info_version():
@@ -25,9 +75,24 @@ def get_bl_info_version():
     init_path = ADDON_DIR / "__init__.py"
     if not init_path.exists():
         return None
-    with open(init_path) as f:
-        tree = ast.parse(f.read())
-    for node in ast.walk(tree):
+    # Keyed by mtime: re-parsed only when the file changed
+    return _parse_bl_info_version(str(init_path), init_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_bl_info_version(path, mtime_ns):
+    with open(path, "rb") as f:
+        data = f.read()
+    # The "version": (x, y, z) literal inside bl_info, found without parsing
+    start = data.find(b"bl_info")
+    m = RE_BL_VERSION.search(data, start) if start >= 0 else None
+    if m:
+        parts = [p.strip() for p in m.group(1).split(b",")]
+        return ".".join(p.decode() for p in parts if p)
+    # Unusual layout: fall back to the AST
+    tree = ast.parse(data)
+    # bl_info is a module-level assignment: no need to walk nested bodies
+    for node in tree.body:
         if isinstance(node, ast.Assign):
             for target in node.targets:
                 if isinstance(target, ast.Name) and target.id == "bl_info":
@@ -42,85 +107,196 @@ def get_bl_info_version():
     return None
 
 
-def scan_generators():
-    """Scan generator directory for implemented module files."""
-    gen_dir = ADDON_DIR / "generator"
+def _walk_py(root):
+    """Paths (str) of every .py file under root — os.scandir, explicit stack."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":     # bytecode only
+                        stack.append(entry.path)
+                elif (entry.name.endswith(".py")
+                        and entry.is_file(follow_symlinks=False)):
+                    yield entry.path
+
+
+def _load_scan_cache():
+    """Per-file scan results from the last run, if made with these patterns."""
+    patterns = [RE_GENERATE.pattern.decode(), RE_FEATURE.pattern.decode()]
+    try:
+        with open(SCAN_CACHE, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("patterns") == patterns:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"patterns": patterns, "files": {}}
+
+
+def _scan_file(path):
+    """
+    [has generate_, feature keys] for one file.  The patterns run over an
+    mmap of the file, so its bytes are never copied into a Python object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:      # mmap rejects empty files
+            return [False, []]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            found = {m.lastgroup: True for m in RE_FEATURE.finditer(content)}
+            return [bool(RE_GENERATE.search(content)), list(found)]
+
+
+def _try_scan_file(path):
+    """_scan_file, or None if the file can't be read."""
+    try:
+        return _scan_file(path)
+    except OSError:
+        return None
+
+
+def _scan_workers():
+    """Thread count for file scans: the CPUs this process may run on, max 8."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(8, cpus))
+
+
+def scan_all():
+    """
+    (generators, features) from one walk over the addon: each file is read
+    once and feeds both the generate_ check (generator modules) and the
+    feature-marker scan.  Results are cached per file by (mtime_ns, size)
+    in SCAN_CACHE, so unchanged files are only stat()ed.
+    """
+    gen_dir = os.path.join(str(ADDON_DIR), "generator")
     modules = []
-    if not gen_dir.exists():
-        return modules
-    for py_file in sorted(gen_dir.glob("*.py")):
-        if py_file.name.startswith("_"):
+    features = {}
+    if not ADDON_DIR.exists():
+        return modules, features
+    def is_module(path):
+        directory, fname = os.path.split(path)
+        return directory == gen_dir and not fname.startswith("_")
+
+    cache = _load_scan_cache()
+    cached = cache["files"]
+    files = {}
+    stale = {}
+    found = set()
+    for py_file in _walk_py(ADDON_DIR):
+        try:
+            st = os.stat(py_file)
+        except OSError:
             continue
-        name = py_file.stem
-        # Check if it has a generate_ function
-        with open(py_file) as f:
-            content = f.read()
-        if re.search(r"def generate_", content):
-            modules.append(name)
-    return modules
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cached.get(py_file)
+        if entry is None or entry[:2] != stamp:
+            stale[py_file] = stamp
+            entry = None
+        else:
+            found.update(entry[3])
+        files[py_file] = entry
+
+    # Changed files are scanned in parallel — mostly syscalls and C regex —
+    # in waves: generator modules first (they must be scanned anyway), then
+    # the FEATURE_HINT_DIRS.  Once every marker is found, the remaining
+    # non-module files are skipped.
+    order = sorted(stale, key=lambda path: (
+        not is_module(path),
+        os.path.basename(os.path.dirname(path)) not in FEATURE_HINT_DIRS,
+    ))
+    if order:
+        workers = _scan_workers()
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for i in range(0, len(order), workers):
+                wave = order[i:i + workers]
+                if len(found) == len(FEATURE_MARKERS):
+                    wave = [path for path in wave if is_module(path)]
+                    if not wave:
+                        break
+                for py_file, result in zip(wave, ex.map(_try_scan_file, wave)):
+                    if result is not None:
+                        files[py_file] = stale[py_file] + result
+                        found.update(result[1])
+    # Unreadable and skipped files keep no entry
+    files = {path: entry for path, entry in files.items() if entry is not None}
+
+    for py_file, entry in files.items():
+        # Generator module if it has a generate_ function
+        if is_module(py_file) and entry[2]:
+            modules.append(os.path.basename(py_file)[:-3])
+        features.update(dict.fromkeys(entry[3], True))
+
+    if files != cached:
+        cache["files"] = files
+        try:
+            with open(SCAN_CACHE, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    modules.sort()
+    return modules, features
+
+
+def scan_generators():
+    """Scan generator directory for implemented module files."""
+    return scan_all()[0]
 
 
 def scan_features():
     """Scan codebase for feature markers."""
-    features = {}
-    for py_file in ADDON_DIR.rglob("*.py"):
-        with open(py_file) as f:
-            try:
-                content = f.read()
-            except Exception:
-                continue
-        # Check for key features
-        if "def cleanup_mesh" in content:
-            features["cleanup_mesh"] = True
-        if "def boolean_difference" in content:
-            features["boolean_ops"] = True
-        if "def add_connectors" in content:
-            features["connectors"] = True
-        if "def apply_damage" in content:
-            features["damage"] = True
-        if "def split_for_print" in content:
-            features["auto_split"] = True
-        if "gothic_arch" in content.lower():
-            features["gothic_arch"] = True
-        if "def create_buttress" in content:
-            features["buttress"] = True
-        if "def create_pillar" in content:
-            features["pillar_primitive"] = True
-    return features
+    return scan_all()[1]
 
 
 def get_last_changelog_entries(count=3):
     """Extract last N version entries from CHANGELOG.md."""
     if not CHANGELOG_FILE.exists():
         return ""
-    with open(CHANGELOG_FILE) as f:
-        content = f.read()
-    # Split by version headers
-    sections = re.split(r"\n(?=## )", content)
-    entries = [s.strip() for s in sections if s.strip().startswith("## [")]
-    return "\n\n".join(entries[:count])
+    st = CHANGELOG_FILE.stat()
+    # Keyed by (mtime, size): re-read only when the changelog changed
+    return _read_changelog_entries(
+        str(CHANGELOG_FILE), st.st_mtime_ns, st.st_size, count
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _read_changelog_entries(path, mtime_ns, size, count):
+    # Stream line by line and stop once `count` entries are complete —
+    # older versions are never read; only the kept entries are decoded
+    entries = []
+    section = None      # lines of the "## [" entry being collected
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"## "):
+                if section is not None:
+                    entries.append(b"".join(section).strip())
+                    if len(entries) == count:
+                        break
+                section = [line] if line.startswith(b"## [") else None
+            elif section is not None:
+                section.append(line)
+        else:
+            if section is not None:
+                entries.append(b"".join(section).strip())
+    return b"\n\n".join(entries[:count]).decode("utf-8", errors="replace")
 
 
 def update_state_header(content, version):
-    """Update the version and date in the state file header."""
+    """
+    Update the version and date in the state file header.
+    All three fields are rewritten in one RE_STATE_HEADER pass.
+    """
     today = date.today().isoformat()
-    content = re.sub(
-        r"Last updated: \d{4}-\d{2}-\d{2}",
-        f"Last updated: {today}",
-        content,
-    )
+    new = {"date": f"Last updated: {today}"}
     if version:
-        content = re.sub(
-            r"Version: [\d.]+",
-            f"Version: {version}",
-            content,
-        )
-        content = re.sub(
-            r"`[\d.]+` — ",
-            f"`{version}` — ",
-            content,
-        )
-    return content
+        new["version"] = f"Version: {version}"
+        new["tag"] = f"`{version}` — "
+    # One scan rewrites all three fields; version fields stay without a version
+    return RE_STATE_HEADER.sub(
+        lambda m: new.get(m.lastgroup, m.group()), content
+    )
 
 
 def main():
@@ -134,16 +310,12 @@ def main():
         current_content = f.read()
 
     version = get_bl_info_version()
-    generators = scan_generators()
-    features = scan_features()
-
     print(f"Version from bl_info: {version}")
-    print(f"Generator modules found: {generators}")
-    print(f"Features detected: {list(features.keys())}")
 
     # Build updated content
     updated = update_state_header(current_content, version)
 
+    # Only the header is compared — the file scans don't feed it
     if check_only:
         if updated != current_content:
             print("PROJECT_STATE.md is outdated (header mismatch).")
@@ -151,6 +323,14 @@ def main():
         print("PROJECT_STATE.md appears current.")
         sys.exit(0)
 
+    generators, features = scan_all()
+    print(f"Generator modules found: {generators}")
+    print(f"Features detected: {list(features.keys())}")
+
+    # Unchanged content is not rewritten, so the file's mtime stays put
+    if updated == current_content:
+        print(f"Already current: {STATE_FILE}")
+        return
     with open(STATE_FILE, "w") as f:
         f.write(updated)
     print(f"Updated {STATE_FILE}")